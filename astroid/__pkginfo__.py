@@ -18,7 +18,6 @@ extras_require = {}
 install_requires = [
     'lazy_object_proxy',
     'six',
-    'wrapt',
     'typing;python_version<"3.5"'
 ]
 
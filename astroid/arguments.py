@@ -193,7 +193,7 @@ class CallSite(object):
                     # `cls.metaclass_method`. In this case, the
                     # first argument is always the class.
                     method_scope = funcnode.parent.scope()
-                    if method_scope is boundnode.metaclass():
+                    if method_scope is boundnode.metaclass(context=context):
                         return iter((boundnode, ))
 
                 if funcnode.type == 'method':
@@ -248,10 +248,9 @@ class CallSite(object):
             return iter((args, ))
 
         # Check if it's a default parameter.
-        try:
-            return funcnode.args.default_value(name).infer(context)
-        except exceptions.NoDefault:
-            pass
+        default = funcnode.args._default_value(name)
+        if default.__class__ is not exceptions._Failure:
+            return default.infer(context)
         raise exceptions.InferenceError('No value found for argument {name} to '
                                         '{func!r}', call_site=self,
                                         func=funcnode, arg=name, context=context)
@@ -70,12 +70,26 @@ class Proxy(object):
             return self.__dict__[name]
         return getattr(self._proxied, name)
 
+    # Needed for pickling, otherwise the lookup of these methods
+    # is proxied, even before the state of the proxy is restored.
+    def __getstate__(self):
+        return self.__dict__
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
     def infer(self, context=None):
         yield self
 
+    _infer_or_fail = infer
+
 
-def _infer_stmts(stmts, context, frame=None):
-    """Return an iterator on statements inferred by each statement in *stmts*."""
+def _infer_stmts(stmts, context, frame=None, raise_failures=True):
+    """Return an iterator on statements inferred by each statement in *stmts*.
+
+    If nothing can be inferred, an InferenceError is raised, or given
+    back as a failure if *raise_failures* is false.
+    """
     stmt = None
     inferred = False
     if context is not None:
@@ -92,8 +106,12 @@ def _infer_stmts(stmts, context, frame=None):
             continue
         context.lookupname = stmt._infer_name(frame, name)
         try:
-            for inferred in stmt.infer(context=context):
-                yield inferred
+            for value in stmt._infer_or_fail(context=context):
+                if value.__class__ is exceptions._Failure:
+                    if issubclass(value.error_class, exceptions.NameInferenceError):
+                        break
+                    value = util.Uninferable
+                yield value
                 inferred = True
         except exceptions.NameInferenceError:
             continue
@@ -101,9 +119,13 @@ def _infer_stmts(stmts, context, frame=None):
             yield util.Uninferable
             inferred = True
     if not inferred:
-        raise exceptions.InferenceError(
-            'Inference failed for all members of {stmts!r}.',
+        failure = exceptions._Failure(
+            exceptions.InferenceError,
+            message='Inference failed for all members of {stmts!r}.',
             stmts=stmts, frame=frame, context=context)
+        if raise_failures:
+            raise failure.error()
+        yield failure
 
 
 def _infer_method_result_truth(instance, method_name, context):
@@ -131,54 +153,62 @@ class BaseInstance(Proxy):
         return 'Instance of'
 
     def getattr(self, name, context=None, lookupclass=True):
-        try:
-            values = self._proxied.instance_attr(name, context)
-        except exceptions.AttributeInferenceError:
+        values = self._getattr(name, context, lookupclass)
+        if values.__class__ is exceptions._Failure:
+            raise values.error()
+        return values
+
+    def _getattr(self, name, context=None, lookupclass=True):
+        """Like :meth:`getattr`, but give back a failure instead of raising."""
+        values = self._proxied._instance_attr(name, context)
+        if values.__class__ is exceptions._Failure:
             if self.special_attributes and name in self.special_attributes:
                 return [self.special_attributes.lookup(name)]
 
             if lookupclass:
                 # Class attributes not available through the instance
                 # unless they are explicitly defined.
-                return self._proxied.getattr(name, context,
-                                             class_context=False)
+                return self._proxied._getattr(name, context,
+                                              class_context=False)
 
-            util.reraise(exceptions.AttributeInferenceError(target=self,
-                                                            attribute=name,
-                                                            context=context))
+            return exceptions._Failure(exceptions.AttributeInferenceError,
+                                       target=self, attribute=name,
+                                       context=context)
         # since we've no context information, return matching class members as
         # well
         if lookupclass:
-            try:
-                return values + self._proxied.getattr(name, context,
-                                                      class_context=False)
-            except exceptions.AttributeInferenceError:
-                pass
+            class_values = self._proxied._getattr(name, context,
+                                                  class_context=False)
+            if class_values.__class__ is not exceptions._Failure:
+                return values + class_values
         return values
 
     def igetattr(self, name, context=None):
         """inferred getattr"""
         if not context:
             context = contextmod.InferenceContext()
-        try:
-            # avoid recursively inferring the same attr on the same class
-            if context.push((self._proxied, name)):
-                return
+        # avoid recursively inferring the same attr on the same class
+        if context.push((self._proxied, name)):
+            return
 
+        try:
             # XXX frame should be self._proxied, or not ?
-            get_attr = self.getattr(name, context, lookupclass=False)
-            for stmt in _infer_stmts(self._wrap_attr(get_attr, context),
-                                     context, frame=self):
-                yield stmt
-        except exceptions.AttributeInferenceError:
-            try:
-                # fallback to class.igetattr since it has some logic to handle
-                # descriptors
-                attrs = self._proxied.igetattr(name, context, class_context=False)
-                for stmt in self._wrap_attr(attrs, context):
+            get_attr = self._getattr(name, context, lookupclass=False)
+            if get_attr.__class__ is not exceptions._Failure:
+                for stmt in _infer_stmts(self._wrap_attr(get_attr, context),
+                                         context, frame=self):
                     yield stmt
-            except exceptions.AttributeInferenceError as error:
-                util.reraise(exceptions.InferenceError(**vars(error)))
+                return
+        except exceptions.AttributeInferenceError:
+            pass
+        try:
+            # fallback to class.igetattr since it has some logic to handle
+            # descriptors
+            attrs = self._proxied.igetattr(name, context, class_context=False)
+            for stmt in self._wrap_attr(attrs, context):
+                yield stmt
+        except exceptions.AttributeInferenceError as error:
+            util.reraise(exceptions.InferenceError(**vars(error)))
 
     def _wrap_attr(self, attrs, context=None):
         """wrap bound methods of attrs in a InstanceMethod proxies"""
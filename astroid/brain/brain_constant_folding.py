@@ -0,0 +1,146 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/PyCQA/astroid/blob/master/COPYING.LESSER
+
+"""Fold the operations between literals, when the manager is asked to
+
+The values of the binary, unary and boolean operations whose operands
+are literals, such as ``60 * 60 * 24`` or ``'a' + 'b'``, are computed
+once when the module is built, and are then given back by an inference
+tip instead of going through the operator protocols.
+"""
+
+import operator
+
+import astroid
+from astroid import node_classes
+from astroid import nodes
+from astroid import protocols
+
+
+# Larger values are not folded, nor computed.
+MAX_LENGTH = 4096
+MAX_BITS = 4096
+
+_UNARY_OPERATORS = {
+    '+': operator.pos,
+    '-': operator.neg,
+    '~': operator.invert,
+    'not': operator.not_,
+}
+_SEQUENCES = (str, bytes, tuple, list)
+
+
+class _NotFoldable(Exception):
+    pass
+
+
+def _check_size(value):
+    if isinstance(value, _SEQUENCES):
+        if len(value) > MAX_LENGTH:
+            raise _NotFoldable
+    elif isinstance(value, int):
+        if value.bit_length() > MAX_BITS:
+            raise _NotFoldable
+    return value
+
+
+def _check_binary_operation(op, left, right):
+    """Refuse the operations whose result would be too large to compute"""
+    if op == '*':
+        if isinstance(left, int) and isinstance(right, _SEQUENCES):
+            left, right = right, left
+        if isinstance(left, _SEQUENCES) and isinstance(right, int):
+            if len(left) * right > MAX_LENGTH:
+                raise _NotFoldable
+        elif isinstance(left, int) and isinstance(right, int):
+            if left.bit_length() + right.bit_length() > MAX_BITS:
+                raise _NotFoldable
+    elif op == '**':
+        if isinstance(left, int) and isinstance(right, int) and right > 0:
+            if left.bit_length() * right > MAX_BITS:
+                raise _NotFoldable
+    elif op == '<<':
+        if isinstance(left, int) and isinstance(right, int):
+            if left.bit_length() + right > MAX_BITS:
+                raise _NotFoldable
+    elif op == '%' and isinstance(left, (str, bytes)):
+        # String formatting is not inferred either.
+        raise _NotFoldable
+
+
+def _fold(node):
+    """Compute the value of a literal expression
+
+    :raises _NotFoldable: if the expression is not made of literals,
+        or its value can't be computed or is too large.
+    """
+    if isinstance(node, nodes.Const):
+        return node.value
+    if isinstance(node, (nodes.Tuple, nodes.List)):
+        values = [_fold(elt) for elt in node.elts]
+        if any(isinstance(value, (tuple, list)) for value in values):
+            # Only the sequences of scalars are folded.
+            raise _NotFoldable
+        return _check_size(tuple(values) if isinstance(node, nodes.Tuple) else values)
+    folded = node.__dict__.get('_folded')
+    if folded is not None:
+        return _fold(folded)
+
+    try:
+        if isinstance(node, nodes.BinOp):
+            left, right = _fold(node.left), _fold(node.right)
+            _check_binary_operation(node.op, left, right)
+            value = protocols.BIN_OP_IMPL[node.op](left, right)
+        elif isinstance(node, nodes.UnaryOp):
+            value = _UNARY_OPERATORS[node.op](_fold(node.operand))
+        elif isinstance(node, nodes.BoolOp):
+            for operand in node.values:
+                value = _fold(operand)
+                if bool(value) == (node.op == 'or'):
+                    break
+        else:
+            raise _NotFoldable
+    except (ArithmeticError, KeyError, TypeError, ValueError):
+        raise _NotFoldable
+    if value.__class__ not in node_classes.CONST_CLS:
+        raise _NotFoldable
+    return _check_size(value)
+
+
+def _folded_node(node):
+    """Get a node for the value of a literal expression, cached in the expression"""
+    folded = node.__dict__.get('_folded')
+    if folded is None:
+        value = _fold(node)
+        if isinstance(value, (tuple, list)):
+            folded = (nodes.Tuple if isinstance(value, tuple) else nodes.List)(parent=node)
+            folded.postinit([nodes.const_factory(elt) for elt in value])
+            for elt in folded.elts:
+                elt.parent = folded
+        else:
+            folded = nodes.const_factory(value)
+        node._folded = folded
+    return folded
+
+
+def _is_foldable(node):
+    if not astroid.MANAGER.fold_constants:
+        return False
+    try:
+        _folded_node(node)
+    except _NotFoldable:
+        return False
+    return True
+
+
+def infer_folded(node, context=None):
+    """Infer an operation between literals as its folded value"""
+    try:
+        return iter((_folded_node(node),))
+    except _NotFoldable:
+        raise astroid.UseInferenceDefault
+
+
+for _node_class in (nodes.BinOp, nodes.UnaryOp, nodes.BoolOp):
+    astroid.MANAGER.register_transform(
+        _node_class, astroid.inference_tip(infer_folded), _is_foldable)
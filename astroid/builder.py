@@ -12,11 +12,15 @@ The builder is not thread safe and can't be used to parse different sources
 at the same time.
 """
 
+import bisect
+import io
+import operator
 import re
 import os
 import sys
 import textwrap
 import _ast
+import ast
 
 from astroid import bases
 from astroid import exceptions
@@ -24,6 +28,7 @@ from astroid import manager
 from astroid import modutils
 from astroid import raw_building
 from astroid import rebuilder
+from astroid import node_classes
 from astroid import nodes
 from astroid import util
 
@@ -41,6 +46,217 @@ def _parse(string):
     return compile(string, "<string>", 'exec', _ast.PyCF_ONLY_AST)
 
 
+_INTERFACE_FIELDS = ('body', 'orelse', 'handlers', 'finalbody')
+_CACHED_LINE_NUMBERS = ('fromlineno', 'tolineno', 'blockstart_tolineno')
+_FUNCTION_DEFS = (_ast.FunctionDef,)
+if sys.version_info >= (3, 5):
+    _FUNCTION_DEFS += (_ast.AsyncFunctionDef,)
+
+
+def _strip_function_bodies(statements):
+    for statement in statements:
+        if isinstance(statement, _FUNCTION_DEFS):
+            body = statement.body
+            stub = ast.copy_location(_ast.Pass(), body[0])
+            if (isinstance(body[0], _ast.Expr)
+                    and isinstance(body[0].value, _ast.Str)):
+                statement.body = [body[0], stub]
+            else:
+                statement.body = [stub]
+            continue
+        for field in _INTERFACE_FIELDS:
+            _strip_function_bodies(getattr(statement, field, ()))
+
+
+def parse_interface(string):
+    """Parse only the interface of the given source code
+
+    This parser can be given to an :class:`AstroidBuilder`. The bodies
+    of the functions are replaced by their docstring and a ``pass``,
+    so that only the module and class bodies and the signatures of the
+    functions are rebuilt. What the functions return and the
+    attributes they assign are lost.
+    """
+    tree = _parse(string)
+    _strip_function_bodies(tree.body)
+    return tree
+
+
+_UNKNOWN = object()
+_COMPARISONS = {
+    _ast.Eq: operator.eq,
+    _ast.NotEq: operator.ne,
+    _ast.Lt: operator.lt,
+    _ast.LtE: operator.le,
+    _ast.Gt: operator.gt,
+    _ast.GtE: operator.ge,
+    _ast.In: lambda left, right: left in right,
+    _ast.NotIn: lambda left, right: left not in right,
+}
+
+
+def _is_attribute(node, module, name):
+    return (isinstance(node, _ast.Attribute) and node.attr == name
+            and isinstance(node.value, _ast.Name) and node.value.id == module)
+
+
+def _is_target_value(node):
+    """Check if the given node is a value known for the target"""
+    return (_is_attribute(node, 'sys', 'version_info')
+            or _is_attribute(node, 'sys', 'platform')
+            or _is_attribute(node, 'six', 'PY2')
+            or _is_attribute(node, 'six', 'PY3'))
+
+
+class _TargetGuards(object):
+    """Evaluate the guards of if statements for a target interpreter
+
+    The guards are made of ``sys.version_info``, ``sys.platform``,
+    ``six.PY2`` and ``six.PY3``, along with the literals they are compared
+    to. The guards made of literals only, such as ``if 0:``, are left as is.
+    """
+
+    def __init__(self, version_info=None, platform=None):
+        self._version_info = tuple(version_info) if version_info is not None else None
+        self._platform = platform
+
+    def evaluate(self, node):
+        """Get whether the given guard holds, or None if it is unknown"""
+        if not any(_is_target_value(child) for child in ast.walk(node)):
+            return None
+        return self._evaluate(node)
+
+    def _evaluate(self, node):
+        if isinstance(node, _ast.BoolOp):
+            values = [self._evaluate(value) for value in node.values]
+            decisive = isinstance(node.op, _ast.Or)
+            if decisive in values:
+                return decisive
+            return None if None in values else not decisive
+        if isinstance(node, _ast.UnaryOp) and isinstance(node.op, _ast.Not):
+            value = self._evaluate(node.operand)
+            return None if value is None else not value
+        value = self._value(node)
+        return None if value is _UNKNOWN else bool(value)
+
+    def _value(self, node):
+        # pylint: disable=too-many-return-statements
+        version_info = self._version_info
+        if _is_attribute(node, 'sys', 'version_info'):
+            return _UNKNOWN if version_info is None else version_info
+        if _is_attribute(node, 'sys', 'platform'):
+            return _UNKNOWN if self._platform is None else self._platform
+        if _is_attribute(node, 'six', 'PY2') or _is_attribute(node, 'six', 'PY3'):
+            if version_info is None:
+                return _UNKNOWN
+            return version_info[0] == int(node.attr[-1])
+        if isinstance(node, _ast.Attribute) and node.attr in ('major', 'minor'):
+            value = self._value(node.value)
+            if value is _UNKNOWN or value is not version_info:
+                return _UNKNOWN
+            return value[('major', 'minor').index(node.attr)]
+        if isinstance(node, _ast.Subscript):
+            return self._subscript(node)
+        if isinstance(node, _ast.Compare):
+            left = self._value(node.left)
+            for comparison, right in zip(node.ops, node.comparators):
+                right = self._value(right)
+                if (left is _UNKNOWN or right is _UNKNOWN
+                        or type(comparison) not in _COMPARISONS):
+                    return _UNKNOWN
+                try:
+                    if not _COMPARISONS[type(comparison)](left, right):
+                        return False
+                except TypeError:
+                    return _UNKNOWN
+                left = right
+            return True
+        if (isinstance(node, _ast.Call) and isinstance(node.func, _ast.Attribute)
+                and node.func.attr == 'startswith' and len(node.args) == 1
+                and not node.keywords):
+            value = self._value(node.func.value)
+            prefix = self._value(node.args[0])
+            if isinstance(value, str) and isinstance(prefix, (str, tuple)):
+                return value.startswith(prefix)
+            return _UNKNOWN
+        try:
+            return ast.literal_eval(node)
+        except (TypeError, ValueError, SyntaxError):
+            return _UNKNOWN
+
+    def _subscript(self, node):
+        value = self._value(node.value)
+        if value is _UNKNOWN or value is not self._version_info:
+            return _UNKNOWN
+        index = node.slice
+        if isinstance(index, _ast.Index):
+            index = self._value(index.value)
+        elif isinstance(index, _ast.Slice):
+            bounds = [None if bound is None else self._value(bound)
+                      for bound in (index.lower, index.upper, index.step)]
+            if _UNKNOWN in bounds:
+                return _UNKNOWN
+            index = slice(*bounds)
+        else:
+            index = self._value(index)
+        try:
+            return value[index]
+        except (IndexError, TypeError):
+            return _UNKNOWN
+
+
+def _is_required_block(statement, field):
+    """Check if the given block of a statement can't be left empty"""
+    if field == 'body':
+        return True
+    # A try statement needs either handlers or a finally block.
+    return field == 'finalbody' and not getattr(statement, 'handlers', None)
+
+
+def _prune_statements(statements, guards):
+    pruned = []
+    for statement in statements:
+        if isinstance(statement, _ast.If):
+            taken = guards.evaluate(statement.test)
+            if taken is not None:
+                branch = statement.body if taken else statement.orelse
+                pruned.extend(_prune_statements(branch, guards))
+                continue
+        for field in _INTERFACE_FIELDS:
+            children = getattr(statement, field, None)
+            if children:
+                pruned_children = _prune_statements(children, guards)
+                if not pruned_children and _is_required_block(statement, field):
+                    pruned_children = [ast.copy_location(_ast.Pass(), children[0])]
+                setattr(statement, field, pruned_children)
+        pruned.append(statement)
+    return pruned
+
+
+def target_parser(version_info=None, platform=None, parser=None):
+    """Get a parser building the modules for a target interpreter
+
+    The parser can be given to an :class:`AstroidBuilder`. The if
+    statements testing ``sys.version_info``, ``sys.platform``, ``six.PY2``
+    or ``six.PY3`` are replaced by the branch taken on the target, so that
+    the other ones are neither built nor inferred.
+
+    :param version_info: The version of the target, such as ``(3, 6, 4)``,
+        or None to keep the branches depending on the version.
+    :param platform: The ``sys.platform`` of the target, or None to keep
+        the branches depending on the platform.
+    :param parser: The parser giving the tree to prune.
+    """
+    guards = _TargetGuards(version_info, platform)
+    parser = parser or _parse
+
+    def parse_for_target(string):
+        tree = parser(string)
+        tree.body = _prune_statements(tree.body, guards)
+        return tree
+    return parse_for_target
+
+
 if sys.version_info >= (3, 0):
     from tokenize import detect_encoding
 
@@ -51,6 +267,20 @@ if sys.version_info >= (3, 0):
         data = stream.read()
         return stream, encoding, data
 
+    def read_source_file(filename):
+        """Read a source file with a single read of its bytes.
+
+        :returns: the bytes of the file, its encoding and its text,
+            with universal newlines
+        """
+        with open(filename, 'rb') as byte_stream:
+            source = byte_stream.read()
+        encoding = detect_encoding(io.BytesIO(source).readline)[0]
+        data = source.decode(encoding)
+        if '\r' in data:
+            data = data.replace('\r\n', '\n').replace('\r', '\n')
+        return source, encoding, data
+
 else:
     _ENCODING_RGX = re.compile(r"\s*#+.*coding[:=]\s*([-\w.]+)")
 
@@ -73,6 +303,13 @@ else:
         encoding = _guess_encoding(data)
         return stream, encoding, data
 
+    def read_source_file(filename):
+        """get the bytes, the encoding and the data of a file"""
+        with open(filename, 'rb') as stream:
+            source = stream.read()
+        data = source.replace('\r\n', '\n').replace('\r', '\n')
+        return source, _guess_encoding(data), data
+
 
 MANAGER = manager.AstroidManager()
 
@@ -88,6 +325,108 @@ def _can_assign_attr(node, attrname):
     return True
 
 
+def _insert_local(node, name):
+    """Store the given node in the locals of its scope, keeping them
+    ordered by line number
+    """
+    _insert_ordered(node.parent.scope().locals.setdefault(name, []), node)
+
+
+def _insert_ordered(values, node):
+    lineno = node.fromlineno
+    index = len(values)
+    while index and values[index - 1].fromlineno > lineno:
+        index -= 1
+    values.insert(index, node)
+
+
+def _instance_assattr_class(node):
+    """Get the class whose instance is assigned by the given AssignAttr
+
+    Only the assignments made on ``self`` from a method are considered,
+    as in ``self.attr = value``. None is returned for any other kind
+    of attribute assignment.
+    """
+    if not isinstance(node.expr, nodes.Name) or node.expr.name != 'self':
+        return None
+    frame = node.frame()
+    if not isinstance(frame, nodes.FunctionDef):
+        return None
+    klass = frame.parent
+    if not isinstance(klass, nodes.ClassDef):
+        return None
+    if not frame.args.args or frame.args.args[0].name != 'self':
+        return None
+    return klass
+
+
+def _statement_start(statement):
+    """Get the first line of a statement, including its decorators"""
+    lineno = statement.lineno
+    decorators = getattr(statement, 'decorators', None)
+    if lineno is not None and decorators is not None:
+        lineno = min([lineno] + [decorator.lineno for decorator in decorators.nodes])
+    return lineno
+
+
+def _changed_statements(statements, body_line, line_count, last_same, first_same):
+    """Find the statements of a body changed by an edit of their source
+
+    :param statements: The statements of the body.
+    :param int body_line: The first line of the body.
+    :param int line_count: The last line of the body.
+    :param int last_same: The last unchanged line before the edit.
+    :param int first_same: The first unchanged line after the edit.
+    :returns: The index of the first changed statement and the one
+        following the last, along with the first and the last line of
+        their source. The statements sharing a line with the edit are
+        changed too, since the edit can continue or start them.
+    """
+    starts = [_statement_start(statement) for statement in statements]
+    if None in starts:
+        return 0, len(statements), body_line, line_count
+    first = max(bisect.bisect_right(starts, last_same) - 1, 0)
+    first = bisect.bisect_left(starts, starts[first]) if starts else 0
+    # The first line of a statement starting with a string spanning
+    # several lines is unknown, it is somewhere in the previous statement.
+    while first and statements[first].col_offset < 0:
+        first = bisect.bisect_left(starts, starts[first - 1])
+    last = bisect.bisect_right(starts, first_same)
+    while last < len(statements) and statements[last].col_offset < 0:
+        last = bisect.bisect_right(starts, starts[last])
+    first_line = starts[first] if first else body_line
+    last_line = starts[last] - 1 if last < len(statements) else line_count
+    return first, last, first_line, last_line
+
+
+def _top_statement(node, module):
+    while node.parent is not None and node.parent is not module:
+        node = node.parent
+    return node
+
+
+def _shift_lines(statement, delta):
+    stack = [statement]
+    while stack:
+        node = stack.pop()
+        stack.extend(node.get_children())
+        if node.lineno is not None:
+            node.lineno += delta
+        # The line numbers computed from the ones of the children
+        # are cached in the instance.
+        for name in _CACHED_LINE_NUMBERS:
+            if node.__dict__.get(name) is not None:
+                node.__dict__[name] += delta
+
+
+def _discard_from(mapping, name, node):
+    values = mapping.get(name)
+    if values and node in values:
+        values.remove(node)
+        if not values:
+            del mapping[name]
+
+
 class AstroidBuilder(raw_building.InspectBuilder):
     """Class for building an astroid tree from source code or from a live module.
 
@@ -95,13 +434,17 @@ class AstroidBuilder(raw_building.InspectBuilder):
     If no manager is given, then the default one will be used. The
     param *apply_transforms* determines if the transforms should be
     applied after the tree was built from source or from a live object,
-    by default being True.
+    by default being True. The param *parser* is the callable turning
+    source code into the _ast tree given to the rebuilder, such as
+    :func:`parse_interface`. By default the code is compiled by the
+    running interpreter.
     """
     # pylint: disable=redefined-outer-name
-    def __init__(self, manager=None, apply_transforms=True):
+    def __init__(self, manager=None, apply_transforms=True, parser=None):
         super(AstroidBuilder, self).__init__()
         self._manager = manager or MANAGER
         self._apply_transforms = apply_transforms
+        self._parser = parser or _parse
 
     def module_build(self, module, modname=None):
         """Build an astroid from a living module instance."""
@@ -127,7 +470,7 @@ class AstroidBuilder(raw_building.InspectBuilder):
         *path* is expected to be a python source file
         """
         try:
-            stream, encoding, data = open_source_file(path)
+            source, encoding, data = read_source_file(path)
         except IOError as exc:
             util.reraise(exceptions.AstroidBuildingError(
                 'Unable to load file {path}:\n{error}',
@@ -141,16 +484,17 @@ class AstroidBuilder(raw_building.InspectBuilder):
             util.reraise(exceptions.AstroidBuildingError(
                 'Wrong or no encoding specified for {filename}.',
                 filename=path))
-        with stream:
-            # get module name if necessary
-            if modname is None:
-                try:
-                    modname = '.'.join(modutils.modpath_from_file(path))
-                except ImportError:
-                    modname = os.path.splitext(os.path.basename(path))[0]
-            # build astroid representation
-            module = self._data_build(data, modname, path)
-            return self._post_build(module, encoding)
+        # get module name if necessary
+        if modname is None:
+            try:
+                modname = '.'.join(modutils.modpath_from_file(path))
+            except ImportError:
+                modname = os.path.splitext(os.path.basename(path))[0]
+        # build astroid representation
+        module = self._data_build(data, modname, path)
+        # keep the source, so that the file is not read again
+        module.file_bytes = source
+        return self._post_build(module, encoding)
 
     def string_build(self, data, modname='', path=None):
         """Build astroid from source code string."""
@@ -158,6 +502,212 @@ class AstroidBuilder(raw_building.InspectBuilder):
         module.file_bytes = data.encode('utf-8')
         return self._post_build(module, 'utf-8')
 
+    def update(self, module, data):
+        """Update a module built from source to the given new source
+
+        Only the statements spanning the changed lines are rebuilt, in
+        the module or in the innermost class whose header did not change.
+        The nodes of the other statements are kept, with the values
+        they cached, and their line numbers are shifted if needed.
+        The kept values are not recomputed, even when they were
+        computed from the statements which changed, but the tables
+        of :meth:`Module.tabulate_names` are dropped.
+
+        :param module: The module to update, changed in place.
+        :type module: Module
+        :param str data: The new source of the module.
+        :returns: The updated module.
+        :rtype: Module
+        :raises AstroidBuildingError: if the source of the module is unknown.
+        :raises AstroidSyntaxError: if the new source can't be parsed,
+            in which case the module is left untouched.
+        """
+        if module.file_bytes is None:
+            raise exceptions.AstroidBuildingError(
+                'Unable to update {modname}, its source is unknown.',
+                modname=module.name)
+        encoding = module.file_encoding or 'utf-8'
+        old_data = module.file_bytes.decode(encoding)
+        old_lines = old_data.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        data = data.replace('\r\n', '\n').replace('\r', '\n')
+        file_bytes = data.encode(encoding)
+        new_lines = data.split('\n')
+        if new_lines == old_lines:
+            return module
+
+        # Find the lines which did not change at both ends.
+        size = min(len(old_lines), len(new_lines))
+        last_same = 0
+        while last_same < size and old_lines[last_same] == new_lines[last_same]:
+            last_same += 1
+        same_end = 0
+        while (same_end < size - last_same
+               and old_lines[-same_end - 1] == new_lines[-same_end - 1]):
+            same_end += 1
+        scope, first, last, tree = self._parse_changes(
+            module, old_lines, new_lines, last_same, len(old_lines) - same_end + 1)
+        if scope is module and not first:
+            tree, module.doc = rebuilder._get_doc(tree, self._manager.lazy_docstrings)
+        removed = scope.body[first:last]
+
+        # Forget what the removed statements stored out of their nodes.
+        removed_statements = set(removed)
+        def is_removed(node):
+            return _top_statement(node, scope) in removed_statements
+        # The kept attribute assignments stored on the removed
+        # statements are stored again on the new ones.
+        restored = []
+        for delayed in module._delayed_assattr:
+            if is_removed(delayed):
+                self._discard_delayed_assattr(delayed)
+            elif any(is_removed(owner) for owner, _ in getattr(delayed, '_stored_in', ())):
+                delayed._stored_in = tuple(stored for stored in delayed._stored_in
+                                           if not is_removed(stored[0]))
+                restored.append(delayed)
+        module._delayed_assattr = [delayed for delayed in module._delayed_assattr
+                                   if not is_removed(delayed)]
+        module._import_from_nodes = [from_node for from_node in module._import_from_nodes
+                                     if not is_removed(from_node)]
+        module._wildcard_import_nodes = [from_node for from_node
+                                         in module._wildcard_import_nodes
+                                         if not is_removed(from_node)]
+        changed_locals = [module._locals]
+        if scope is not module:
+            changed_locals.append(scope.locals)
+        for scope_locals in changed_locals:
+            for name, values in list(scope_locals.items()):
+                values = [value for value in values if not is_removed(value)]
+                if values:
+                    scope_locals[name] = values
+                else:
+                    del scope_locals[name]
+
+        # Move the following statements, in the scope and around it.
+        delta = len(new_lines) - len(old_lines)
+        node, following = scope, scope.body[last:]
+        while True:
+            for name in _CACHED_LINE_NUMBERS:
+                node.__dict__.pop(name, None)
+            if delta:
+                for statement in following:
+                    _shift_lines(statement, delta)
+            if node is module:
+                break
+            body = node.parent.body
+            node, following = node.parent, body[body.index(node) + 1:]
+
+        # Build the new statements in a scope of their own, to get
+        # the names they define, then move them to the changed scope.
+        builder = rebuilder.TreeRebuilder(self._manager)
+        if scope is module:
+            new_scope = nodes.Module(module.name, None, module.file, module.path,
+                                     module.package)
+        else:
+            new_scope = nodes.ClassDef(scope.name, None)
+        cached = self._manager.astroid_cache.get(module.name) is module
+        with node_classes._module_parents(weak=cached):
+            added = [builder.visit(child, new_scope) for child in tree.body]
+            for from_node in builder._import_from_nodes:
+                self.add_from_names_to_locals(from_node)
+            added_statements = set(added)
+            for statement in added:
+                statement.parent = scope
+        if scope is not module:
+            # The methods refer to their class with an implicit local.
+            for statement in added:
+                for function in statement.nodes_of_class(nodes.FunctionDef):
+                    class_locals = function.locals.get('__class__')
+                    if class_locals and class_locals[0] is new_scope:
+                        function.locals['__class__'] = [scope]
+        for name, values in new_scope.locals.items():
+            for value in values:
+                if _top_statement(value, scope) not in added_statements:
+                    # An implicit local of the class
+                    continue
+                # The names declared global in the functions go to the module.
+                if value.parent.frame() is scope:
+                    scope_locals = scope.locals
+                else:
+                    scope_locals = module._locals
+                _insert_ordered(scope_locals.setdefault(name, []), value)
+        scope.body[first:last] = added
+        module.file_bytes = file_bytes
+        module.__dict__.pop('_name_tables', None)
+        module.__dict__.pop('_docstring_spans', None)
+
+        module._import_from_nodes += builder._import_from_nodes
+        module.future_imports = {symbol for from_node in module._import_from_nodes
+                                 if from_node.modname == '__future__'
+                                 for symbol, _ in from_node.names}
+        module._wildcard_import_nodes += [
+            from_node for from_node in builder._import_from_nodes
+            if any(name == '*' for name, _ in from_node.names)]
+        module._delayed_assattr += builder._delayed_assattr
+        self._store_delayed_assattr(sorted(restored + builder._delayed_assattr,
+                                           key=lambda node: (node.lineno, node.col_offset)))
+
+        if self._apply_transforms:
+            # pylint: disable=protected-access; the statements are visited
+            # without the module, whose transforms were already applied.
+            scope.body[first:first + len(added)] = [
+                self._manager._transform._visit(statement) for statement in added]
+        return module
+
+    def _parse_changes(self, module, old_lines, new_lines, last_same, first_same):
+        """Parse the new source of the statements changed by an edit
+
+        The statements are first looked for in the body of the innermost
+        class spanning the edit, then in the enclosing bodies if their
+        source can't be parsed alone, and in the whole module at last.
+
+        :returns: The node whose body changed, the index of the first
+            changed statement and of the one following the last, and
+            the _ast node whose body holds their new version.
+        """
+        levels = []
+        scope, body_line, line_count = module, 1, len(old_lines)
+        while True:
+            first, last, first_line, last_line = _changed_statements(
+                scope.body, body_line, line_count, last_same, first_same)
+            levels.append((scope, first, last, first_line, last_line))
+            if last - first != 1 or not isinstance(scope.body[first], nodes.ClassDef):
+                break
+            klass = scope.body[first]
+            if not klass.body or klass.body[0].col_offset < 0:
+                break
+            body_line = _statement_start(klass.body[0])
+            # The header of the class must not change and must
+            # end before its body.
+            if (body_line is None or body_line - 1 > last_same
+                    or old_lines[body_line - 1][:klass.body[0].col_offset].strip()):
+                break
+            scope, line_count = klass, last_line
+
+        delta = len(new_lines) - len(old_lines)
+        for scope, first, last, first_line, last_line in reversed(levels):
+            source = '\n'.join(new_lines[first_line - 1:last_line + delta])
+            if scope is module:
+                source = '\n' * (first_line - 1) + source
+            else:
+                # Parse the statements in a class of their own,
+                # at their line and column.
+                source = '\n' * (first_line - 2) + 'class _:\n' + source
+            try:
+                tree = self._parser(source + '\n')
+            except (TypeError, ValueError, SyntaxError):
+                continue
+            if scope is module:
+                return scope, first, last, tree
+            # The statements must also be at the column of the
+            # class body, which the class of their own doesn't check.
+            column = scope.body[0].col_offset
+            if (len(tree.body) == 1
+                    and all(statement.col_offset == column
+                            for statement in tree.body[0].body)):
+                return scope, first, last, tree.body[0]
+        tree = self._parse_data('\n'.join(new_lines), module.name, module.file)
+        return module, 0, len(module.body), tree
+
     def _post_build(self, module, encoding):
         """Handles encoding and delayed nodes after a module has been built"""
         module.file_encoding = encoding
@@ -168,23 +718,42 @@ class AstroidBuilder(raw_building.InspectBuilder):
                 for symbol, _ in from_node.names:
                     module.future_imports.add(symbol)
             self.add_from_names_to_locals(from_node)
-        # handle delayed assattr nodes
-        for delayed in module._delayed_assattr:
-            self.delayed_assattr(delayed)
+        # the wildcard imported names are added on the first access
+        # to the locals of the module
+        module._wildcard_import_nodes = [
+            from_node for from_node in module._import_from_nodes
+            if any(name == '*' for name, _ in from_node.names)]
+        self._store_delayed_assattr(module._delayed_assattr)
 
         # Visit the transforms
         if self._apply_transforms:
             module = self._manager.visit_transforms(module)
         return module
 
-    def _data_build(self, data, modname, path):
-        """Build tree node from data and add some informations"""
+    def _store_delayed_assattr(self, delayed_nodes):
+        """Handle delayed assattr nodes
+
+        The ones made on the instance from a method are resolved when
+        their class' instance attributes are first needed.
+        """
+        for delayed in delayed_nodes:
+            klass = _instance_assattr_class(delayed)
+            if klass is not None:
+                klass._delayed_assattr.append(delayed)
+            else:
+                self.delayed_assattr(delayed)
+
+    def _parse_data(self, data, modname, path):
         try:
-            node = _parse(data + '\n')
+            return self._parser(data + '\n')
         except (TypeError, ValueError, SyntaxError) as exc:
             util.reraise(exceptions.AstroidSyntaxError(
                 'Parsing Python code failed:\n{error}',
                 source=data, modname=modname, path=path, error=exc))
+
+    def _data_build(self, data, modname, path):
+        """Build tree node from data and add some informations"""
+        node = self._parse_data(data, modname, path)
         if path is not None:
             node_file = os.path.abspath(path)
         else:
@@ -195,7 +764,11 @@ class AstroidBuilder(raw_building.InspectBuilder):
         else:
             package = path is not None and os.path.splitext(os.path.basename(path))[0] == '__init__'
         builder = rebuilder.TreeRebuilder(self._manager)
-        module = builder.visit_module(node, modname, node_file, package)
+        # Only the modules stored in the cache below are kept alive by it,
+        # the temporary ones, built without a name, keep strong parents.
+        cached = bool(modname) and modname not in self._manager.astroid_cache
+        with node_classes._module_parents(weak=cached):
+            module = builder.visit_module(node, modname, node_file, package)
         module._import_from_nodes = builder._import_from_nodes
         module._delayed_assattr = builder._delayed_assattr
         return module
@@ -203,24 +776,21 @@ class AstroidBuilder(raw_building.InspectBuilder):
     def add_from_names_to_locals(self, node):
         """Store imported names to the locals
 
-        Resort the locals if coming from a delayed node
+        The names imported with a wildcard are not stored here,
+        see :meth:`add_wildcard_names_to_locals`.
         """
-        _key_func = lambda node: node.fromlineno
-        def sort_locals(my_list):
-            my_list.sort(key=_key_func)
-
         for (name, asname) in node.names:
-            if name == '*':
-                try:
-                    imported = node.do_import_module()
-                except exceptions.AstroidBuildingError:
-                    continue
-                for name in imported.public_names():
-                    node.parent.set_local(name, node)
-                    sort_locals(node.parent.scope().locals[name])
-            else:
-                node.parent.set_local(asname or name, node)
-                sort_locals(node.parent.scope().locals[asname or name])
+            if name != '*':
+                _insert_local(node, asname or name)
+
+    def add_wildcard_names_to_locals(self, node):
+        """Store the names imported by a wildcard import to the locals"""
+        try:
+            imported = node.do_import_module()
+        except exceptions.AstroidBuildingError:
+            return
+        for name in imported.public_names():
+            _insert_local(node, name)
 
     def delayed_assattr(self, node):
         """Visit a AssAttr node
@@ -258,9 +828,19 @@ class AstroidBuilder(raw_building.InspectBuilder):
                     values.insert(0, node)
                 else:
                     values.append(node)
+                # remember where the node is stored, see update()
+                node._stored_in = getattr(node, '_stored_in', ()) + ((inferred, iattrs),)
         except exceptions.InferenceError:
             pass
 
+    def _discard_delayed_assattr(self, node):
+        """Remove an AssignAttr node stored by :meth:`delayed_assattr`"""
+        klass = _instance_assattr_class(node)
+        if klass is not None and node in klass._delayed_assattr:
+            klass._delayed_assattr.remove(node)
+        for _, iattrs in getattr(node, '_stored_in', ()):
+            _discard_from(iattrs, node.attrname, node)
+
 
 def build_namespace_package_module(name, path):
     return nodes.Module(name, doc='', path=path, package=True)
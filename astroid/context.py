@@ -7,8 +7,124 @@
 """Various context related utilities, including inference and call contexts."""
 
 import contextlib
-import copy
 import pprint
+import time
+
+from astroid import exceptions
+
+_clock = getattr(time, 'monotonic', time.time)
+
+
+class _InferencePath(object):
+    """The keys of the nodes visited by an inference, shared between clones
+
+    The keys are held in a chain of frames. Only the first frame of a
+    chain can be changed, and only as long as no other context uses it,
+    so that the chain can be shared by the clones of a context instead
+    of being copied. A frame takes in the next ones as soon as it is as
+    large, which keeps the chain short.
+    """
+
+    __slots__ = ('keys', 'parent', 'frozen')
+
+    def __init__(self, keys=(), parent=None):
+        self.keys = set(keys)
+        self.parent = parent
+        self.frozen = False
+
+    def __contains__(self, key):
+        frame = self
+        while frame is not None:
+            if key in frame.keys:
+                return True
+            frame = frame.parent
+        return False
+
+    def __iter__(self):
+        frame = self
+        while frame is not None:
+            for key in frame.keys:
+                yield key
+            frame = frame.parent
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return '{%s}' % ', '.join(repr(key) for key in self)
+
+
+_EMPTY_PATH = _InferencePath()
+_EMPTY_PATH.frozen = True
+
+
+class InferenceBudget(object):
+    """Bound the work done by an inference
+
+    A budget is shared by a context and its clones. Once it is spent,
+    the nodes are inferred as Uninferable.
+    """
+
+    __slots__ = ('max_steps', 'max_results', 'deadline', 'steps')
+
+    def __init__(self, max_steps=None, max_results=None, timeout=None):
+        """
+        :param max_steps: The number of nodes which can be inferred.
+        :type max_steps: int or None
+        :param max_results: The number of values inferred for a node,
+            the next ones are replaced by Uninferable.
+        :type max_results: int or None
+        :param timeout: The number of seconds the inference can take,
+            starting from now.
+        :type timeout: float or None
+        """
+        self.max_steps = max_steps
+        self.max_results = max_results
+        self.deadline = None if timeout is None else _clock() + timeout
+        self.steps = 0
+
+    def spend(self):
+        """Count an inference step
+
+        :returns: True if the budget is spent, False otherwise.
+        :rtype: bool
+        """
+        if self.exhausted():
+            return True
+        self.steps += 1
+        return self.exhausted()
+
+    def exhausted(self):
+        """Check if the budget is spent, without counting a step
+
+        :rtype: bool
+        """
+        if self.max_steps is not None and self.steps > self.max_steps:
+            return True
+        return self.deadline is not None and _clock() > self.deadline
+
+
+class _SharedResults(dict):
+    """The cached results of the inferences of a batch
+
+    The results which were not cut short by the recursion checks or by
+    the budget of an inference are shared with the next inferences.
+    The others are dirty, they are only reused by the inference which
+    computed them, like the results of any inference.
+    """
+
+    __slots__ = ('cuts', 'dirty')
+
+    def __init__(self):
+        super(_SharedResults, self).__init__()
+        self.cuts = 0
+        self.dirty = set()
+
+    def next_inference(self):
+        """Drop the dirty results before starting the next inference"""
+        for key in self.dirty:
+            del self[key]
+        self.dirty.clear()
 
 
 class InferenceContext(object):
@@ -18,14 +134,16 @@ class InferenceContext(object):
     Account for already visited nodes to infinite stop infinite recursion
     """
 
-    __slots__ = ('path', 'lookupname', 'callcontext', 'boundnode', 'inferred')
+    __slots__ = ('path', 'lookupname', 'callcontext', 'boundnode', 'inferred',
+                 'budget')
 
-    def __init__(self, path=None, inferred=None):
-        self.path = path or set()
+    def __init__(self, path=None, inferred=None, budget=None):
+        self.path = _InferencePath(path) if path else _EMPTY_PATH
         """
-        :type: set(tuple(NodeNG, optional(str)))
+        :type: _InferencePath
 
-        Path of visited nodes and their lookupname
+        Path of visited nodes and their lookupname, which supports
+        the ``in`` operator like a set
 
         Currently this key is ``(node, context.lookupname)``
         """
@@ -53,7 +171,7 @@ class InferenceContext(object):
 
         e.g. the bound node of object.__new__(cls) is the object node
         """
-        self.inferred = inferred or {}
+        self.inferred = {} if inferred is None else inferred
         """
         :type: dict(seq, seq)
 
@@ -61,6 +179,12 @@ class InferenceContext(object):
         Currently the key is ``(node, lookupname, callcontext, boundnode)``
         and the value is tuple of the inferred results
         """
+        self.budget = budget
+        """
+        :type: optional[InferenceBudget]
+
+        The limits of the inference, shared with the clones
+        """
 
     def push(self, node):
         """Push node into inference path
@@ -70,11 +194,21 @@ class InferenceContext(object):
 
         Allows one to see if the given node has already
         been looked at for this inference context"""
-        name = self.lookupname
-        if (node, name) in self.path:
+        key = (node, self.lookupname)
+        path = self.path
+        if key in path:
+            self.mark_cut()
             return True
 
-        self.path.add((node, name))
+        # The path shared with other contexts is left as is.
+        if path.frozen:
+            path = self.path = _InferencePath(parent=path if path.keys else path.parent)
+        keys = path.keys
+        keys.add(key)
+        parent = path.parent
+        while parent is not None and len(parent.keys) <= len(keys):
+            keys.update(parent.keys)
+            parent = path.parent = parent.parent
         return False
 
     def clone(self):
@@ -82,28 +216,56 @@ class InferenceContext(object):
 
         For example, each side of a binary operation (BinOp)
         starts with the same context but diverge as each side is inferred
-        so the InferenceContext will need be cloned"""
+        so the InferenceContext will need be cloned
+
+        The path is shared rather than copied, the first push
+        of either context starts a path of its own."""
         # XXX copy lookupname/callcontext ?
-        clone = InferenceContext(copy.copy(self.path), inferred=self.inferred)
+        self.path.frozen = True
+        clone = InferenceContext(inferred=self.inferred, budget=self.budget)
+        clone.path = self.path
         clone.callcontext = self.callcontext
         clone.boundnode = self.boundnode
         return clone
 
-    def cache_generator(self, key, generator):
+    def mark_cut(self):
+        """Note that the results being inferred are cut short
+
+        That is, they depend on the path of this inference or on its
+        budget, and can't be shared with the other inferences of a batch.
+        """
+        inferred = self.inferred
+        if inferred.__class__ is _SharedResults:
+            inferred.cuts += 1
+
+    def cache_generator(self, key, generator, raise_failures=False):
         """Cache result of generator into dictionary
 
-        Used to cache inference results"""
+        Used to cache inference results. A failure is cached like
+        the other results, and raised if *raise_failures* is true."""
+        inferred = self.inferred
+        shared = inferred.__class__ is _SharedResults
+        if shared:
+            cuts = inferred.cuts
         results = []
         for result in generator:
             results.append(result)
+            if raise_failures and result.__class__ is exceptions._Failure:
+                inferred[key] = tuple(results)
+                if shared and inferred.cuts != cuts:
+                    inferred.dirty.add(key)
+                raise result.error()
             yield result
 
-        self.inferred[key] = tuple(results)
+        inferred[key] = tuple(results)
+        if shared and inferred.cuts != cuts:
+            inferred.dirty.add(key)
         return
 
     @contextlib.contextmanager
     def restore_path(self):
-        path = set(self.path)
+        path = self.path
+        path.frozen = True
         yield
         self.path = path
 
@@ -137,3 +299,14 @@ def copy_context(context):
         return context.clone()
 
     return InferenceContext()
+
+
+def budget_context(context):
+    """Get a context for an inference started afresh from the given one
+
+    The new context only shares the budget of the given one, so that
+    the nested inference spends it. None is returned without a budget.
+    """
+    if context is not None and context.budget is not None:
+        return InferenceContext(budget=context.budget)
+    return None
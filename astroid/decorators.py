@@ -8,25 +8,27 @@
 """ A few useful function/method decorators."""
 
 import functools
-
-import wrapt
+import itertools
 
 from astroid import context as contextmod
 from astroid import exceptions
 from astroid import util
 
 
-@wrapt.decorator
-def cached(func, instance, args, kwargs):
+def cached(func):
     """Simple decorator to cache result of method calls without args."""
-    cache = getattr(instance, '__cache', None)
-    if cache is None:
-        instance.__cache = cache = {}
-    try:
-        return cache[func]
-    except KeyError:
-        cache[func] = result = func(*args, **kwargs)
-        return result
+    @functools.wraps(func)
+    def wrapped(instance, *args, **kwargs):
+        cache = getattr(instance, '__cache', None)
+        if cache is None:
+            cache = {}
+            setattr(instance, '__cache', cache)
+        try:
+            return cache[func]
+        except KeyError:
+            cache[func] = result = func(instance, *args, **kwargs)
+            return result
+    return wrapped
 
 
 class cachedproperty(object):
@@ -67,84 +69,130 @@ class cachedproperty(object):
         return val
 
 
-def path_wrapper(func):
-    """return the given infer function wrapped to handle the path
+def _nothing_inferred(if_nothing, info):
+    """Get the value given when nothing was inferred, or raise the error
 
-    Used to stop inference if the node has already been looked
-    at for a given `InferenceContext` to prevent infinite recursion
+    *info* holds the fields of the error, as returned by the inference
+    function.
     """
-    # TODO: switch this to wrapt after the monkey-patching is fixed (ceridwen)
+    if if_nothing == 'uninferable':
+        return util.Uninferable
+    if info is None:
+        info = {'message': 'StopIteration raised without any error information.'}
+    if if_nothing == 'fail':
+        return exceptions._Failure(exceptions.InferenceError, **info)
+    raise exceptions.InferenceError(**info)
+
+
+def inference_wrapper(func=None, path=False, dedupe=True, if_nothing=None,
+                      skip_visited=False):
+    """Wrap an inference function with the checks done around it
+
+    This does at once what stacking path_wrapper and one of the
+    *_if_nothing_inferred decorators does, in a single generator which
+    hands the values over with ``yield from``.
+
+    :param path: The wrapped function takes a node and a context, and
+        nothing is inferred if the node was already visited in the
+        context, which prevents infinite recursion.
+    :param dedupe: With *path*, skip the values already given, the
+        instances being compared by their class.
+    :param if_nothing: What to do if nothing is inferred, in which case
+        the wrapped function returns the fields of an InferenceError:
+        ``'raise'`` raises the error, ``'fail'`` gives back a failure
+        for it and ``'uninferable'`` gives back Uninferable. With
+        ``'raise'``, the error of a failure given back by the wrapped
+        function is raised as well.
+    :param skip_visited: Give back nothing at all for a node already
+        visited, instead of doing what *if_nothing* says.
+    """
+    if func is None:
+        return functools.partial(inference_wrapper, path=path, dedupe=dedupe,
+                                 if_nothing=if_nothing, skip_visited=skip_visited)
+    if if_nothing not in (None, 'raise', 'fail', 'uninferable'):
+        raise ValueError('Unknown if_nothing value: %r' % (if_nothing, ))
+    raise_failures = if_nothing == 'raise'
+
+    if not path:
+        @functools.wraps(func)
+        def wrapped(*args, **kwargs):
+            generator = func(*args, **kwargs)
+            try:
+                value = next(generator)
+            except StopIteration as error:
+                if if_nothing is not None:
+                    yield _nothing_inferred(if_nothing, error.value)
+                return error.value
+            if raise_failures and value.__class__ is exceptions._Failure:
+                raise value.error()
+            yield value
+            return (yield from generator)
+        return wrapped
+
     @functools.wraps(func)
-    def wrapped(node, context=None, _func=func, **kwargs):
+    def wrapped(node, context=None, **kwargs):
         """wrapper function handling context"""
         if context is None:
             context = contextmod.InferenceContext()
         if context.push(node):
+            if if_nothing is not None and not skip_visited:
+                yield _nothing_inferred(if_nothing, None)
             return None
 
-        yielded = set()
-        generator = _func(node, context, **kwargs)
+        generator = func(node, context, **kwargs)
         try:
-            while True:
-                res = next(generator)
-                # unproxy only true instance, not const, tuple, dict...
-                if res.__class__.__name__ == 'Instance':
-                    ares = res._proxied
-                else:
-                    ares = res
-                if ares not in yielded:
-                    yield res
-                    yielded.add(ares)
+            value = next(generator)
         except StopIteration as error:
-            # Explicit StopIteration to return error information, see
-            # comment in raise_if_nothing_inferred.
-            if error.args:
-                return error.args[0]
-            return None
+            if if_nothing is not None:
+                yield _nothing_inferred(if_nothing, error.value)
+            return error.value
+        if raise_failures and value.__class__ is exceptions._Failure:
+            raise value.error()
+        if not dedupe:
+            yield value
+            return (yield from generator)
 
+        yielded = set()
+        for value in itertools.chain((value, ), generator):
+            # unproxy only true instance, not const, tuple, dict...
+            if value.__class__.__name__ == 'Instance':
+                key = value._proxied
+            else:
+                key = value
+            if key not in yielded:
+                yield value
+                yielded.add(key)
+        return None
     return wrapped
 
 
-@wrapt.decorator
-def yes_if_nothing_inferred(func, instance, args, kwargs):
-    inferred = False
-    for node in func(*args, **kwargs):
-        inferred = True
-        yield node
-    if not inferred:
-        yield util.Uninferable
-
-
-@wrapt.decorator
-def raise_if_nothing_inferred(func, instance, args, kwargs):
-    '''All generators wrapped with raise_if_nothing_inferred *must*
-    explicitly raise StopIteration with information to create an
-    appropriate structured InferenceError.
-
-    '''
-    # TODO: Explicitly raising StopIteration in a generator will cause
-    # a RuntimeError in Python >=3.7, as per
-    # http://legacy.python.org/dev/peps/pep-0479/ .  Before 3.7 is
-    # released, this code will need to use one of four possible
-    # solutions: a decorator that restores the current behavior as
-    # described in
-    # http://legacy.python.org/dev/peps/pep-0479/#sub-proposal-decorator-to-explicitly-request-current-behaviour
-    # , dynamic imports or exec to generate different code for
-    # different versions, drop support for all Python versions <3.3,
-    # or refactoring to change how these decorators work.  In any
-    # event, after dropping support for Python <3.3 this code should
-    # be refactored to use `yield from`.
-    inferred = False
-    try:
-        generator = func(*args, **kwargs)
-        while True:
-            yield next(generator)
-            inferred = True
-    except StopIteration as error:
-        if not inferred:
-            if error.args:
-                # pylint: disable=not-a-mapping
-                raise exceptions.InferenceError(**error.args[0])
-            else:
-                raise exceptions.InferenceError(
-                    'StopIteration raised without any error information.')
+def path_wrapper(func):
+    """return the given infer function wrapped to handle the path
+
+    Used to stop inference if the node has already been looked
+    at for a given `InferenceContext` to prevent infinite recursion
+    """
+    return inference_wrapper(func, path=True)
+
+
+def yes_if_nothing_inferred(func):
+    """Give back Uninferable if the given generator gives nothing"""
+    return inference_wrapper(func, if_nothing='uninferable')
+
+
+def raise_if_nothing_inferred(func):
+    """Raise an InferenceError if the given generator gives nothing
+
+    The generator returns the fields of the error.
+    """
+    return inference_wrapper(func, if_nothing='raise')
+
+
+def fail_if_nothing_inferred(func):
+    """Like raise_if_nothing_inferred, but give back a failure instead of
+    raising the InferenceError.
+
+    This is meant for the inference functions, whose values are given
+    by NodeNG.infer, raising the failures there.
+    """
+    return inference_wrapper(func, if_nothing='fail')
@@ -190,6 +190,30 @@ class _NonDeducibleTypeHierarchy(Exception):
     """Raised when is_subtype / is_supertype can't deduce the relation between two types."""
 
 
+class _Failure(object):
+    """A failure given as a value instead of being raised.
+
+    The hot paths of inference and of the attribute lookups give back
+    failures rather than raising and catching the same errors over and
+    over: a failure only holds the class and the fields of its error,
+    which is built when the failure reaches a public API and has to
+    be raised.  In the values of an inference, a failure is always
+    the only value.
+    """
+    __slots__ = ('error_class', 'fields')
+
+    def __init__(self, error_class, **fields):
+        self.error_class = error_class
+        self.fields = fields
+
+    def error(self):
+        """Build the error of this failure."""
+        return self.error_class(**self.fields)
+
+    def __repr__(self):
+        return '<_Failure %s>' % self.error_class.__name__
+
+
 class AstroidIndexError(AstroidError):
     """Raised when an Indexable / Mapping does not have an index / key."""
 
@@ -51,7 +51,7 @@ def _object_type(node, context=None):
     for inferred in node.infer(context=context):
         if isinstance(inferred, scoped_nodes.ClassDef):
             if inferred.newstyle:
-                metaclass = inferred.metaclass()
+                metaclass = inferred.metaclass(context=context)
                 if metaclass:
                     yield metaclass
                     continue
@@ -146,10 +146,12 @@ def safe_infer(node, context=None):
     one node has been inferred).
     """
     try:
-        inferit = node.infer(context=context)
+        inferit = node._infer_or_fail(context=context)
         value = next(inferit)
     except exceptions.InferenceError:
         return None
+    if value.__class__ is exceptions._Failure:
+        return None
     try:
         next(inferit)
         return None # None if there is ambiguity on the inferred node
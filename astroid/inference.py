@@ -12,6 +12,7 @@
 import functools
 import itertools
 import operator
+import weakref
 
 from astroid import bases
 from astroid import context as contextmod
@@ -22,6 +23,7 @@ from astroid import manager
 from astroid import nodes
 from astroid.interpreter import dunder_lookup
 from astroid import protocols
+from astroid import scoped_nodes
 from astroid import util
 
 
@@ -169,18 +171,24 @@ def infer_name(self, context=None):
             _, stmts = parent_function.lookup(self.name)
 
         if not stmts:
-            raise exceptions.NameInferenceError(name=self.name,
-                                                scope=self.scope(),
-                                                context=context)
+            return iter((exceptions._Failure(exceptions.NameInferenceError,
+                                             name=self.name,
+                                             scope=self.scope(),
+                                             context=context),))
+    if isinstance(frame, (nodes.Module, nodes.ClassDef)):
+        values = scoped_nodes._tabulated_values(frame, self.name, stmts)
+        if values is not None:
+            return iter(values)
     context = context.clone()
     context.lookupname = self.name
-    return bases._infer_stmts(stmts, context, frame)
-nodes.Name._infer = decorators.path_wrapper(infer_name)
-nodes.AssignName.infer_lhs = infer_name # won't work with a path wrapper
+    return bases._infer_stmts(stmts, context, frame, raise_failures=False)
+nodes.Name._infer = decorators.inference_wrapper(infer_name, path=True)
+# won't work with a path wrapper
+nodes.AssignName.infer_lhs = decorators.inference_wrapper(infer_name,
+                                                          if_nothing='raise')
 
 
-@decorators.raise_if_nothing_inferred
-@decorators.path_wrapper
+@decorators.inference_wrapper(path=True, if_nothing='fail')
 def infer_call(self, context=None):
     """infer a Call node by trying to guess what the function returns"""
     callcontext = context.clone()
@@ -189,8 +197,8 @@ def infer_call(self, context=None):
     callcontext.boundnode = None
     if context is not None:
         context_lookup = _populate_context_lookup(self, context.clone())
-    for callee in self.func.infer(context):
-        if callee is util.Uninferable:
+    for callee in self.func._infer_or_fail(context):
+        if callee is util.Uninferable or callee.__class__ is exceptions._Failure:
             yield callee
             continue
         try:
@@ -201,12 +209,12 @@ def infer_call(self, context=None):
             ## XXX log error ?
             continue
     # Explicit StopIteration to return error information, see comment
-    # in raise_if_nothing_inferred.
+    # in inference_wrapper.
     return dict(node=self, context=context)
 nodes.Call._infer = infer_call
 
 
-@decorators.path_wrapper
+@decorators.inference_wrapper(path=True)
 def infer_import(self, context=None, asname=True):
     """infer an Import node: return the imported module/object"""
     name = context.lookupname
@@ -232,7 +240,7 @@ def infer_name_module(self, name):
 nodes.Import.infer_name_module = infer_name_module
 
 
-@decorators.path_wrapper
+@decorators.inference_wrapper(path=True)
 def infer_import_from(self, context=None, asname=True):
     """infer a ImportFrom node: return the imported module/object"""
     name = context.lookupname
@@ -251,18 +259,17 @@ def infer_import_from(self, context=None, asname=True):
         context = contextmod.copy_context(context)
         context.lookupname = name
         stmts = module.getattr(name, ignore_locals=module is self.root())
-        return bases._infer_stmts(stmts, context)
+        return bases._infer_stmts(stmts, context, raise_failures=False)
     except exceptions.AttributeInferenceError as error:
         util.reraise(exceptions.InferenceError(
             error.message, target=self, attribute=name, context=context))
 nodes.ImportFrom._infer = infer_import_from
 
 
-@decorators.raise_if_nothing_inferred
 def infer_attribute(self, context=None):
     """infer an Attribute node by using getattr on the associated object"""
-    for owner in self.expr.infer(context):
-        if owner is util.Uninferable:
+    for owner in self.expr._infer_or_fail(context):
+        if owner is util.Uninferable or owner.__class__ is exceptions._Failure:
             yield owner
             continue
 
@@ -291,19 +298,22 @@ def infer_attribute(self, context=None):
             # XXX method / function
             context.boundnode = None
     # Explicit StopIteration to return error information, see comment
-    # in raise_if_nothing_inferred.
+    # in inference_wrapper.
     return dict(node=self, context=context)
-nodes.Attribute._infer = decorators.path_wrapper(infer_attribute)
-nodes.AssignAttr.infer_lhs = infer_attribute # # won't work with a path wrapper
+nodes.Attribute._infer = decorators.inference_wrapper(
+    infer_attribute, path=True, if_nothing='fail', skip_visited=True)
+# won't work with a path wrapper
+nodes.AssignAttr.infer_lhs = decorators.inference_wrapper(infer_attribute,
+                                                          if_nothing='raise')
 
 
-@decorators.path_wrapper
+@decorators.inference_wrapper(path=True)
 def infer_global(self, context=None):
     if context.lookupname is None:
         raise exceptions.InferenceError(node=self, context=context)
     try:
         return bases._infer_stmts(self.root().getattr(context.lookupname),
-                                  context)
+                                  context, raise_failures=False)
     except exceptions.AttributeInferenceError as error:
         util.reraise(exceptions.InferenceError(
             error.message, target=self, attribute=context.lookupname,
@@ -314,7 +324,6 @@ nodes.Global._infer = infer_global
 _SUBSCRIPT_SENTINEL = object()
 
 
-@decorators.raise_if_nothing_inferred
 def infer_subscript(self, context=None):
     """Inference for subscripts
 
@@ -325,19 +334,19 @@ def infer_subscript(self, context=None):
     """
 
     try:
-        value = next(self.value.infer(context))
+        value = next(self.value._infer_or_fail(context))
     except StopIteration:
         return None
-    if value is util.Uninferable:
-        yield util.Uninferable
+    if value is util.Uninferable or value.__class__ is exceptions._Failure:
+        yield value
         return None
 
     try:
-        index = next(self.slice.infer(context))
+        index = next(self.slice._infer_or_fail(context))
     except StopIteration:
         return None
-    if index is util.Uninferable:
-        yield util.Uninferable
+    if index is util.Uninferable or index.__class__ is exceptions._Failure:
+        yield index
         return None
 
     # Try to deduce the index value.
@@ -352,7 +361,9 @@ def infer_subscript(self, context=None):
         else:
             index_value = index
     if index_value is _SUBSCRIPT_SENTINEL:
-        raise exceptions.InferenceError(node=self, context=context)
+        yield exceptions._Failure(exceptions.InferenceError,
+                                  node=self, context=context)
+        return None
 
     try:
         assigned = value.getitem(index_value, context)
@@ -360,8 +371,9 @@ def infer_subscript(self, context=None):
             exceptions.AstroidIndexError,
             exceptions.AttributeInferenceError,
             AttributeError) as exc:
-        util.reraise(exceptions.InferenceError(node=self, error=exc,
-                                               context=context))
+        yield exceptions._Failure(exceptions.InferenceError,
+                                  node=self, error=exc, context=context)
+        return None
 
     # Prevent inferring if the inferred subscript
     # is the same as the original subscripted object.
@@ -372,15 +384,16 @@ def infer_subscript(self, context=None):
         yield inferred
 
     # Explicit StopIteration to return error information, see comment
-    # in raise_if_nothing_inferred.
+    # in inference_wrapper.
     return dict(node=self, context=context)
 
-nodes.Subscript._infer = decorators.path_wrapper(infer_subscript)
-nodes.Subscript.infer_lhs = infer_subscript
+nodes.Subscript._infer = decorators.inference_wrapper(
+    infer_subscript, path=True, if_nothing='fail', skip_visited=True)
+nodes.Subscript.infer_lhs = decorators.inference_wrapper(infer_subscript,
+                                                         if_nothing='raise')
 
 
-@decorators.raise_if_nothing_inferred
-@decorators.path_wrapper
+@decorators.inference_wrapper(path=True, if_nothing='fail')
 def _infer_boolop(self, context=None):
     """Infer a boolean operation (and / or / not).
 
@@ -430,7 +443,7 @@ def _infer_boolop(self, context=None):
             yield value
 
     # Explicit StopIteration to return error information, see comment
-    # in raise_if_nothing_inferred.
+    # in inference_wrapper.
     return dict(node=self, context=context)
 
 nodes.BoolOp._infer = _infer_boolop
@@ -503,15 +516,14 @@ def _infer_unaryop(self, context=None):
                     yield util.Uninferable
 
 
-@decorators.raise_if_nothing_inferred
-@decorators.path_wrapper
+@decorators.inference_wrapper(path=True, if_nothing='fail')
 def infer_unaryop(self, context=None):
     """Infer what an UnaryOp should return when evaluated."""
     for inferred in _filter_operation_errors(self, _infer_unaryop, context,
                                              util.BadUnaryOperationMessage):
         yield inferred
     # Explicit StopIteration to return error information, see comment
-    # in raise_if_nothing_inferred.
+    # in inference_wrapper.
     return dict(node=self, context=context)
 
 nodes.UnaryOp._infer_unaryop = _infer_unaryop
@@ -523,12 +535,38 @@ def _is_not_implemented(const):
     return isinstance(const, nodes.Const) and const.value is NotImplemented
 
 
+# The operands whose special methods only depend on their class.
+_BUILTIN_OPERANDS = (nodes.List, nodes.Tuple, nodes.Const, nodes.Dict, nodes.Set)
+# The special methods of the classes of builtin operands, and how their
+# types relate to the other ones, forgotten along with the classes.
+_DUNDER_METHODS = weakref.WeakKeyDictionary()
+_TYPE_RELATIONS = weakref.WeakKeyDictionary()
+
+
+def _lookup_binop_method(instance, method_name):
+    """Get the special method implementing an operation for the given operand"""
+    if not isinstance(instance, _BUILTIN_OPERANDS):
+        return dunder_lookup.lookup(instance, method_name)[0]
+    methods = _DUNDER_METHODS.get(instance._proxied)
+    if methods is None:
+        methods = _DUNDER_METHODS[instance._proxied] = {}
+    if method_name not in methods:
+        try:
+            methods[method_name] = dunder_lookup.lookup(instance, method_name)[0]
+        except exceptions.AttributeInferenceError:
+            # Remember that the operation is not supported.
+            methods[method_name] = None
+    method = methods[method_name]
+    if method is None:
+        raise exceptions.AttributeInferenceError(attribute=method_name, target=instance)
+    return method
+
+
 def _invoke_binop_inference(instance, opnode, op, other, context, method_name):
     """Invoke binary operation inference on the given instance."""
-    methods = dunder_lookup.lookup(instance, method_name)
+    method = _lookup_binop_method(instance, method_name)
     if context is not None:
         context.boundnode = instance
-    method = methods[0]
     inferred = next(method.infer(context=context))
     return instance.infer_binary_op(opnode, op, other, context, inferred)
 
@@ -580,8 +618,21 @@ def _same_type(type1, type2):
     return type1.qname() == type2.qname()
 
 
-def _get_binop_flow(left, left_type, binary_opnode, right, right_type,
-                    context, reverse_context):
+def _type_relation(left_type, right_type):
+    """Get how the type of a left operand relates to the one of a right operand
+
+    :returns: 'same', 'subtype', 'supertype' or None if the types are unrelated.
+    """
+    if _same_type(left_type, right_type):
+        return 'same'
+    if helpers.is_subtype(left_type, right_type):
+        return 'subtype'
+    if helpers.is_supertype(left_type, right_type):
+        return 'supertype'
+    return None
+
+
+def _get_binop_flow(left, relation, binary_opnode, right, context, reverse_context):
     """Get the flow for binary operations.
 
     The rules are a bit messy:
@@ -597,11 +648,9 @@ def _get_binop_flow(left, left_type, binary_opnode, right, right_type,
           is first tried and then left.__op__(right)
     """
     op = binary_opnode.op
-    if _same_type(left_type, right_type):
-        methods = [_bin_op(left, binary_opnode, op, right, context)]
-    elif helpers.is_subtype(left_type, right_type):
+    if relation in ('same', 'subtype'):
         methods = [_bin_op(left, binary_opnode, op, right, context)]
-    elif helpers.is_supertype(left_type, right_type):
+    elif relation == 'supertype':
         methods = [_bin_op(right, binary_opnode, op, left, reverse_context, reverse=True),
                    _bin_op(left, binary_opnode, op, right, context)]
     else:
@@ -610,8 +659,7 @@ def _get_binop_flow(left, left_type, binary_opnode, right, right_type,
     return methods
 
 
-def _get_aug_flow(left, left_type, aug_opnode, right, right_type,
-                  context, reverse_context):
+def _get_aug_flow(left, relation, aug_opnode, right, context, reverse_context):
     """Get the flow for augmented binary operations.
 
     The rules are a bit messy:
@@ -629,13 +677,10 @@ def _get_aug_flow(left, left_type, aug_opnode, right, right_type,
     """
     bin_op = aug_opnode.op.strip("=")
     aug_op = aug_opnode.op
-    if _same_type(left_type, right_type):
-        methods = [_aug_op(left, aug_opnode, aug_op, right, context),
-                   _bin_op(left, aug_opnode, bin_op, right, context)]
-    elif helpers.is_subtype(left_type, right_type):
+    if relation in ('same', 'subtype'):
         methods = [_aug_op(left, aug_opnode, aug_op, right, context),
                    _bin_op(left, aug_opnode, bin_op, right, context)]
-    elif helpers.is_supertype(left_type, right_type):
+    elif relation == 'supertype':
         methods = [_aug_op(left, aug_opnode, aug_op, right, context),
                    _bin_op(right, aug_opnode, bin_op, left, reverse_context, reverse=True),
                    _bin_op(left, aug_opnode, bin_op, right, context)]
@@ -646,17 +691,35 @@ def _get_aug_flow(left, left_type, aug_opnode, right, right_type,
     return methods
 
 
-def _infer_binary_operation(left, right, binary_opnode, context, flow_factory):
+def _infer_binary_operation(left, right, binary_opnode, context, flow_factory,
+                            relations=None):
     """Infer a binary operation between a left operand and a right operand
 
     This is used by both normal binary operations and augmented binary
     operations, the only difference is the flow factory used.
+    The relations between the types of the operands are cached
+    in *relations*, if given.
     """
 
     context, reverse_context = _get_binop_contexts(context, left, right)
-    left_type = helpers.object_type(left)
-    right_type = helpers.object_type(right)
-    methods = flow_factory(left, left_type, binary_opnode, right, right_type,
+    if isinstance(left, _BUILTIN_OPERANDS) and isinstance(right, _BUILTIN_OPERANDS):
+        left_type = left._proxied
+        right_type = right._proxied
+        relations = _TYPE_RELATIONS.get(left_type)
+        if relations is None:
+            relations = _TYPE_RELATIONS[left_type] = {}
+        key = right_type
+    else:
+        left_type = helpers.object_type(left)
+        right_type = helpers.object_type(right)
+        key = (left_type, right_type)
+    if relations is None:
+        relation = _type_relation(left_type, right_type)
+    else:
+        if key not in relations:
+            relations[key] = _type_relation(left_type, right_type)
+        relation = relations[key]
+    methods = flow_factory(left, relation, binary_opnode, right,
                            context, reverse_context)
     for method in methods:
         try:
@@ -693,12 +756,49 @@ def _infer_binary_operation(left, right, binary_opnode, context, flow_factory):
     yield util.BadBinaryOperationMessage(left_type, binary_opnode.op, right_type)
 
 
+def _infer_binary_operations(lefts, rights, binary_opnode, context, flow_factory):
+    """Infer a binary operation between every left and right operand
+
+    The operation is inferred as Uninferable as soon as one of the
+    combinations of operands is, or if there are too many of them.
+    """
+    limit = MANAGER.max_inferred_combinations
+    if limit is not None and len(lefts) * len(rights) > limit:
+        yield util.Uninferable
+        return
+    relations = {}
+    for lhs in lefts:
+        for rhs in rights:
+            try:
+                results = list(_infer_binary_operation(lhs, rhs, binary_opnode, context,
+                                                       flow_factory, relations))
+            except exceptions._NonDeducibleTypeHierarchy:
+                results = [util.Uninferable]
+            if any(result is util.Uninferable for result in results):
+                # The other combinations can't tell what this is.
+                yield util.Uninferable
+                return
+            for result in results:
+                yield result
+
+
+def _infer_operands(node, context):
+    """Get the values inferred for an operand, up to the first Uninferable one
+
+    :returns: The values, and whether an Uninferable one was met.
+    """
+    values = []
+    for value in node.infer(context=context):
+        if value is util.Uninferable:
+            return values, True
+        values.append(value)
+    return values, False
+
+
 def _infer_binop(self, context):
     """Binary operation inferrence logic."""
     if context is None:
         context = contextmod.InferenceContext()
-    left = self.left
-    right = self.right
 
     # we use two separate contexts for evaluating lhs and rhs because
     # 1. evaluating lhs may leave some undesired entries in context.path
@@ -706,28 +806,19 @@ def _infer_binop(self, context):
     lhs_context = context.clone()
     rhs_context = context.clone()
 
-    for lhs in left.infer(context=lhs_context):
-        if lhs is util.Uninferable:
-            # Don't know how to process this.
-            yield util.Uninferable
-            return
-
-        for rhs in right.infer(context=rhs_context):
-            if rhs is util.Uninferable:
-                # Don't know how to process this.
-                yield util.Uninferable
-                return
-
-            try:
-                for result in _infer_binary_operation(lhs, rhs, self,
-                                                      context, _get_binop_flow):
-                    yield result
-            except exceptions._NonDeducibleTypeHierarchy:
-                yield util.Uninferable
+    lefts, uninferable = _infer_operands(self.left, lhs_context)
+    if lefts:
+        rights, rhs_uninferable = _infer_operands(self.right, rhs_context)
+        uninferable = uninferable or rhs_uninferable
+        for result in _infer_binary_operations(lefts, rights, self, context,
+                                               _get_binop_flow):
+            yield result
+    if uninferable:
+        # Don't know how to process this.
+        yield util.Uninferable
 
 
-@decorators.yes_if_nothing_inferred
-@decorators.path_wrapper
+@decorators.inference_wrapper(path=True, if_nothing='uninferable')
 def infer_binop(self, context=None):
     return _filter_operation_errors(self, _infer_binop, context,
                                     util.BadBinaryOperationMessage)
@@ -741,27 +832,25 @@ def _infer_augassign(self, context=None):
     if context is None:
         context = contextmod.InferenceContext()
 
+    lefts = []
+    uninferable = False
     for lhs in self.target.infer_lhs(context=context):
         if lhs is util.Uninferable:
-            # Don't know how to process this.
-            yield util.Uninferable
-            return
-
-        rhs_context = context.clone()
-        for rhs in self.value.infer(context=rhs_context):
-            if rhs is util.Uninferable:
-                # Don't know how to process this.
-                yield util.Uninferable
-                return
-
-            try:
-                for result in _infer_binary_operation(lhs, rhs, self, context, _get_aug_flow):
-                    yield result
-            except exceptions._NonDeducibleTypeHierarchy:
-                yield util.Uninferable
+            uninferable = True
+            break
+        lefts.append(lhs)
+    if lefts:
+        rights, rhs_uninferable = _infer_operands(self.value, context.clone())
+        uninferable = uninferable or rhs_uninferable
+        for result in _infer_binary_operations(lefts, rights, self, context,
+                                               _get_aug_flow):
+            yield result
+    if uninferable:
+        # Don't know how to process this.
+        yield util.Uninferable
 
 
-@decorators.path_wrapper
+@decorators.inference_wrapper(path=True)
 def infer_augassign(self, context=None):
     return _filter_operation_errors(self, _infer_augassign, context,
                                     util.BadBinaryOperationMessage)
@@ -780,7 +869,7 @@ def infer_arguments(self, context=None):
 nodes.Arguments._infer = infer_arguments
 
 
-@decorators.path_wrapper
+@decorators.inference_wrapper(path=True)
 def infer_assign(self, context=None):
     """infer a AssignName/AssignAttr: need to inspect the RHS part of the
     assign node
@@ -797,7 +886,7 @@ nodes.AssignAttr._infer = infer_assign
 
 # no infer method on DelName and DelAttr (expected InferenceError)
 
-@decorators.path_wrapper
+@decorators.inference_wrapper(path=True)
 def infer_empty_node(self, context=None):
     if not self.has_underlying_object():
         yield util.Uninferable
@@ -5,6 +5,7 @@ import collections
 import enum
 import imp
 import os
+import stat
 import sys
 import zipimport
 try:
@@ -84,12 +85,127 @@ class Finder(object):
         """Get a list of extra paths where this finder can search."""
 
 
+def list_directory(directory):
+    """Get the names of the files and of the directories found in the given directory."""
+    files = set()
+    directories = set()
+    if hasattr(os, 'scandir'):
+        for entry in os.scandir(directory):
+            try:
+                if entry.is_dir():
+                    directories.add(entry.name)
+                elif entry.is_file():
+                    files.add(entry.name)
+            except OSError:
+                continue
+    else:
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if os.path.isdir(path):
+                directories.add(name)
+            elif os.path.isfile(path):
+                files.add(name)
+    return files, directories
+
+
+class ModulePathIndex(object):
+    """An in-memory index of the modules found in the search path directories.
+
+    It finds modules the same way as :func:`imp.find_module`, but each
+    directory is listed only once, the first time a module is looked up
+    in it, instead of probing the file system for every possible file suffix.
+    A directory is listed again when its modification time changes.
+    """
+
+    def __init__(self):
+        # Maps the absolute path of a directory to its modification time,
+        # its file names and its subdirectory names.
+        self._listings = {}
+        self._suffixes = [(suffix, _imp_type_to_module_type(imp_type))
+                          for suffix, _, imp_type in imp.get_suffixes()]
+        self._init_files = {'__init__' + suffix
+                            for suffix, _, imp_type in imp.get_suffixes()
+                            if imp_type in (imp.PY_SOURCE, imp.PY_COMPILED)}
+
+    def listing(self, directory):
+        """Get the listing of the given directory, listing it again if it changed.
+
+        :returns: The modification time of the directory, the set of its
+            file names and the set of its subdirectory names, or None if
+            it is not a directory which can be listed.
+        :rtype: tuple(float, set(str), set(str)) or None
+        """
+        abspath = os.path.abspath(directory)
+        try:
+            stat_result = os.stat(abspath)
+        except OSError:
+            return None
+        if not stat.S_ISDIR(stat_result.st_mode):
+            return None
+        listing = self._listings.get(abspath)
+        if listing is None or listing[0] != stat_result.st_mtime:
+            try:
+                files, directories = list_directory(abspath)
+            except OSError:
+                return None
+            listing = self._listings[abspath] = (stat_result.st_mtime, files, directories)
+        return listing
+
+    def find_module(self, modname, path=None):
+        """Find the given module in the given path, or in sys.path.
+
+        :returns: a tuple of the location of the module and of its module type.
+        :raises ImportError: if the module can't be found.
+        """
+        if path is None:
+            if imp.is_builtin(modname):
+                return None, ModuleType.C_BUILTIN
+            if imp.is_frozen(modname):
+                return None, ModuleType.PY_FROZEN
+            path = sys.path
+        for entry in path:
+            listing = self.listing(entry)
+            if listing is None:
+                continue
+            _, files, directories = listing
+            if modname in directories:
+                package = os.path.join(entry, modname)
+                package_listing = self.listing(package)
+                if package_listing and not self._init_files.isdisjoint(package_listing[1]):
+                    return package, ModuleType.PKG_DIRECTORY
+            for suffix, module_type in self._suffixes:
+                if modname + suffix in files:
+                    return os.path.join(entry, modname + suffix), module_type
+        raise ImportError('No module named %s' % modname)
+
+
+_PATH_INDEX = None
+
+
+def use_path_index(enabled=True):
+    """Find the modules through a :class:`ModulePathIndex`.
+
+    This avoids most of the file system calls made when looking
+    for a module, at the cost of keeping the directory listings
+    of the search path in memory. It is disabled by default.
+    """
+    global _PATH_INDEX # pylint: disable=global-statement
+    _PATH_INDEX = ModulePathIndex() if enabled else None
+
+
 class ImpFinder(Finder):
     """A finder based on the imp module."""
 
     def find_module(self, modname, module_parts, processed, submodule_path):
         if submodule_path is not None:
             submodule_path = list(submodule_path)
+        if _PATH_INDEX is not None:
+            try:
+                mp_filename, module_type = _PATH_INDEX.find_module(modname, submodule_path)
+            except ImportError:
+                return None
+            return ModuleSpec(name=modname, location=mp_filename,
+                              module_type=module_type)
         try:
             stream, mp_filename, mp_desc = imp.find_module(modname, submodule_path)
         except ImportError:
@@ -11,18 +11,56 @@ possible by providing a class responsible to get astroid representation
 from various source and using a cache of built modules)
 """
 
+import gc
 import os
+import pickle
 import sys
 import zipimport
 
 import six
 
+from astroid import context as contextmod
 from astroid import exceptions
 from astroid.interpreter._import import spec
 from astroid import modutils
 from astroid import transforms
 from astroid import util
 
+node_classes = util.lazy_import('node_classes')
+
+
+# Bump it when the format of the persisted module lookups changes.
+_MOD_FILE_CACHE_VERSION = 1
+
+
+def _directories_state(directories):
+    """Get the modification times of the given directories, None for missing ones."""
+    state = {}
+    for directory in directories:
+        try:
+            state[directory] = os.stat(directory).st_mtime
+        except OSError:
+            state[directory] = None
+    return state
+
+
+def _mod_file_cache_directories(mod_file_cache):
+    """Get the directories whose content determines the given module lookups."""
+    directories = {os.path.abspath(entry) for entry in sys.path}
+    for (_, contextfile), value in mod_file_cache.items():
+        if contextfile:
+            directories.add(os.path.dirname(os.path.abspath(contextfile)))
+        if isinstance(value, spec.ModuleSpec):
+            if value.location:
+                directories.add(os.path.dirname(os.path.abspath(value.location)))
+            directories.update(value.submodule_search_locations or ())
+    return directories
+
+
+def _mod_file_cache_key():
+    return (_MOD_FILE_CACHE_VERSION, sys.executable, sys.version,
+            tuple(sys.path), os.getcwd())
+
 
 def safe_repr(obj):
     try:
@@ -31,6 +69,63 @@ def safe_repr(obj):
         return '???'
 
 
+_CACHED_PROPERTIES = {}
+
+
+def _cached_properties(cls):
+    """Get the names of the cached properties of the given node class."""
+    try:
+        return _CACHED_PROPERTIES[cls]
+    except KeyError:
+        from astroid.decorators import cachedproperty
+        names = {name for klass in cls.__mro__ for name, value in vars(klass).items()
+                 if isinstance(value, cachedproperty)}
+        _CACHED_PROPERTIES[cls] = names = tuple(sorted(names))
+        return names
+
+
+def _finish_lazy_state(module):
+    """Compute the values the nodes of the given module compute on first access."""
+    from astroid import node_classes
+    from astroid import scoped_nodes
+    module.locals  # pylint: disable=pointless-statement
+    for node in module.nodes_of_class(node_classes.NodeNG):
+        for name in _cached_properties(type(node)):
+            try:
+                getattr(node, name)
+            except exceptions.AstroidError:
+                pass
+        try:
+            if isinstance(node, scoped_nodes.ClassDef):
+                node.instance_attrs  # pylint: disable=pointless-statement
+                node.newstyle  # pylint: disable=pointless-statement
+                node.type  # pylint: disable=pointless-statement
+            elif isinstance(node, scoped_nodes.FunctionDef):
+                node.decoratornames()
+        except exceptions.AstroidError:
+            pass
+
+
+def _inference_order(node):
+    """Get the key ordering a node in a batch of inferences
+
+    The nodes of the outer scopes come first, then in each scope the nodes
+    of the statements binding names before the others, so that the values
+    of the names are inferred before their uses.
+    """
+    depth = 0
+    scope = node.scope()
+    while scope.parent is not None:
+        depth += 1
+        scope = scope.parent.scope()
+    binding = isinstance(node.statement(), (node_classes.Assign,
+                                            node_classes.AnnAssign,
+                                            node_classes.AugAssign,
+                                            node_classes.Import,
+                                            node_classes.ImportFrom))
+    return (depth, not binding, node.fromlineno or 0, node.col_offset or 0)
+
+
 class AstroidManager(object):
     """the astroid manager, responsible to build astroid from files
      or modules.
@@ -40,6 +135,83 @@ class AstroidManager(object):
 
     name = 'astroid loader'
     brain = {}
+    _module_store = None
+    lazy_docstrings = False
+    """Whether the docstrings are left in the source until they are accessed.
+
+    They are then read back from the source file, which
+    must not change while the modules are in use.
+
+    :type: bool
+    """
+    parser = None
+    """The parser used to build the modules found on disk.
+
+    See the *parser* argument of :class:`astroid.builder.AstroidBuilder`.
+    The modules built from strings, such as the ones of the brain plugins,
+    are always compiled by the running interpreter.
+    """
+    target_version_info = None
+    """The version of Python the modules found on disk are built for.
+
+    When set, like ``(3, 6)``, or when :attr:`target_platform` is set,
+    the branches of the if statements which are not taken on the target
+    are left out, see :func:`astroid.builder.target_parser`.
+
+    :type: tuple or None
+    """
+    target_platform = None
+    """The ``sys.platform`` the modules found on disk are built for.
+
+    :type: str or None
+    """
+    fold_constants = False
+    """Whether the operations between literals are computed when building modules.
+
+    Their values are then inferred through an inference tip,
+    see :mod:`brain_constant_folding`.
+
+    :type: bool
+    """
+    builtins_snapshot_dir = os.environ.get('ASTROID_CACHE_DIR') or None
+    """The directory where the builtins module is saved, to be loaded back faster.
+
+    The builtins module is built when astroid is imported, so this is
+    set from ``$ASTROID_CACHE_DIR``, see :mod:`astroid.raw_building`.
+    The builtins are introspected at each import when it is None.
+
+    :type: str or None
+    """
+    # Bumped when modules are evicted, see Module.tabulate_names.
+    _evictions = 0
+    max_inference_steps = None
+    """The number of nodes an inference started without a context can infer.
+
+    See :class:`astroid.context.InferenceBudget`, like the two limits below.
+    The nodes are inferred as Uninferable once one of the limits is reached.
+
+    :type: int or None
+    """
+    max_inferred_values = None
+    """The number of values inferred for a node before giving up.
+
+    :type: int or None
+    """
+    inference_timeout = None
+    """The number of seconds an inference started without a context can take.
+
+    :type: float or None
+    """
+    max_inferred_combinations = None
+    """The number of combinations of inferred values considered by an operation.
+
+    The binary operations and the unpacking assignments are inferred as
+    Uninferable when the values inferred for their operands, or for the
+    parts they unpack, make more combinations. They are not capped when
+    it is None.
+
+    :type: int or None
+    """
 
     def __init__(self):
         self.__dict__ = AstroidManager.brain
@@ -61,6 +233,20 @@ class AstroidManager(object):
         """Visit the transforms and apply them to the given *node*."""
         return self._transform.visit(node)
 
+    def inference_budget(self):
+        """Get a budget for an inference started without a context
+
+        :returns: The budget set by the limits of the manager,
+            or None if there is none.
+        :rtype: InferenceBudget or None
+        """
+        if (self.max_inference_steps is None and self.max_inferred_values is None
+                and self.inference_timeout is None):
+            return None
+        return contextmod.InferenceBudget(self.max_inference_steps,
+                                          self.max_inferred_values,
+                                          self.inference_timeout)
+
     def ast_from_file(self, filepath, modname=None, fallback=True, source=False):
         """given a module name, return the astroid object"""
         try:
@@ -76,8 +262,18 @@ class AstroidManager(object):
         if modname in self.astroid_cache and self.astroid_cache[modname].file == filepath:
             return self.astroid_cache[modname]
         if source:
-            from astroid.builder import AstroidBuilder
-            return AstroidBuilder(self).file_build(filepath, modname)
+            if self._module_store is not None:
+                module = self._module_store.load(modname, filepath)
+                if module is not None:
+                    self.cache_module(module)
+                    return module
+            from astroid import builder
+            parser = self.parser
+            if self.target_version_info is not None or self.target_platform is not None:
+                parser = builder.target_parser(self.target_version_info,
+                                               self.target_platform, parser)
+            return builder.AstroidBuilder(self, parser=parser).file_build(
+                filepath, modname)
         elif fallback and modname:
             return self.ast_from_module_name(modname)
         raise exceptions.AstroidBuildingError(
@@ -197,6 +393,91 @@ class AstroidManager(object):
                         value, traceback)
         return value
 
+    def dump_mod_file_cache(self, path):
+        """Save the module lookups made so far to the given file.
+
+        They can be loaded back by another process with
+        :meth:`load_mod_file_cache`, along with the failed lookups
+        of top level modules. The failed lookups of dotted names are
+        left out, since they depend on the content of the packages.
+        """
+        cache = {key: value for key, value in self._mod_file_cache.items()
+                 if '.' not in key[0]
+                 or not isinstance(value, exceptions.AstroidBuildingError)}
+        directories = _mod_file_cache_directories(cache)
+        data = {'key': _mod_file_cache_key(),
+                'directories': _directories_state(directories),
+                'cache': cache}
+        tmp_path = '%s.%d.tmp' % (path, os.getpid())
+        with open(tmp_path, 'wb') as stream:
+            pickle.dump(data, stream, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def load_mod_file_cache(self, path):
+        """Load the module lookups saved with :meth:`dump_mod_file_cache`.
+
+        The lookups are discarded if they were made by another
+        interpreter, with another ``sys.path`` or working directory,
+        or if a directory they depend on was modified since.
+        The file is unpickled, so it must come from a trusted source.
+
+        :returns: True if the lookups were loaded, False otherwise.
+        :rtype: bool
+        """
+        try:
+            with open(path, 'rb') as stream:
+                data = pickle.load(stream)
+        except (IOError, EOFError, pickle.UnpicklingError,
+                AttributeError, ImportError):
+            return False
+        if not isinstance(data, dict) or data.get('key') != _mod_file_cache_key():
+            return False
+        if _directories_state(data['directories']) != data['directories']:
+            return False
+        for key, value in data['cache'].items():
+            self._mod_file_cache.setdefault(key, value)
+        return True
+
+    def freeze(self):
+        """Prepare the cached modules to be shared with forked processes.
+
+        The values the nodes compute lazily, such as their line numbers,
+        the names of the wildcard imports or the instance attributes,
+        are computed for all the cached modules, including the ones
+        built meanwhile, so that the processes forked afterwards only
+        read the nodes. The garbage collector then moves all the objects
+        to a permanent generation, which is not traversed anymore,
+        when the interpreter supports it.
+        """
+        frozen = set()
+        while True:
+            modules = [module for module in list(self.astroid_cache.values())
+                       if id(module) not in frozen]
+            if not modules:
+                break
+            for module in modules:
+                frozen.add(id(module))
+                _finish_lazy_state(module)
+        gc.collect()
+        if hasattr(gc, 'freeze'):
+            gc.freeze()
+
+    def use_module_store(self, path):
+        """Load the modules from the given store before building them.
+
+        The store is written by :func:`astroid.serialization.write_module_store`
+        and memory mapped, so that the processes using the same store share it.
+
+        :param path: The path of the store, or None to stop using one.
+        :type path: str or None
+        """
+        from astroid.serialization import ModuleStore
+        if self._module_store is not None:
+            self._module_store.close()
+            self._module_store = None
+        if path is not None:
+            self._module_store = ModuleStore(path)
+
     def ast_from_module(self, module, modname=None):
         """given an imported module, return the astroid object"""
         modname = modname or module.__name__
@@ -259,6 +540,56 @@ class AstroidManager(object):
             for inferred in modastroid.igetattr(name, context):
                 yield inferred.instantiate_class()
 
+    def iinfer_many(self, nodes):
+        """Infer the given nodes in a batch, giving back their values in turn
+
+        The inferences share the cache of their results, so that the
+        names, attributes or imports met by several of them are inferred
+        once. They are ordered so that the values bound to the names are
+        inferred before their uses, the outer scopes first. Each inference
+        still has its own path, to detect the recursions, and its own
+        budget.
+
+        :param nodes: The nodes to infer.
+        :type nodes: iterable(NodeNG)
+
+        :returns: The pairs of each node and of its inferred values,
+            which are empty if the node can't be inferred.
+        :rtype: iterable(tuple(NodeNG, tuple))
+        """
+        inferred = contextmod._SharedResults()
+        seen = set()
+        batch = []
+        for node in nodes:
+            if node not in seen:
+                seen.add(node)
+                batch.append(node)
+        batch.sort(key=_inference_order)
+
+        for node in batch:
+            inferred.next_inference()
+            context = contextmod.InferenceContext(
+                inferred=inferred, budget=self.inference_budget())
+            values = []
+            try:
+                for value in node._infer_or_fail(context):
+                    if value.__class__ is exceptions._Failure:
+                        break
+                    values.append(value)
+            except exceptions.InferenceError:
+                pass
+            yield node, tuple(values)
+
+    def infer_many(self, nodes):
+        """Infer the given nodes in a batch
+
+        See :meth:`iinfer_many`.
+
+        :returns: The inferred values of each node.
+        :rtype: dict(NodeNG, tuple)
+        """
+        return dict(self.iinfer_many(nodes))
+
     def register_failed_import_hook(self, hook):
         """Registers a hook to resolve imports that cannot be found otherwise.
 
@@ -273,9 +604,24 @@ class AstroidManager(object):
         """Cache a module if no module with the same name is known yet."""
         self.astroid_cache.setdefault(module.name, module)
 
+    def evict_module(self, modname):
+        """Remove the given module from the cache and dispose of it.
+
+        The module is freed as soon as it is not referenced anymore,
+        see :meth:`Module.dispose`. Nothing is done for unknown modules.
+
+        :param modname: The name of the module.
+        :type modname: str
+        """
+        module = self.astroid_cache.pop(modname, None)
+        if module is not None:
+            self._evictions += 1
+            module.dispose()
+
     def clear_cache(self, astroid_builtin=None):
         # XXX clear transforms
         self.astroid_cache.clear()
+        self._evictions += 1
         # force bootstrap again, else we may ends up with cache inconsistency
         # between the manager and CONST_PROXY, making
         # unittest_lookup.LookupTC.test_builtin_lookup fail depending on the
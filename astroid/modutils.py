@@ -30,6 +30,8 @@ from distutils.errors import DistutilsPlatformError
 # weird path manipulations in order to get to the
 # real distutils module.
 
+from functools import lru_cache
+
 import six
 
 from .interpreter._import import spec
@@ -530,6 +532,10 @@ def is_standard_module(modname, std_path=None):
       - is a built-in module
     """
     modname = modname.split('.')[0]
+    if std_path is None:
+        standard = _is_standard_top_level(modname, tuple(sys.path), os.getcwd())
+        if standard is not None:
+            return standard
     try:
         filename = file_from_modpath([modname])
     except ImportError:
@@ -618,6 +624,59 @@ def _spec_from_modpath(modpath, path=None, context=None):
     return found_spec
 
 
+# The listings of the search path entries, made again when they change.
+_SEARCH_PATH_INDEX = spec.ModulePathIndex()
+
+
+@lru_cache(maxsize=None)
+def _is_standard_directory(directory):
+    """Check if the modules of the given search path entry are standard ones."""
+    directory = os.path.join(directory, '')
+    if directory.startswith(_cache_normalize_path(EXT_LIB_DIR)):
+        return False
+    return any(directory.startswith(_cache_normalize_path(path))
+               for path in STD_LIB_DIRS)
+
+
+_MODULE_SUFFIXES = tuple(suffix for suffix, _, _ in imp.get_suffixes())
+_INIT_FILES = frozenset('__init__.' + ext for ext in PY_SOURCE_EXTS + ('pyc', 'pyo'))
+
+
+@lru_cache(maxsize=None)
+def _is_standard_top_level(modname, search_path, cwd):
+    """Guess if the given top level module is a standard one, from the
+    modules found in the search path, like :func:`imp.find_module` does.
+
+    The module is classified once per search path and working directory.
+    The directory listings are kept, and made again when the modification
+    time of a directory changes.
+    None is returned when the module can't be classified this way,
+    for instance when it is a namespace package, or when a search
+    path entry can't be listed.
+    """
+    if modname in BUILTIN_MODULES or imp.is_frozen(modname):
+        return not util.is_namespace(modname)
+    if modname == 'xml':
+        # file_from_modpath looks for _xmlplus first
+        return None
+    for entry in search_path:
+        directory = os.path.normcase(os.path.normpath(os.path.join(cwd, entry)))
+        listing = _SEARCH_PATH_INDEX.listing(directory)
+        if listing is None:
+            if os.path.exists(directory):
+                # A zip file for instance
+                return None
+            continue
+        _, files, directories = listing
+        if modname in directories:
+            package = _SEARCH_PATH_INDEX.listing(os.path.join(directory, modname))
+            if package is not None and not _INIT_FILES.isdisjoint(package[1]):
+                return _is_standard_directory(directory)
+        if any(modname + suffix in files for suffix in _MODULE_SUFFIXES):
+            return _is_standard_directory(directory)
+    return None
+
+
 def _is_python_file(filename):
     """return true if the given filename should be considered as a python file
 
@@ -13,9 +13,11 @@
 
 import abc
 import builtins as builtins_mod
+import contextlib
 import itertools
 import pprint
 import warnings
+import weakref
 from functools import singledispatch as _singledispatch
 
 from astroid import as_string
@@ -32,7 +34,7 @@ BUILTINS = builtins_mod.__name__
 MANAGER = manager.AstroidManager()
 
 
-@decorators.raise_if_nothing_inferred
+@decorators.inference_wrapper(if_nothing='raise')
 def unpack_infer(stmt, context=None):
     """recursively generate nodes inferred by the given statement.
     If the inferred value is a list or a tuple, recurse on the elements
@@ -45,14 +47,14 @@ def unpack_infer(stmt, context=None):
             for inferred_elt in unpack_infer(elt, context):
                 yield inferred_elt
         # Explicit StopIteration to return error information, see comment
-        # in raise_if_nothing_inferred.
+        # in inference_wrapper.
         return dict(node=stmt, context=context)
     # if inferred is a final node, return it and stop
     inferred = next(stmt.infer(context))
     if inferred is stmt:
         yield inferred
         # Explicit StopIteration to return error information, see comment
-        # in raise_if_nothing_inferred.
+        # in inference_wrapper.
         return dict(node=stmt, context=context)
     # else, infer recursively, except Uninferable object that should be returned as is
     for inferred in stmt.infer(context):
@@ -64,6 +66,35 @@ def unpack_infer(stmt, context=None):
     return dict(node=stmt, context=context)
 
 
+def _within_budget(results, budget, context):
+    """Yield the given results within the limits of the given budget
+
+    The values past the maximum number of results are replaced by
+    Uninferable, and so are the failures once the budget is spent.
+    """
+    try:
+        for index, result in enumerate(results):
+            if index == budget.max_results or (
+                    result.__class__ is exceptions._Failure and budget.exhausted()):
+                break
+            yield result
+        else:
+            return
+    except exceptions.InferenceError:
+        if not budget.exhausted():
+            raise
+    context.mark_cut()
+    yield util.Uninferable
+
+
+def _raise_failures(results):
+    """Yield the given results, raising the error of a failure"""
+    for result in results:
+        if result.__class__ is exceptions._Failure:
+            raise result.error()
+        yield result
+
+
 def are_exclusive(stmt1, stmt2, exceptions=None): # pylint: disable=redefined-outer-name
     """return true if the two given statements are mutually exclusive
 
@@ -286,23 +317,58 @@ class NodeNG(object):
         :returns: The inferred values.
         :rtype: iterable
         """
+        return self._infer_results(context, kwargs, raise_failures=True)
+
+    def _infer_or_fail(self, context=None, **kwargs):
+        """Like :meth:`infer`, but give back a failure instead of raising.
+
+        When nothing can be inferred, the only value given is a
+        failure holding the error that :meth:`infer` would raise.
+        """
+        return self._infer_results(context, kwargs, raise_failures=False)
+
+    def _infer_results(self, context, kwargs, raise_failures):
+        if not context:
+            budget = MANAGER.inference_budget()
+            if budget is not None:
+                context = contextmod.InferenceContext(budget=budget)
+        budget = context.budget if context else None
+        if budget is not None and budget.spend():
+            context.mark_cut()
+            return iter((util.Uninferable,))
+
         if self._explicit_inference is not None:
             # explicit_inference is not bound, give it self explicitly
             try:
                 # pylint: disable=not-callable
-                return self._explicit_inference(self, context, **kwargs)
+                results = self._explicit_inference(self, context, **kwargs)
             except exceptions.UseInferenceDefault:
                 pass
+            else:
+                if budget is not None:
+                    return _within_budget(results, budget, context)
+                return results
 
         if not context:
-            return self._infer(context, **kwargs)
+            results = self._infer(context, **kwargs)
+            return _raise_failures(results) if raise_failures else results
 
         key = (self, context.lookupname,
                context.callcontext, context.boundnode)
-        if key in context.inferred:
-            return iter(context.inferred[key])
-
-        return context.cache_generator(key, self._infer(context, **kwargs))
+        inferred = context.inferred
+        if key in inferred:
+            results = inferred[key]
+            if inferred.__class__ is contextmod._SharedResults and key in inferred.dirty:
+                context.mark_cut()
+            if raise_failures and results and results[0].__class__ is exceptions._Failure:
+                return _raise_failures(results)
+            return iter(results)
+
+        results = context.cache_generator(key, self._infer(context, **kwargs),
+                                          raise_failures)
+        if budget is not None:
+            return _within_budget(results, budget, context)
+        return results
 
     def _repr_name(self):
         """Get a name for nice representation.
@@ -881,6 +947,98 @@ class NodeNG(object):
         return util.Uninferable
 
 
+class _WeakParent(object):
+    """Descriptor storing the parents of the nodes as weak references.
+
+    Only the parents stored while building the tree of a cached module are
+    weak references, see :func:`use_weak_parents`. The other ones, such as
+    the parents of the nodes of the temporary modules built by the brain
+    plugins, or of the nodes built by the inference, are strong references.
+    """
+
+    weak = False
+
+    def __get__(self, node, owner):
+        if node is None:
+            return self
+        parent = node.__dict__.get('parent')
+        if isinstance(parent, weakref.ref):
+            return parent()
+        return parent
+
+    def __set__(self, node, value):
+        if value is not None and self.weak:
+            value = weakref.ref(value)
+        node.__dict__['parent'] = value
+
+
+@contextlib.contextmanager
+def _module_parents(weak):
+    """Store the parents set meanwhile as weak references if asked to
+
+    Nothing changes when weak parents are not used.
+    """
+    descriptor = NodeNG.__dict__['parent']
+    if not isinstance(descriptor, _WeakParent):
+        yield
+        return
+    previous = descriptor.weak
+    descriptor.weak = weak
+    try:
+        yield
+    finally:
+        descriptor.weak = previous
+
+
+def _strengthen_parents(module):
+    """Replace the weak references to the parents of the nodes of a module"""
+    seen = set()
+    stack = [module]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, NodeNG) and value.__dict__ and id(value) not in seen:
+            # The nodes of the disposed modules have no attributes left.
+            seen.add(id(value))
+            for name, attribute in value.__dict__.items():
+                if name == 'parent':
+                    if isinstance(attribute, weakref.ref):
+                        value.__dict__['parent'] = attribute()
+                else:
+                    stack.append(attribute)
+            stack.extend(value.get_children())
+
+
+def use_weak_parents(enabled=True):
+    """Store the parents of the nodes of the named modules built from now on as weak references.
+
+    A node then does not keep its parent alive, so that the trees of the
+    modules which are built from files or with a name, whose nodes reference
+    their parents and their children, are freed by reference counting
+    instead of by the garbage collector. The parent of a node is None once
+    its tree is not referenced anymore, so the nodes must not be used once
+    their module is dropped from the cache of the manager. The modules which
+    are not cached, such as the temporary ones built without a name by the
+    brain plugins, keep strong parents.
+
+    When disabled, the plain ``parent`` attribute is restored, and the
+    parents of the nodes of the cached modules become strong references.
+
+    :param enabled: Whether the parents are weak references.
+    :type enabled: bool
+    """
+    installed = isinstance(NodeNG.__dict__['parent'], _WeakParent)
+    if enabled and not installed:
+        NodeNG.parent = _WeakParent()
+    elif not enabled and installed:
+        NodeNG.parent = None
+        for module in MANAGER.astroid_cache.values():
+            _strengthen_parents(module)
+
+
 class Statement(NodeNG):
     """Statement node adding a few attributes"""
     is_statement = True
@@ -1489,6 +1647,13 @@ class Arguments(mixins.AssignTypeMixin, NodeNG):
         :raises NoDefault: If there is no default value defined for the
             given argument.
         """
+        default = self._default_value(argname)
+        if default.__class__ is exceptions._Failure:
+            raise default.error()
+        return default
+
+    def _default_value(self, argname):
+        """Like :meth:`default_value`, but give back a failure instead of raising."""
         i = _find_arg(argname, self.args)[0]
         if i is not None:
             idx = i - (len(self.args) - len(self.defaults))
@@ -1497,7 +1662,8 @@ class Arguments(mixins.AssignTypeMixin, NodeNG):
         i = _find_arg(argname, self.kwonlyargs)[0]
         if i is not None and self.kw_defaults[i] is not None:
             return self.kw_defaults[i]
-        raise exceptions.NoDefault(func=self.parent, name=argname)
+        return exceptions._Failure(exceptions.NoDefault,
+                                   func=self.parent, name=argname)
 
     def is_argument(self, name):
         """Check if the given name is defined in the arguments.
@@ -4423,6 +4589,8 @@ class Unknown(mixins.AssignTypeMixin, NodeNG):
         """Inference on an Unknown node immediately terminates."""
         yield util.Uninferable
 
+    _infer_or_fail = infer
+
 
 # constants ##############################################################
 
@@ -21,12 +21,15 @@ from astroid import exceptions
 from astroid import decorators
 from astroid import node_classes
 from astroid import helpers
+from astroid import manager
 from astroid import nodes
 from astroid import util
 
 raw_building = util.lazy_import('raw_building')
 objects = util.lazy_import('objects')
 
+MANAGER = manager.AstroidManager()
+
 def _reflected_name(name):
     return "__r" + name[2:]
 
@@ -106,7 +109,7 @@ for _KEY, _IMPL in list(BIN_OP_IMPL.items()):
     BIN_OP_IMPL[_KEY + '='] = _IMPL
 
 
-@decorators.yes_if_nothing_inferred
+@decorators.inference_wrapper(if_nothing='uninferable')
 def const_infer_binary_op(self, opnode, operator, other, context, _):
     not_implemented = nodes.Const(NotImplemented)
     if isinstance(other, nodes.Const):
@@ -155,7 +158,7 @@ def _filter_uninferable_nodes(elts, context):
                     yield nodes.Unknown()
 
 
-@decorators.yes_if_nothing_inferred
+@decorators.inference_wrapper(if_nothing='uninferable')
 def tl_infer_binary_op(self, opnode, operator, other, context, method):
     not_implemented = nodes.Const(NotImplemented)
     if isinstance(other, self.__class__) and operator == '+':
@@ -183,7 +186,7 @@ nodes.Tuple.infer_binary_op = tl_infer_binary_op
 nodes.List.infer_binary_op = tl_infer_binary_op
 
 
-@decorators.yes_if_nothing_inferred
+@decorators.inference_wrapper(if_nothing='uninferable')
 def instance_class_infer_binary_op(self, opnode, operator, other, context, method):
     return method.infer_call_result(self, context)
 
@@ -204,10 +207,20 @@ The `context` argument is the current inference context which should be given
 to any intermediary inference necessary.
 """
 
-def _resolve_looppart(parts, asspath, context):
-    """recursive function to resolve multiple assignments on loops"""
+def _resolve_looppart(parts, asspath, context, combinations=1):
+    """recursive function to resolve multiple assignments on loops
+
+    *combinations* is the number of combinations of the values
+    inferred for the enclosing parts.
+    """
     asspath = asspath[:]
     index = asspath.pop(0)
+    parts = list(parts)
+    combinations *= len(parts)
+    limit = MANAGER.max_inferred_combinations
+    if limit is not None and combinations > limit:
+        yield util.Uninferable
+        return
     for part in parts:
         if part is util.Uninferable:
             continue
@@ -237,12 +250,12 @@ def _resolve_looppart(parts, asspath, context):
                 # search on each possibly inferred value
                 try:
                     for inferred in _resolve_looppart(assigned.infer(context),
-                                                      asspath, context):
+                                                      asspath, context, combinations):
                         yield inferred
                 except exceptions.InferenceError:
                     break
 
-@decorators.raise_if_nothing_inferred
+@decorators.inference_wrapper(if_nothing='raise')
 def for_assigned_stmts(self, node=None, context=None, asspath=None):
     if isinstance(self, nodes.AsyncFor) or getattr(self, 'is_async', False):
         # Skip inferring of async code for now
@@ -258,7 +271,7 @@ def for_assigned_stmts(self, node=None, context=None, asspath=None):
                                           asspath, context):
             yield inferred
     # Explicit StopIteration to return error information, see comment
-    # in raise_if_nothing_inferred.
+    # in inference_wrapper.
     return dict(node=self, unknown=node,
                 assign_path=asspath, context=context)
 
@@ -328,13 +341,12 @@ def _arguments_infer_argname(self, name, context):
         return
     # if there is a default value, yield it. And then yield Uninferable to reflect
     # we can't guess given argument value
-    try:
+    default = self._default_value(name)
+    if default.__class__ is not exceptions._Failure:
         context = contextmod.copy_context(context)
-        for inferred in self.default_value(name).infer(context):
+        for inferred in default.infer(context):
             yield inferred
-        yield util.Uninferable
-    except exceptions.NoDefault:
-        yield util.Uninferable
+    yield util.Uninferable
 
 
 def arguments_assigned_stmts(self, node=None, context=None, asspath=None):
@@ -350,7 +362,7 @@ def arguments_assigned_stmts(self, node=None, context=None, asspath=None):
 nodes.Arguments.assigned_stmts = arguments_assigned_stmts
 
 
-@decorators.raise_if_nothing_inferred
+@decorators.inference_wrapper(if_nothing='raise')
 def assign_assigned_stmts(self, node=None, context=None, asspath=None):
     if not asspath:
         yield self.value
@@ -358,7 +370,7 @@ def assign_assigned_stmts(self, node=None, context=None, asspath=None):
     for inferred in _resolve_asspart(self.value.infer(context), asspath, context):
         yield inferred
     # Explicit StopIteration to return error information, see comment
-    # in raise_if_nothing_inferred.
+    # in inference_wrapper.
     return dict(node=self, unknown=node,
                 assign_path=asspath, context=context)
 
@@ -375,10 +387,20 @@ nodes.AnnAssign.assigned_stmts = assign_annassigned_stmts
 nodes.AugAssign.assigned_stmts = assign_assigned_stmts
 
 
-def _resolve_asspart(parts, asspath, context):
-    """recursive function to resolve multiple assignments"""
+def _resolve_asspart(parts, asspath, context, combinations=1):
+    """recursive function to resolve multiple assignments
+
+    *combinations* is the number of combinations of the values
+    inferred for the enclosing parts.
+    """
     asspath = asspath[:]
     index = asspath.pop(0)
+    parts = list(parts)
+    combinations *= len(parts)
+    limit = MANAGER.max_inferred_combinations
+    if limit is not None and combinations > limit:
+        yield util.Uninferable
+        return
     for part in parts:
         if hasattr(part, 'getitem'):
             index_node = nodes.Const(index)
@@ -399,21 +421,22 @@ def _resolve_asspart(parts, asspath, context):
                 # possibly inferred value
                 try:
                     for inferred in _resolve_asspart(assigned.infer(context),
-                                                     asspath, context):
+                                                     asspath, context, combinations):
                         yield inferred
                 except exceptions.InferenceError:
                     return
 
 
-@decorators.raise_if_nothing_inferred
+@decorators.inference_wrapper(if_nothing='raise')
 def excepthandler_assigned_stmts(self, node=None, context=None, asspath=None):
-    for assigned in node_classes.unpack_infer(self.type):
+    for assigned in node_classes.unpack_infer(
+            self.type, contextmod.budget_context(context)):
         if isinstance(assigned, nodes.ClassDef):
             assigned = objects.ExceptionInstance(assigned)
 
         yield assigned
     # Explicit StopIteration to return error information, see comment
-    # in raise_if_nothing_inferred.
+    # in inference_wrapper.
     return dict(node=self, unknown=node,
                 assign_path=asspath, context=context)
 
@@ -474,7 +497,7 @@ def _infer_context_manager(self, mgr, context):
             yield result
 
 
-@decorators.raise_if_nothing_inferred
+@decorators.inference_wrapper(if_nothing='raise')
 def with_assigned_stmts(self, node=None, context=None, asspath=None):
     """Infer names and other nodes from a *with* statement.
 
@@ -531,14 +554,14 @@ def with_assigned_stmts(self, node=None, context=None, asspath=None):
                         assign_path=asspath, context=context))
             yield obj
     # Explicit StopIteration to return error information, see comment
-    # in raise_if_nothing_inferred.
+    # in inference_wrapper.
     return dict(node=self, unknown=node,
                 assign_path=asspath, context=context)
 
 nodes.With.assigned_stmts = with_assigned_stmts
 
 
-@decorators.yes_if_nothing_inferred
+@decorators.inference_wrapper(if_nothing='uninferable')
 def starred_assigned_stmts(self, node=None, context=None, asspath=None):
     """
     Arguments:
@@ -10,18 +10,25 @@
 (build_* functions) or from living object (object_build_* functions)
 """
 
+import gc
+import hashlib
 import inspect
 import logging
 import os
+import pickle
+import platform
 import sys
 import types
 
 import six
 
+from astroid import __pkginfo__
 from astroid import bases
 from astroid import manager
+from astroid import mixins
 from astroid import node_classes
 from astroid import nodes
+from astroid import scoped_nodes
 
 
 MANAGER = manager.AstroidManager()
@@ -87,6 +94,12 @@ def attach_import_node(node, modname, membername):
     _attach_local_node(node, from_node, membername)
 
 
+def _docstring(doc):
+    # The __doc__ of some builtin types, such as wrapper_descriptor,
+    # is the descriptor of the __doc__ of their instances.
+    return doc if isinstance(doc, str) else None
+
+
 def build_module(name, doc=None):
     """create and initialize a astroid Module node"""
     node = nodes.Module(name, doc, pure_python=False)
@@ -97,7 +110,7 @@ def build_module(name, doc=None):
 
 def build_class(name, basenames=(), doc=None):
     """create and initialize a astroid ClassDef node"""
-    node = nodes.ClassDef(name, doc)
+    node = nodes.ClassDef(name, _docstring(doc))
     for base in basenames:
         basenode = nodes.Name()
         basenode.name = base
@@ -110,7 +123,7 @@ def build_function(name, args=None, defaults=None, doc=None):
     """create and initialize a astroid FunctionDef node"""
     args, defaults = args or [], defaults or []
     # first argument is now a list of decorators
-    func = nodes.FunctionDef(name, doc)
+    func = nodes.FunctionDef(name, _docstring(doc))
     func.args = argsnode = nodes.Arguments()
     argsnode.args = []
     for arg in args:
@@ -390,8 +403,6 @@ def _astroid_bootstrapping(astroid_builtin=None):
         else:
             _CONST_PROXY[cls] = proxy
 
-_astroid_bootstrapping()
-
 # TODO : find a nicer way to handle this situation;
 # However __proxied introduced an
 # infinite recursion (see https://bugs.launchpad.net/pylint/+bug/456870)
@@ -399,19 +410,206 @@ def _set_proxied(const):
     return _CONST_PROXY[const.value.__class__]
 nodes.Const._proxied = property(_set_proxied)
 
-_GeneratorType = nodes.ClassDef(types.GeneratorType.__name__, types.GeneratorType.__doc__)
-_GeneratorType.parent = MANAGER.astroid_cache[six.moves.builtins.__name__]
-bases.Generator._proxied = _GeneratorType
-Astroid_BUILDER.object_build(bases.Generator._proxied, types.GeneratorType)
-
-_builtins = MANAGER.astroid_cache[six.moves.builtins.__name__]
 BUILTIN_TYPES = (types.GetSetDescriptorType, types.GeneratorType,
                  types.MemberDescriptorType, type(None), type(NotImplemented),
                  types.FunctionType, types.MethodType,
                  types.BuiltinFunctionType, types.ModuleType, types.TracebackType)
-for _type in BUILTIN_TYPES:
-    if _type.__name__ not in _builtins:
-        cls = nodes.ClassDef(_type.__name__, _type.__doc__)
-        cls.parent = MANAGER.astroid_cache[six.moves.builtins.__name__]
-        Astroid_BUILDER.object_build(cls, _type)
-        _builtins[_type.__name__] = cls
+
+
+def _build_builtin_types(astroid_builtin):
+    """Build the generator class and the classes of the builtin types
+    which are not defined in the builtins module.
+    """
+    generator_type = build_class(types.GeneratorType.__name__,
+                                 doc=types.GeneratorType.__doc__)
+    generator_type.parent = astroid_builtin
+    Astroid_BUILDER.object_build(generator_type, types.GeneratorType)
+    for _type in BUILTIN_TYPES:
+        if _type.__name__ not in astroid_builtin:
+            cls = build_class(_type.__name__, doc=_type.__doc__)
+            cls.parent = astroid_builtin
+            Astroid_BUILDER.object_build(cls, _type)
+            astroid_builtin[_type.__name__] = cls
+    return generator_type
+
+
+### builtins snapshot ##########################################################
+
+# Bump it when the content of the snapshot changes.
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_PLAIN_TYPES = (dict, list, tuple, set, frozenset, str, bytes,
+                         int, float, complex, bool, type(None))
+
+
+def _snapshot_prefix():
+    """Get the start of the names of the builtins snapshots of the running interpreter"""
+    return 'builtins-%s%d%d-' % (platform.python_implementation().lower(),
+                                 sys.version_info[0], sys.version_info[1])
+
+
+def _snapshot_path():
+    """Get the path of the builtins snapshot for the running interpreter.
+
+    The snapshots are stored in the directory given by
+    :attr:`AstroidManager.builtins_snapshot_dir`, None is returned
+    when it is not set.
+    """
+    cache_dir = MANAGER.builtins_snapshot_dir
+    if not cache_dir:
+        return None
+    key = [sys.version, platform.python_implementation(),
+           __pkginfo__.version, str(_SNAPSHOT_VERSION)]
+    # The node classes are pickled, so any change in their modules
+    # can make a snapshot stale.
+    for module in (bases, mixins, node_classes, scoped_nodes, sys.modules[__name__]):
+        try:
+            key.append(str(os.path.getmtime(module.__file__)))
+        except (AttributeError, OSError):
+            return None
+    digest = hashlib.sha1('\n'.join(key).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, '%s%s.pickle' % (_snapshot_prefix(), digest[:16]))
+
+
+def _snapshot_roots():
+    return (six.moves.builtins, types.GeneratorType) + BUILTIN_TYPES
+
+
+def _living_object_references(trees):
+    """Map the ids of the living objects held by the given trees
+    to their attribute path from the snapshot roots.
+    """
+    references = {}
+    done = set()
+
+    def walk(node, obj, path):
+        done.add(node)
+        for name, values in node.locals.items():
+            for child in values:
+                if isinstance(child, nodes.EmptyNode):
+                    references.setdefault(id(child.object), path + (name,))
+                elif isinstance(child, nodes.ClassDef) and child not in done:
+                    try:
+                        member = getattr(obj, name)
+                    except AttributeError:
+                        continue
+                    walk(child, member, path + (name,))
+
+    # Start with the builtin types, which are also part of the builtins module.
+    for index, (tree, root) in reversed(list(enumerate(zip(trees, _snapshot_roots())))):
+        if isinstance(tree, nodes.ClassDef) or index == 0:
+            walk(tree, root, (index,))
+    return references
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """Pickle the builtins trees, storing the living objects held by
+    their EmptyNode as the path to get them back."""
+
+    def __init__(self, stream, references):
+        super(_SnapshotPickler, self).__init__(stream, pickle.HIGHEST_PROTOCOL)
+        self._references = references
+
+    def persistent_id(self, obj):
+        if obj is _marker:
+            return ('marker',)
+        if (isinstance(obj, _SNAPSHOT_PLAIN_TYPES + (node_classes.NodeNG,))
+                or obj is NotImplemented or obj is Ellipsis):
+            return None
+        if isinstance(obj, type) and obj.__module__.startswith('astroid.'):
+            return None
+        try:
+            return self._references[id(obj)]
+        except KeyError:
+            raise pickle.PicklingError('No reference to %r' % (obj, ))
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+
+    def persistent_load(self, pid):
+        if pid == ('marker',):
+            return _marker
+        obj = _snapshot_roots()[pid[0]]
+        for name in pid[1:]:
+            obj = getattr(obj, name)
+        return obj
+
+
+def _load_builtins_snapshot(path):
+    try:
+        with open(path, 'rb') as stream:
+            return _SnapshotUnpickler(stream).load()
+    except Exception: # pylint: disable=broad-except
+        # A missing, stale or corrupted snapshot, so that the builtins
+        # are built by introspection instead.
+        return None
+
+
+def _prune_builtins_snapshots(path):
+    """Remove the snapshots of the running interpreter other than the given one
+
+    They were saved by other versions of astroid, or before a node
+    module changed, and won't be loaded anymore.
+    """
+    directory, name = os.path.split(path)
+    prefix = _snapshot_prefix()
+    for other in os.listdir(directory):
+        if (other != name and other.startswith(prefix)
+                and other.endswith('.pickle')):
+            try:
+                os.remove(os.path.join(directory, other))
+            except OSError:
+                pass
+
+
+def _dump_builtins_snapshot(path, astroid_builtin, generator_type):
+    tmp_path = '%s.%d.tmp' % (path, os.getpid())
+    trees = [astroid_builtin, generator_type]
+    trees += [astroid_builtin.locals.get(_type.__name__, [None])[0]
+              for _type in BUILTIN_TYPES]
+    try:
+        references = _living_object_references(trees)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'wb') as stream:
+            _SnapshotPickler(stream, references).dump((astroid_builtin, generator_type))
+        os.replace(tmp_path, path)
+        _prune_builtins_snapshots(path)
+    except Exception: # pylint: disable=broad-except
+        _LOG.debug('Unable to save the builtins snapshot', exc_info=True)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _build_builtins():
+    """Build the builtins module and the generator class.
+
+    They are loaded from a snapshot saved by a previous run of the same
+    interpreter if :attr:`AstroidManager.builtins_snapshot_dir` is set
+    and the snapshot exists, and built by introspection otherwise.
+    """
+    path = _snapshot_path()
+    # The trees are made of many objects, collecting them while they
+    # are built only slows things down.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        snapshot = _load_builtins_snapshot(path) if path else None
+        if snapshot is not None:
+            astroid_builtin, generator_type = snapshot
+            MANAGER.cache_module(astroid_builtin)
+            _astroid_bootstrapping(astroid_builtin)
+            return astroid_builtin, generator_type
+        _astroid_bootstrapping()
+        astroid_builtin = MANAGER.astroid_cache[six.moves.builtins.__name__]
+        generator_type = _build_builtin_types(astroid_builtin)
+        if path:
+            _dump_builtins_snapshot(path, astroid_builtin, generator_type)
+        return astroid_builtin, generator_type
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+_builtins, _GeneratorType = _build_builtins()
+bases.Generator._proxied = _GeneratorType
@@ -15,6 +15,7 @@ import _ast
 
 import astroid
 from astroid import nodes
+from astroid import scoped_nodes
 
 
 
@@ -77,16 +78,18 @@ CONTEXTS = {_ast.Load: astroid.Load,
             _ast.Param: astroid.Store}
 
 
-def _get_doc(node):
+def _get_doc(node, lazy=False):
 
     try:
         if PY37 and hasattr(node, 'docstring'):
             doc = node.docstring
+            if lazy and doc is not None:
+                doc = scoped_nodes.LAZY_DOCSTRING
             return node, doc
         elif (node.body
               and isinstance(node.body[0], _ast.Expr)
               and isinstance(node.body[0].value, _ast.Str)):
-            doc = node.body[0].value.s
+            doc = scoped_nodes.LAZY_DOCSTRING if lazy else node.body[0].value.s
             node.body = node.body[1:]
             return node, doc
     except IndexError:
@@ -111,7 +114,12 @@ def _get_context(node):
 
 
 class TreeRebuilder(object):
-    """Rebuilds the _ast tree to become an Astroid tree"""
+    """Rebuilds the _ast tree to become an Astroid tree
+
+    The tree can come from any parser given to the builder, as long as
+    it is made of the node classes of the _ast module of the running
+    interpreter.
+    """
 
     def __init__(self, manager):
         self._manager = manager
@@ -119,10 +127,11 @@ class TreeRebuilder(object):
         self._import_from_nodes = []
         self._delayed_assattr = []
         self._visit_meths = {}
+        self._lazy_docstrings = manager.lazy_docstrings
 
     def visit_module(self, node, modname, modpath, package):
         """visit a Module node by returning a fresh instance of it"""
-        node, doc = _get_doc(node)
+        node, doc = _get_doc(node, self._lazy_docstrings)
         newnode = nodes.Module(name=modname, doc=doc, file=modpath,
                                path=[modpath],
                                package=package, parent=None)
@@ -305,14 +314,14 @@ class TreeRebuilder(object):
 
     def visit_classdef(self, node, parent, newstyle=None):
         """visit a ClassDef node to become astroid"""
-        node, doc = _get_doc(node)
+        node, doc = _get_doc(node, self._lazy_docstrings)
         newnode = nodes.ClassDef(node.name, doc, node.lineno,
                                  node.col_offset, parent)
         metaclass = None
         if PY3:
             for keyword in node.keywords:
                 if keyword.arg == 'metaclass':
-                    metaclass = self.visit(keyword, newnode).value
+                    metaclass = self.visit(keyword.value, newnode)
                     break
         if node.decorator_list:
             decorators = self.visit_decorators(node, newnode)
@@ -472,7 +481,7 @@ class TreeRebuilder(object):
     def _visit_functiondef(self, cls, node, parent):
         """visit an FunctionDef node to become astroid"""
         self._global_names.append({})
-        node, doc = _get_doc(node)
+        node, doc = _get_doc(node, self._lazy_docstrings)
         newnode = cls(node.name, doc, node.lineno,
                       node.col_offset, parent)
         if node.decorator_list:
@@ -14,10 +14,12 @@ new local scope in the language definition : Module, ClassDef, FunctionDef (and
 Lambda, GeneratorExp, DictComp and SetComp to some extent).
 """
 
+import ast
 import builtins
 import sys
 import io
 import itertools
+import tokenize
 import warnings
 from typing import Optional, List
 
@@ -91,6 +93,214 @@ def function_to_method(n, klass):
 
 
 MANAGER = manager.AstroidManager()
+
+
+def _owned_nodes(value, module):
+    """Get the nodes of the given module held by the given attribute value."""
+    if isinstance(value, node_classes.NodeNG):
+        if value.root() is module:
+            yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _owned_nodes(item, module)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _owned_nodes(item, module)
+
+
+def _build_name_tables(module):
+    """Infer the values of the names bound at the level of a module and of its classes
+
+    The scopes are walked once, in statement order, the inferences sharing
+    the cache of their results. The values cut short by a recursion check
+    or by the budget of an inference depend on where the name is inferred
+    from, they are left out of the tables, like the names which can't be
+    inferred.
+
+    :returns: The tables of the scopes of the module, mapping their names
+        to the statements binding them and to their values.
+    :rtype: dict(NodeNG, dict(str, tuple(list(NodeNG), tuple)))
+    """
+    tables = {}
+    module._name_tables = (MANAGER._evictions, tables)
+    inferred = contextmod._SharedResults()
+    for scope in itertools.chain((module,), module.nodes_of_class(ClassDef)):
+        table = tables[scope] = {}
+        for name in list(scope.locals):
+            if scope is not module:
+                stmts = scope._getattr(name)
+                if stmts.__class__ is exceptions._Failure:
+                    continue
+            elif module.pure_python:
+                stmts = module._filter_stmts(module.locals[name], module, 0)
+            else:
+                # The living objects aren't filtered, see builtin_lookup.
+                stmts = module.locals[name]
+            inferred.next_inference()
+            cuts = inferred.cuts
+            context = contextmod.InferenceContext(inferred=inferred,
+                                                  budget=MANAGER.inference_budget())
+            context.lookupname = name
+            try:
+                values = tuple(bases._infer_stmts(stmts, context, frame=scope,
+                                                  raise_failures=False))
+            except exceptions.AstroidError:
+                # Raised again if the name is inferred on demand.
+                continue
+            if inferred.cuts == cuts:
+                table[name] = (list(stmts), values)
+    return module._name_tables
+
+
+def _tabulated_values(scope, name, stmts):
+    """Get the values of a name of a module or class scope from its table
+
+    See :meth:`Module.tabulate_names`, the tables are built again when
+    a module was evicted from the cache since they were built.
+
+    :returns: The values of the name, or None if they weren't
+        tabulated for the given statements.
+    :rtype: tuple or None
+    """
+    module = scope.root()
+    tables = module.__dict__.get('_name_tables')
+    if tables is None:
+        return None
+    if tables[0] != MANAGER._evictions:
+        tables = _build_name_tables(module)
+    entry = tables[1].get(scope, {}).get(name)
+    if entry is not None and entry[0] == list(stmts):
+        return entry[1]
+    return None
+
+
+LAZY_DOCSTRING = object()
+"""Docstring left in the source by the rebuilder, to be read on first access.
+
+See :attr:`AstroidManager.lazy_docstrings`.
+"""
+
+_DOCSTRING_SKIPPED_TOKENS = frozenset((tokenize.NEWLINE, tokenize.NL, tokenize.INDENT,
+                                       tokenize.COMMENT, tokenize.ENCODING))
+
+
+def _locate_docstrings(module):
+    """Locate the docstrings of a module in its source, in a single pass.
+
+    :returns: The encoding of the source, and the start and end offsets
+        of the docstrings in the source, keyed by the line of the keyword of
+        their definition and by the line of its first decorator, 0 standing
+        for the module.
+    :rtype: tuple(str, dict(int, tuple(int, int)))
+    """
+    spans = {}
+    stream = module.stream()
+    if stream is None:
+        return None, spans
+    lines = []
+    line_offsets = []
+    def readline():
+        line = stream.readline()
+        line_offsets.append(line_offsets[-1] + len(lines[-1]) if lines else 0)
+        lines.append(line)
+        return line
+    def offset(position):
+        row, column = position
+        text = lines[row - 1].decode(encoding)[:column]
+        return line_offsets[row - 1] + len(text.encode(encoding))
+
+    encoding = 'utf-8'
+    # The keys of the definition whose docstring may come next.
+    keys = (0,)
+    first = last = None
+    # The depth of the brackets in the header of a definition.
+    depth = None
+    decorator_line = None
+    statement_start = True
+    with stream:
+        for token in tokenize.tokenize(readline):
+            kind, string = token.type, token.string
+            if kind == tokenize.ENCODING:
+                encoding = string
+                continue
+            if keys is not None:
+                if kind == tokenize.STRING:
+                    first = first or token.start
+                    last = token.end
+                    continue
+                if first is None and kind in _DOCSTRING_SKIPPED_TOKENS:
+                    continue
+                if first is not None:
+                    span = (offset(first), offset(last))
+                    for key in keys:
+                        spans[key] = span
+                keys = first = last = None
+            if depth is not None:
+                if kind == tokenize.OP:
+                    if string in ('(', '[', '{'):
+                        depth += 1
+                    elif string in (')', ']', '}'):
+                        depth -= 1
+                    elif string == ':' and not depth:
+                        depth = None
+                        keys = definition_keys
+            elif kind == tokenize.NAME and string in ('def', 'class'):
+                definition_keys = (token.start[0],)
+                if decorator_line is not None:
+                    definition_keys += (decorator_line,)
+                decorator_line = None
+                depth = 0
+            elif (kind == tokenize.OP and string == '@' and statement_start
+                  and decorator_line is None):
+                decorator_line = token.start[0]
+            if kind not in (tokenize.NL, tokenize.COMMENT):
+                statement_start = kind in (tokenize.NEWLINE, tokenize.INDENT,
+                                           tokenize.DEDENT)
+    return encoding, spans
+
+
+def _read_docstring(node):
+    """Read the docstring of the given module, class or function from its source.
+
+    The docstrings of a module are located the first time one of them
+    is read, then each one is read from its own part of the source.
+    """
+    module = node.root()
+    located = module.__dict__.get('_docstring_spans')
+    if located is None:
+        located = module._docstring_spans = _locate_docstrings(module)
+    encoding, spans = located
+    span = spans.get(0 if node is module else node.lineno)
+    if span is None:
+        return None
+    stream = module.stream()
+    if stream is None:
+        return None
+    with stream:
+        stream.seek(span[0])
+        source = stream.read(span[1] - span[0])
+    return ast.literal_eval(source.decode(encoding))
+
+
+class _Docstring(object):
+    """The docstring of a module, a class or a function.
+
+    The docstrings left in the source by the rebuilder are read
+    the first time they are accessed.
+    """
+
+    def __get__(self, node, owner):
+        if node is None:
+            return self
+        doc = node.__dict__.get('doc')
+        if doc is LAZY_DOCSTRING:
+            doc = node.__dict__['doc'] = _read_docstring(node)
+        return doc
+
+    def __set__(self, node, value):
+        node.__dict__['doc'] = value
+
+
 def builtin_lookup(name):
     """lookup a name into the builtin module
     return the list of matching statements and the astroid for the builtin
@@ -326,11 +536,7 @@ class Module(LocalsDictNodeNG):
 
     :type: bool or None
     """
-    globals = None
-    """A map of the name of a global variable to the node defining the global.
-
-    :type: dict(str, NodeNG)
-    """
+    _wildcard_import_nodes = ()
 
     # Future imports
     future_imports = None
@@ -353,6 +559,7 @@ class Module(LocalsDictNodeNG):
 
     _other_fields = ('name', 'doc', 'file', 'path', 'package',
                      'pure_python', 'future_imports')
+    doc = _Docstring()
     _other_other_fields = ('locals', 'globals')
 
     def __init__(self, name, doc, file=None,
@@ -388,19 +595,49 @@ class Module(LocalsDictNodeNG):
         self.package = package
         self.parent = parent
         self.pure_python = pure_python
-        self.locals = self.globals = {}
-        """A map of the name of a local variable to the node defining the local.
-
-        :type: dict(str, NodeNG)
-        """
+        self.locals = {}
         self.body = []
         """The contents of the module.
 
         :type: list(NodeNG) or None
         """
         self.future_imports = set()
+        self._wildcard_import_nodes = []
+        """The wildcard imports whose names are not yet in the locals.
+
+        :type: list(ImportFrom)
+        """
     # pylint: enable=redefined-builtin
 
+    @property
+    def locals(self):
+        """A map of the name of a local variable to the node defining the local.
+
+        The names imported through wildcard imports are added
+        the first time this is accessed.
+
+        :type: dict(str, NodeNG)
+        """
+        if self._wildcard_import_nodes:
+            self._resolve_wildcard_imports()
+        return self._locals
+
+    @locals.setter
+    def locals(self, value):
+        self._locals = value
+
+    globals = locals
+
+    def _resolve_wildcard_imports(self):
+        """Store the names of the pending wildcard imports to the locals."""
+        from astroid.builder import AstroidBuilder
+        # Swap the pending list first, since adding the names
+        # accesses the locals again.
+        pending, self._wildcard_import_nodes = self._wildcard_import_nodes, []
+        builder = AstroidBuilder(MANAGER)
+        for node in pending:
+            builder.add_wildcard_names_to_locals(node)
+
     def postinit(self, body=None):
         """Do some setup after initialisation.
 
@@ -426,6 +663,71 @@ class Module(LocalsDictNodeNG):
         """
         return self._get_stream()
 
+    def dispose(self):
+        """Break the reference cycles between the nodes of the module.
+
+        The module is then freed as soon as it is not referenced anymore,
+        instead of waiting for the garbage collector. The nodes of the module,
+        including the ones referenced by other modules, are unusable afterwards.
+        The assignments of the module to the attributes of other modules are
+        removed from their locals.
+        """
+        self.__dict__.pop('_name_tables', None)
+        owned = []
+        seen = set()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            owned.append(node)
+            stack.extend(node.get_children())
+            # The nodes which are not children, such as the keywords
+            # of the classes, are only reachable through the scopes.
+            for name, value in node.__dict__.items():
+                if name != 'parent':
+                    stack.extend(_owned_nodes(value, self))
+        for node in owned:
+            # The attribute assignments stored in the locals of the other
+            # modules are removed from them, see AstroidBuilder.delayed_assattr.
+            for _, iattrs in node.__dict__.get('_stored_in', ()):
+                values = iattrs.get(node.attrname)
+                if values and node in values:
+                    values.remove(node)
+                    if not values:
+                        del iattrs[node.attrname]
+            node.__dict__.clear()
+
+    def to_bytes(self):
+        """Serialize the module, so that it can be loaded without parsing it.
+
+        The format is described in :mod:`astroid.serialization`.
+
+        :returns: The serialized module.
+        :rtype: bytes
+
+        :raises AstroidError: If the module cannot be serialized,
+            as the modules built from living objects.
+        """
+        from astroid import serialization
+        return serialization.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Load a module serialized with :meth:`to_bytes`.
+
+        :param data: The serialized module.
+        :type data: bytes
+
+        :returns: The loaded module.
+        :rtype: Module
+
+        :raises AstroidBuildingError: If the data is not a serialized module.
+        """
+        from astroid import serialization
+        return serialization.loads(data)
+
     def block_range(self, lineno):
         """Get a range from where this node starts to where this node ends.
 
@@ -513,12 +815,34 @@ class Module(LocalsDictNodeNG):
         context = contextmod.copy_context(context)
         context.lookupname = name
         try:
-            return bases._infer_stmts(self.getattr(name, context),
-                                      context, frame=self)
+            stmts = self.getattr(name, context)
+            values = _tabulated_values(self, name, stmts)
+            if values is not None:
+                return node_classes._raise_failures(values)
+            return bases._infer_stmts(stmts, context, frame=self)
         except exceptions.AttributeInferenceError as error:
             util.reraise(exceptions.InferenceError(
                 error.message, target=self, attribute=name, context=context))
 
+    def tabulate_names(self):
+        """Infer the values of the names of this module and of its classes at once
+
+        The names bound at the level of the module and of its classes are
+        inferred in statement order, and their values are kept in a table
+        per scope. The inferences of these names, and the attribute lookups
+        on the module and on its classes, which see the same statements as
+        a table then give back its values instead of inferring them again.
+        This is worth it when most of the names of the module are inferred,
+        like when the module is checked.
+
+        The values are the ones inferred when the tables are built, the
+        assignments to the attributes of the module done by the modules
+        built afterwards are only seen by the names they bind. The tables
+        are dropped when the module is disposed of or updated, and built
+        again when another module is evicted from the cache.
+        """
+        _build_name_tables(self)
+
     def fully_defined(self):
         """Check if this module has been build from a .py file.
 
@@ -1239,6 +1563,7 @@ class FunctionDef(mixins.MultiLineBlockMixin, node_classes.Statement, Lambda):
     """
     # attributes below are set by the builder module or by raw factories
     _other_fields = ('name', 'doc')
+    doc = _Docstring()
     _other_other_fields = ('locals', '_type')
     _type = None
 
@@ -1571,7 +1896,9 @@ class FunctionDef(mixins.MultiLineBlockMixin, node_classes.Statement, Lambda):
                 yield node_classes.Const(None)
             else:
                 try:
-                    for inferred in returnnode.value.infer(context):
+                    for inferred in returnnode.value._infer_or_fail(context):
+                        if inferred.__class__ is exceptions._Failure:
+                            inferred = util.Uninferable
                         yield inferred
                 except exceptions.InferenceError:
                     yield util.Uninferable
@@ -1753,6 +2080,7 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
                          "Possible values are: class, metaclass, exception.\n\n"
                          ":type: str"))
     _other_fields = ('name', 'doc')
+    doc = _Docstring()
     _other_other_fields = ('locals', '_newstyle')
     _newstyle = None
 
@@ -1775,7 +2103,14 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
         :param parent: The parent node in the syntax tree.
         :type parent: NodeNG or None
         """
-        self.instance_attrs = {}
+        self._instance_attrs = {}
+        self._delayed_assattr = []
+        """Attribute assignments from methods, not yet added to the
+        instance attributes.
+
+        :type: list(AssignAttr)
+        """
+
         self.locals = {}
         """A map of the name of a local variable to the node defining it.
 
@@ -1821,6 +2156,29 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
         for local_name, node in self.implicit_locals():
             self.add_local_node(node, local_name)
 
+    @property
+    def instance_attrs(self):
+        """A map of the name of an instance attribute to its assignments.
+
+        The attribute assignments found in the methods of the class
+        are resolved the first time this is accessed.
+
+        :type: dict(str, list(NodeNG))
+        """
+        if self._delayed_assattr:
+            from astroid.builder import AstroidBuilder
+            # Swap the pending list first, since resolving the assignments
+            # can end up accessing this property again.
+            delayed, self._delayed_assattr = self._delayed_assattr, []
+            builder = AstroidBuilder(MANAGER)
+            for node in delayed:
+                builder.delayed_assattr(node)
+        return self._instance_attrs
+
+    @instance_attrs.setter
+    def instance_attrs(self, value):
+        self._instance_attrs = value
+
     def implicit_locals(self):
         """Get implicitly defined class definition locals.
 
@@ -1873,7 +2231,7 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
             if base._newstyle_impl(context):
                 self._newstyle = True
                 break
-        klass = self.declared_metaclass()
+        klass = self.declared_metaclass(context=context)
         # could be any callable, we'd need to infer the result of klass(name,
         # bases, dict).  punt if it's not a class node.
         if klass is not None and isinstance(klass, ClassDef):
@@ -2186,6 +2544,13 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
         :raises AttributeInferenceError: If no attribute with this name
             can be found in this class or parent classes.
         """
+        values = self._instance_attr(name, context)
+        if values.__class__ is exceptions._Failure:
+            raise values.error()
+        return values
+
+    def _instance_attr(self, name, context=None):
+        """Like :meth:`instance_attr`, but give back a failure instead of raising."""
         # Return a copy, so we don't modify self.instance_attrs,
         # which could lead to infinite loop.
         values = list(self.instance_attrs.get(name, []))
@@ -2195,8 +2560,8 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
         values = [n for n in values if not isinstance(n, node_classes.DelAttr)]
         if values:
             return values
-        raise exceptions.AttributeInferenceError(target=self, attribute=name,
-                                                 context=context)
+        return exceptions._Failure(exceptions.AttributeInferenceError,
+                                   target=self, attribute=name, context=context)
 
     def instantiate_class(self):
         """Get an :class:`Instance` of the :class:`ClassDef` node.
@@ -2248,6 +2613,13 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
 
         :raises AttributeInferenceError: If the attribute cannot be inferred.
         """
+        values = self._getattr(name, context, class_context)
+        if values.__class__ is exceptions._Failure:
+            raise values.error()
+        return values
+
+    def _getattr(self, name, context=None, class_context=True):
+        """Like :meth:`getattr`, but give back a failure instead of raising."""
         values = self.locals.get(name, [])
         if name in self.special_attributes and class_context and not values:
             result = [self.special_attributes.lookup(name)]
@@ -2266,15 +2638,15 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
             values += self._metaclass_lookup_attribute(name, context)
 
         if not values:
-            raise exceptions.AttributeInferenceError(target=self, attribute=name,
-                                                     context=context)
+            return exceptions._Failure(exceptions.AttributeInferenceError,
+                                       target=self, attribute=name, context=context)
         return values
 
     def _metaclass_lookup_attribute(self, name, context):
         """Search the given name in the implicit and the explicit metaclass."""
         attrs = set()
         implicit_meta = self.implicit_metaclass()
-        metaclass = self.metaclass()
+        metaclass = self.metaclass(context=context)
         for cls in {implicit_meta, metaclass}:
             if cls and cls != self and isinstance(cls, ClassDef):
                 cls_attributes = self._get_attribute_from_metaclass(
@@ -2283,10 +2655,8 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
         return attrs
 
     def _get_attribute_from_metaclass(self, cls, name, context):
-        try:
-            attrs = cls.getattr(name, context=context,
-                                class_context=True)
-        except exceptions.AttributeInferenceError:
+        attrs = cls._getattr(name, context=context, class_context=True)
+        if attrs.__class__ is exceptions._Failure:
             return
 
         for attr in bases._infer_stmts(attrs, context, frame=cls):
@@ -2325,27 +2695,36 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
         # instance
         context = contextmod.copy_context(context)
         context.lookupname = name
+        attrs = self._getattr(name, context, class_context=class_context)
         try:
-            attrs = self.getattr(name, context, class_context=class_context)
-            for inferred in bases._infer_stmts(attrs, context, frame=self):
-                # yield Uninferable object instead of descriptors when necessary
-                if (not isinstance(inferred, node_classes.Const)
-                        and isinstance(inferred, bases.Instance)):
-                    try:
-                        inferred._proxied.getattr('__get__', context)
-                    except exceptions.AttributeInferenceError:
-                        yield inferred
-                    else:
-                        yield util.Uninferable
-                else:
-                    yield function_to_method(inferred, self)
-        except exceptions.AttributeInferenceError as error:
-            if not name.startswith('__') and self.has_dynamic_getattr(context):
-                # class handle some dynamic attributes, return a Uninferable object
-                yield util.Uninferable
+            if attrs.__class__ is exceptions._Failure:
+                error = attrs.error()
             else:
-                util.reraise(exceptions.InferenceError(
-                    error.message, target=self, attribute=name, context=context))
+                values = _tabulated_values(self, name, attrs)
+                if values is None:
+                    values = bases._infer_stmts(attrs, context, frame=self)
+                else:
+                    values = node_classes._raise_failures(values)
+                for inferred in values:
+                    # yield Uninferable object instead of descriptors when necessary
+                    if (not isinstance(inferred, node_classes.Const)
+                            and isinstance(inferred, bases.Instance)):
+                        descriptor = inferred._proxied._getattr('__get__', context)
+                        if descriptor.__class__ is exceptions._Failure:
+                            yield inferred
+                        else:
+                            yield util.Uninferable
+                    else:
+                        yield function_to_method(inferred, self)
+                return
+        except exceptions.AttributeInferenceError as exc:
+            error = exc
+        if not name.startswith('__') and self.has_dynamic_getattr(context):
+            # class handle some dynamic attributes, return a Uninferable object
+            yield util.Uninferable
+        else:
+            raise exceptions.InferenceError(
+                error.message, target=self, attribute=name, context=context)
 
     def has_dynamic_getattr(self, context=None):
         """Check if the class has a custom __getattr__ or __getattribute__.
@@ -2362,15 +2741,13 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
             root = node.root()
             return root.name != BUILTINS and getattr(root, 'pure_python', None)
 
-        try:
-            return _valid_getattr(self.getattr('__getattr__', context)[0])
-        except exceptions.AttributeInferenceError:
-            #if self.newstyle: XXX cause an infinite recursion error
-            try:
-                getattribute = self.getattr('__getattribute__', context)[0]
-                return _valid_getattr(getattribute)
-            except exceptions.AttributeInferenceError:
-                pass
+        getattr_ = self._getattr('__getattr__', context)
+        if getattr_.__class__ is not exceptions._Failure:
+            return _valid_getattr(getattr_[0])
+        #if self.newstyle: XXX cause an infinite recursion error
+        getattribute = self._getattr('__getattribute__', context)
+        if getattribute.__class__ is not exceptions._Failure:
+            return _valid_getattr(getattribute[0])
         return False
 
     def getitem(self, index, context=None):
@@ -2446,7 +2823,7 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
         return None
 
     _metaclass = None
-    def declared_metaclass(self):
+    def declared_metaclass(self, context=None):
         """Return the explicit declared metaclass for the current class.
 
         An explicit declared metaclass is defined
@@ -2459,9 +2836,10 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
             or None if one could not be found.
         :rtype: NodeNG or None
         """
+        context = contextmod.budget_context(context)
         for base in self.bases:
             try:
-                for baseobj in base.infer():
+                for baseobj in base.infer(context):
                     if isinstance(baseobj, ClassDef) and baseobj.hide:
                         self._metaclass = baseobj._metaclass
                         self._metaclass_hack = True
@@ -2472,28 +2850,29 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
         if self._metaclass:
             # Expects this from Py3k TreeRebuilder
             try:
-                return next(node for node in self._metaclass.infer()
+                return next(node for node in self._metaclass.infer(context)
                             if node is not util.Uninferable)
             except (exceptions.InferenceError, StopIteration):
                 return None
 
         return None
 
-    def _find_metaclass(self, seen=None):
+    def _find_metaclass(self, seen=None, context=None):
         if seen is None:
             seen = set()
         seen.add(self)
 
-        klass = self.declared_metaclass()
+        klass = self.declared_metaclass(context=context)
         if klass is None:
-            for parent in self.ancestors():
+            for parent in self.ancestors(
+                    context=contextmod.budget_context(context)):
                 if parent not in seen:
-                    klass = parent._find_metaclass(seen)
+                    klass = parent._find_metaclass(seen, context=context)
                     if klass is not None:
                         break
         return klass
 
-    def metaclass(self):
+    def metaclass(self, context=None):
         """Get the metaclass of this class.
 
         If this class does not define explicitly a metaclass,
@@ -2503,7 +2882,7 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
         :returns: The metaclass of this class.
         :rtype: NodeNG or None
         """
-        return self._find_metaclass()
+        return self._find_metaclass(context=context)
 
     def has_metaclass_hack(self):
         return self._metaclass_hack
@@ -0,0 +1,483 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/PyCQA/astroid/blob/master/COPYING.LESSER
+
+"""Binary serialization of astroid trees.
+
+A tree is serialized with :func:`dumps` (or :meth:`Module.to_bytes`)
+and loaded back with :func:`loads` (or :meth:`Module.from_bytes`),
+without parsing the source again.
+
+The format starts with the ``ASTB`` magic and the format version, as
+an unsigned short, followed by a :mod:`marshal` dump of a tuple made of:
+
+* the names of the node classes used in the tree;
+* the nodes, in packed arrays with an item per node: the index of
+  their class, the index of their parent (-1 for none), their line
+  number and their column offset (-1 for none);
+* the fields of the nodes, a tuple per node with the values of
+  ``_astroid_fields`` then of ``_other_fields``, nodes being replaced
+  by their index;
+* the state of the scopes, such as their locals, as (index, values) pairs;
+* the inference tips, as (index, module, qualified name) tuples,
+  the module being None for the tips which were set by transforms that
+  are not module level functions, in which case the transforms
+  registered for the node are run again on load.
+
+Strings are interned before being dumped, so that each of them is
+stored only once. The nodes referenced by the scopes but coming from
+other modules are not serialized, nor are the values cached by the nodes.
+
+Many modules can also be written to a single store, made of the ``ASTS``
+magic, the format version and the offset of the index, as an unsigned
+long long, followed by the serialized modules and by a :mod:`marshal`
+dump of the index, mapping the name of each module to its offset, its
+length, its source file and the modification time and size of the
+source file when it was stored.
+"""
+
+import array
+import gc
+import importlib
+import marshal
+import mmap
+import os
+import struct
+import sys
+
+from astroid import exceptions
+from astroid import manager
+from astroid import nodes
+
+
+MAGIC = b'ASTB'
+# Bump it when the format changes.
+VERSION = 1
+_HEADER = struct.Struct('<4sH')
+_MARSHAL_VERSION = 4
+
+MANAGER = manager.AstroidManager()
+_NODE_CLASSES = {cls.__name__: cls for cls in nodes.ALL_NODE_CLASSES}
+
+# The instance attributes of the nodes which are not fields, with
+# their kind: 'mapping' of names to lists of nodes, list of 'nodes',
+# 'node' or plain 'value'.
+_STATE = (
+    (nodes.Module, (('_locals', 'mapping'),
+                    ('_wildcard_import_nodes', 'nodes'),
+                    ('file_encoding', 'value'))),
+    (nodes.ClassDef, (('locals', 'mapping'),
+                      ('_instance_attrs', 'mapping'),
+                      ('_delayed_assattr', 'nodes'),
+                      ('keywords', 'nodes'),
+                      ('_metaclass', 'node'),
+                      ('_newstyle', 'value'))),
+    (nodes.FunctionDef, (('locals', 'mapping'),
+                         ('instance_attrs', 'mapping'))),
+    (nodes.Lambda, (('locals', 'mapping'),)),
+    (nodes.GeneratorExp, (('locals', 'mapping'),)),
+    (nodes.DictComp, (('locals', 'mapping'),)),
+    (nodes.SetComp, (('locals', 'mapping'),)),
+    (nodes.ListComp, (('locals', 'mapping'),)),
+)
+
+
+def _state_attributes(node):
+    for cls, attributes in _STATE:
+        if isinstance(node, cls):
+            return attributes
+    return ()
+
+
+def _contexts():
+    # The enumeration is defined by the package, which
+    # is not necessarily fully imported when this module is.
+    import astroid
+    return {context.name: context
+            for context in (astroid.Load, astroid.Store, astroid.Del)}
+
+
+def _intern(value):
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (list, tuple)):
+        return type(value)(_intern(item) for item in value)
+    return value
+
+
+def _tip_reference(function):
+    """Get the module and the qualified name of the given inference tip.
+
+    None is returned for the functions which cannot be found back that way.
+    """
+    modname = getattr(function, '__module__', None)
+    qualname = getattr(function, '__qualname__', '')
+    if modname is None or '<' in qualname:
+        return None
+    obj = sys.modules.get(modname)
+    for name in qualname.split('.'):
+        obj = getattr(obj, name, None)
+    if obj is not function:
+        return None
+    return modname, qualname
+
+
+class _Dumper(object):
+
+    def __init__(self, module):
+        self._module = module
+        self._indexes = {}
+        self._nodes = []
+
+    def _add(self, node):
+        """Number the given node and the nodes under it."""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if id(node) in self._indexes:
+                continue
+            self._indexes[id(node)] = len(self._nodes)
+            self._nodes.append(node)
+            stack.extend(reversed(list(node.get_children())))
+
+    def _reference(self, node):
+        """Get the index of a node referenced from outside the fields.
+
+        The detached nodes of the module, such as the keywords
+        of the classes, are numbered along with their parents.
+        None is returned for the nodes of other modules.
+        """
+        index = self._indexes.get(id(node))
+        if index is not None:
+            return index
+        top = node
+        while top.parent is not None and id(top.parent) not in self._indexes:
+            top = top.parent
+        if top.parent is None and top is not self._module:
+            return None
+        self._add(top)
+        return self._indexes[id(node)]
+
+    def _references(self, values):
+        references = (self._reference(value) for value in values)
+        return [index for index in references if index is not None]
+
+    def _encode_field(self, value):
+        # The operators of the comparisons are stored along their operands.
+        if value is None or isinstance(value, str):
+            return value
+        if isinstance(value, list):
+            return [self._encode_field(item) for item in value]
+        if isinstance(value, tuple):
+            return tuple(self._encode_field(item) for item in value)
+        return self._indexes[id(value)]
+
+    def _encode_state(self, node):
+        values = []
+        for name, kind in _state_attributes(node):
+            value = node.__dict__.get(name)
+            if value is None or kind == 'value':
+                values.append(_intern(value))
+            elif kind == 'node':
+                values.append(self._reference(value))
+            elif kind == 'nodes':
+                values.append(self._references(value))
+            else:
+                values.append({sys.intern(key): self._references(nodes_)
+                               for key, nodes_ in value.items()})
+        return tuple(values)
+
+    def dumps(self):
+        if not self._module.pure_python:
+            raise exceptions.AstroidError(
+                'Cannot serialize {module!r}, it was built from a living object.',
+                module=self._module)
+        self._add(self._module)
+        classes = {}
+        kinds = array.array('H')
+        parents = array.array('i')
+        linenos = array.array('i')
+        col_offsets = array.array('i')
+        fields = []
+        states = []
+        tips = []
+        # Encoding the state of the scopes can number more nodes.
+        index = 0
+        while index < len(self._nodes):
+            node = self._nodes[index]
+            cls = type(node)
+            if _NODE_CLASSES.get(cls.__name__) is not cls:
+                raise exceptions.AstroidError(
+                    'Cannot serialize {node!r}, it is not a known node class.',
+                    node=node)
+            kinds.append(classes.setdefault(cls.__name__, len(classes)))
+            parent = None if node.parent is None else self._reference(node.parent)
+            parents.append(-1 if parent is None else parent)
+            linenos.append(-1 if node.lineno is None else node.lineno)
+            col_offsets.append(-1 if node.col_offset is None else node.col_offset)
+            values = [self._encode_field(getattr(node, field))
+                      for field in node._astroid_fields]
+            for field in node._other_fields:
+                value = getattr(node, field)
+                if field == 'ctx' and value is not None:
+                    value = value.name
+                elif isinstance(value, set):
+                    value = frozenset(value)
+                values.append(_intern(value))
+            fields.append(tuple(values))
+            if _state_attributes(node):
+                states.append((index, self._encode_state(node)))
+            if node._explicit_inference is not None:
+                reference = _tip_reference(node._explicit_inference) or (None, None)
+                tips.append((index,) + reference)
+            index += 1
+
+        names = sorted(classes, key=classes.get)
+        data = (tuple(names), kinds.tobytes(), parents.tobytes(),
+                linenos.tobytes(), col_offsets.tobytes(),
+                fields, states, tips)
+        try:
+            payload = marshal.dumps(data, _MARSHAL_VERSION)
+        except ValueError as exc:
+            raise exceptions.AstroidError(
+                'Cannot serialize {module!r}: {error}',
+                module=self._module, error=exc) from exc
+        return _HEADER.pack(MAGIC, VERSION) + payload
+
+
+def dumps(module):
+    """Serialize the given module to bytes.
+
+    :param module: The module to serialize.
+    :type module: Module
+
+    :returns: The serialized module.
+    :rtype: bytes
+
+    :raises AstroidError: If the tree contains values which are
+        not supported, as in the trees built from living objects.
+    """
+    return _Dumper(module).dumps()
+
+
+def _decode_field(value, built):
+    if type(value) is int:
+        return built[value]
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        try:
+            return [built[item] for item in value]
+        except TypeError:
+            return [_decode_field(item, built) for item in value]
+    return tuple(_decode_field(item, built) for item in value)
+
+
+def _layout(cls):
+    """Get the fields of the given class, as they are stored."""
+    other_fields = cls._other_fields
+    plain = 'ctx' not in other_fields and 'future_imports' not in other_fields
+    return cls._astroid_fields, len(cls._astroid_fields), other_fields, plain
+
+
+def _load(data):
+    magic, version = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('unsupported format')
+    (names, kinds, parents, linenos, col_offsets,
+     fields, states, tips) = marshal.loads(data[_HEADER.size:])
+    classes = [_NODE_CLASSES[name] for name in names]
+    layouts = [_layout(cls) for cls in classes]
+    kinds = array.array('H', kinds)
+    parents = array.array('i', parents)
+    linenos = array.array('i', linenos)
+    col_offsets = array.array('i', col_offsets)
+
+    # The nodes are created first, since they reference each other.
+    new = object.__new__
+    built = [new(classes[kind]) for kind in kinds]
+    contexts = _contexts()
+    for node, kind, parent, lineno, col_offset, values in zip(
+            built, kinds, parents, linenos, col_offsets, fields):
+        astroid_fields, count, other_fields, plain = layouts[kind]
+        state = node.__dict__
+        state['parent'] = None if parent == -1 else built[parent]
+        state['lineno'] = None if lineno == -1 else lineno
+        state['col_offset'] = None if col_offset == -1 else col_offset
+        for field, value in zip(astroid_fields, values):
+            state[field] = _decode_field(value, built)
+        if plain:
+            state.update(zip(other_fields, values[count:]))
+            continue
+        for field, value in zip(other_fields, values[count:]):
+            if field == 'ctx' and value is not None:
+                value = contexts[value]
+            elif isinstance(value, frozenset):
+                value = set(value)
+            state[field] = value
+
+    for index, values in states:
+        node = built[index]
+        for (name, kind), value in zip(_state_attributes(node), values):
+            if value is None:
+                continue
+            if kind == 'value':
+                pass
+            elif kind == 'node':
+                value = built[value]
+            elif kind == 'nodes':
+                value = [built[item] for item in value]
+            else:
+                value = {key: [built[item] for item in items]
+                         for key, items in value.items()}
+            node.__dict__[name] = value
+
+    for index, modname, qualname in tips:
+        node = built[index]
+        if modname is None:
+            # pylint: disable=protected-access
+            MANAGER._transform._transform(node)
+            continue
+        function = importlib.import_module(modname)
+        for name in qualname.split('.'):
+            function = getattr(function, name)
+        node._explicit_inference = function
+    return built[0]
+
+
+def loads(data):
+    """Load a module serialized with :func:`dumps`.
+
+    :param data: The serialized module.
+    :type data: bytes
+
+    :returns: The loaded module.
+    :rtype: Module
+
+    :raises AstroidBuildingError: If the data is not a serialized module,
+        or was serialized with another version of the format.
+    """
+    # The trees are made of many objects, collecting them while
+    # they are loaded only slows things down.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        module = _load(data)
+    except (ValueError, TypeError, KeyError, IndexError, EOFError,
+            struct.error, AttributeError, ImportError) as exc:
+        raise exceptions.AstroidBuildingError(
+            'Unable to load a serialized module: {error}',
+            error=exc) from exc
+    finally:
+        if gc_enabled:
+            gc.enable()
+    if not isinstance(module, nodes.Module):
+        raise exceptions.AstroidBuildingError(
+            'The serialized tree is not a module.')
+    return module
+
+
+STORE_MAGIC = b'ASTS'
+_STORE_HEADER = struct.Struct('<4sHQ')
+
+
+def _source_state(path):
+    """Get the modification time and the size of the given file, None if missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def write_module_store(path, modules):
+    """Write a module store with the given modules, to be opened by :class:`ModuleStore`.
+
+    Only the modules built from source files are stored.
+
+    :param path: The path of the store.
+    :type path: str
+
+    :param modules: The modules to store.
+    :type modules: iterable(Module)
+    """
+    index = {}
+    tmp_path = '%s.%d.tmp' % (path, os.getpid())
+    with open(tmp_path, 'wb') as stream:
+        stream.write(_STORE_HEADER.pack(STORE_MAGIC, VERSION, 0))
+        for module in modules:
+            if not module.pure_python or module.file is None:
+                continue
+            state = _source_state(module.file)
+            if state is None:
+                continue
+            data = dumps(module)
+            index[module.name] = (stream.tell(), len(data), module.file) + state
+            stream.write(data)
+        index_offset = stream.tell()
+        stream.write(marshal.dumps(index, _MARSHAL_VERSION))
+        stream.seek(0)
+        stream.write(_STORE_HEADER.pack(STORE_MAGIC, VERSION, index_offset))
+    os.replace(tmp_path, path)
+
+
+class ModuleStore(object):
+    """A read-only store of serialized modules, written by :func:`write_module_store`.
+
+    The store is memory mapped, so that the processes opening the same
+    store share its pages, and the modules are only loaded when asked for.
+    The modules whose source file changed since they were stored are ignored.
+
+    :param path: The path of the store.
+    :type path: str
+
+    :raises AstroidBuildingError: If the file is not a module store.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as stream:
+            self._map = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, index_offset = _STORE_HEADER.unpack_from(self._map)
+            if magic != STORE_MAGIC or version != VERSION:
+                raise ValueError('unsupported format')
+            self._index = marshal.loads(self._map[index_offset:])
+        except (ValueError, TypeError, EOFError, struct.error) as exc:
+            self._map.close()
+            raise exceptions.AstroidBuildingError(
+                'Unable to open the module store {path}: {error}',
+                path=path, error=exc) from exc
+
+    def __contains__(self, modname):
+        return modname in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def load(self, modname, filepath=None):
+        """Load the given module from the store.
+
+        :param modname: The name of the module.
+        :type modname: str
+
+        :param filepath: The source file the module must have been built from,
+            any if None.
+        :type filepath: str or None
+
+        :returns: The module, or None if it is not stored, was built
+            from another file or if its source file changed since.
+        :rtype: Module or None
+        """
+        entry = self._index.get(modname)
+        if entry is None:
+            return None
+        offset, length, file, mtime, size = entry
+        if filepath is not None and filepath != file:
+            return None
+        if _source_state(file) != (mtime, size):
+            return None
+        return loads(self._map[offset:offset + length])
+
+    def close(self):
+        """Unmap the store."""
+        self._map.close()
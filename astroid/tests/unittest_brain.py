@@ -892,6 +892,54 @@ class RandomSampleTest(unittest.TestCase):
         self.assertEqual(elems, [1, 2])
 
 
+class ConstantFoldingTest(unittest.TestCase):
+
+    def setUp(self):
+        MANAGER.fold_constants = True
+
+    def tearDown(self):
+        del MANAGER.fold_constants
+
+    def test_folded(self):
+        ast_nodes = astroid.extract_node('''
+        60 * 60 * 24 #@
+        'a' + 'b' * 2 #@
+        -(1 << 4) #@
+        not (0 or '') #@
+        (1, 2) + (3,) * 2 #@
+        ''')
+        self.assertEqual(ast_nodes[0].left._folded.value, 3600)
+        expected = [86400, 'abb', -16, True]
+        for node, value in zip(ast_nodes, expected):
+            self.assertIsNotNone(node._explicit_inference)
+            inferred = node.inferred()
+            self.assertEqual(len(inferred), 1)
+            self.assertEqual(inferred[0].value, value)
+        inferred = next(ast_nodes[4].infer())
+        self.assertIsInstance(inferred, nodes.Tuple)
+        self.assertEqual([elt.value for elt in inferred.elts], [1, 2, 3, 3])
+
+    def test_not_folded(self):
+        ast_nodes = astroid.extract_node('''
+        a = 1
+        a + 1 #@
+        1 / 0 #@
+        'a' * 100000 #@
+        2 ** 100000 #@
+        '%s' % 1 #@
+        ([1], 2) + () #@
+        ''')
+        for node in ast_nodes:
+            self.assertIsNone(node._explicit_inference)
+        self.assertEqual(next(ast_nodes[0].infer()).value, 2)
+
+    def test_disabled(self):
+        del MANAGER.fold_constants
+        node = astroid.extract_node('60 * 60')
+        self.assertIsNone(node._explicit_inference)
+        MANAGER.fold_constants = True
+
+
 class SubprocessTest(unittest.TestCase):
     """Test subprocess brain"""
     # TODO Add more tests so that we can some day
@@ -10,13 +10,17 @@
 
 import builtins
 import os
+import shutil
 import sys
+import tempfile
+import textwrap
 import unittest
 
 from astroid import builder
 from astroid import exceptions
 from astroid import manager
 from astroid import nodes
+from astroid import scoped_nodes
 from astroid import test_utils
 from astroid import util
 from astroid.tests import resources
@@ -261,6 +265,268 @@ class BuilderTest(unittest.TestCase):
         with self.assertRaises(exceptions.AstroidBuildingError):
             resources.build_file('data/inexistant.py')
 
+    def test_file_read_once(self):
+        source = ('# -*- coding: latin-1 -*-\r\n'
+                  '"""caf\xe9"""\r\n'
+                  'value = 1\r\n').encode('latin-1')
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'read_once.py')
+        try:
+            with open(path, 'wb') as stream:
+                stream.write(source)
+            data = source.decode('latin-1').replace('\r\n', '\n')
+            self.assertEqual(builder.read_source_file(path),
+                             (source, 'iso-8859-1', data))
+            module = self.builder.file_build(path, 'read_once')
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual(module.file_encoding, 'iso-8859-1')
+        self.assertEqual(module.doc, 'caf\xe9')
+        # The file is gone, the stream comes from the bytes read once.
+        with module.stream() as stream:
+            self.assertEqual(stream.read(), source)
+
+    def test_parser(self):
+        sources = []
+        def parser(source):
+            sources.append(source)
+            return builder._parse('value = 1')
+        module = builder.AstroidBuilder(parser=parser).string_build('other = 2')
+        self.assertEqual(sources, ['other = 2\n'])
+        self.assertEqual(list(module.locals), ['value'])
+
+    def test_parse_interface(self):
+        abuilder = builder.AstroidBuilder(parser=builder.parse_interface)
+        module = abuilder.string_build(textwrap.dedent('''
+            import os
+            def func(a, b=os.sep):
+                """docstring"""
+                return a + b
+            if os:
+                class A(object):
+                    attr = 1
+                    async def method(self, c):
+                        self.attr = c
+                        def nested():
+                            pass
+        '''))
+        func = module['func']
+        self.assertEqual(func.doc, 'docstring')
+        self.assertEqual(func.args.as_string(), 'a, b=os.sep')
+        self.assertEqual(len(func.body), 1)
+        self.assertIsInstance(func.body[0], nodes.Pass)
+        method = module['A']['method']
+        self.assertEqual(len(method.body), 1)
+        self.assertIsInstance(method.body[0], nodes.Pass)
+        self.assertEqual(method.body[0].lineno, 10)
+        self.assertEqual(module['A'].instance_attrs, {})
+        self.assertIn('attr', module['A'].locals)
+
+    def test_target_parser(self):
+        source = textwrap.dedent('''
+            import sys
+            if sys.version_info >= (3, 0):
+                a = 1
+            elif sys.version_info[:2] == (2, 7):
+                a = 2
+            if sys.platform.startswith('win') or sys.platform == 'cygwin':
+                b = 1
+            else:
+                b = 2
+            if TYPE_CHECKING:
+                import typed
+            if six.PY2 and unknown:
+                c = 1
+            if sys.version_info.major < 3 or unknown:
+                d = 1
+            def func():
+                if sys.version_info < (3,):
+                    return 1
+            if 0:
+                e = 1
+            if True:
+                f = 1
+        ''')
+        abuilder = builder.AstroidBuilder(
+            parser=builder.target_parser((3, 6, 4), 'linux'))
+        module = abuilder.string_build(source)
+        self.assertEqual([statement.lineno for statement in module.body],
+                         [2, 4, 10, 11, 15, 17, 20, 22])
+        self.assertEqual(len(module.locals['a']), 1)
+        self.assertEqual(next(module['b'].infer()).value, 2)
+        self.assertIn('typed', module.locals)
+        self.assertNotIn('c', module.locals)
+        self.assertIn('d', module.locals)
+        self.assertIn('e', module.locals)
+        self.assertIsInstance(module.body[-1], nodes.If)
+        self.assertIsInstance(module['func'].body[0], nodes.Pass)
+
+        abuilder = builder.AstroidBuilder(parser=builder.target_parser(platform='win32'))
+        module = abuilder.string_build(source)
+        self.assertEqual(len(module.locals['a']), 2)
+        self.assertEqual(next(module['b'].infer()).value, 1)
+        self.assertIn('c', module.locals)
+
+    def test_target_parser_keeps_required_blocks(self):
+        source = textwrap.dedent('''
+            import sys
+            try:
+                x = 1
+            finally:
+                if sys.version_info < (3,):
+                    y = 2
+            try:
+                x = 2
+            except ImportError:
+                if sys.version_info < (3,):
+                    y = 3
+            finally:
+                if sys.version_info < (3,):
+                    y = 4
+        ''')
+        abuilder = builder.AstroidBuilder(parser=builder.target_parser((3, 6)))
+        module = abuilder.string_build(source)
+        self.assertNotIn(None, module.body)
+        first, second = module.body[1:]
+        self.assertIsInstance(first, nodes.TryFinally)
+        self.assertIsInstance(first.finalbody[0], nodes.Pass)
+        self.assertIsInstance(second, nodes.TryExcept)
+        self.assertIsInstance(second.handlers[0].body[0], nodes.Pass)
+        self.assertNotIn('y', module.locals)
+        self.assertIn('finally:\n    pass', module.as_string())
+
+    def test_update(self):
+        abuilder = builder.AstroidBuilder()
+        module = abuilder.string_build(textwrap.dedent('''
+            """docstring"""
+            import os
+
+            def func():
+                return 1
+
+            class A(object):
+                def method(self):
+                    self.attr = 1
+
+                def other(self):
+                    return os
+        '''))
+        func, klass = module['func'], module['A']
+        method, other = klass['method'], klass['other']
+        updated = abuilder.update(module, textwrap.dedent('''
+            """docstring"""
+            import os
+
+            def func():
+                value = 2
+                return value
+
+            class A(object):
+                def method(self):
+                    self.attr = 1
+
+                def other(self):
+                    return os
+        '''))
+        self.assertIs(updated, module)
+        self.assertIsNot(module['func'], func)
+        self.assertEqual(module['func'].body[1].lineno, 7)
+        self.assertIs(module['A'], klass)
+        self.assertEqual(klass.lineno, 9)
+        self.assertEqual(other.lineno, 13)
+        self.assertEqual(klass.tolineno, 14)
+        self.assertEqual(module.doc, 'docstring')
+
+        abuilder.update(module, textwrap.dedent('''
+            """docstring"""
+            import os
+
+            def func():
+                value = 2
+                return value
+
+            class A(object):
+                def method(self):
+                    self.changed = 1
+
+                def other(self):
+                    return os
+        '''))
+        self.assertIs(module['A'], klass)
+        self.assertIsNot(klass['method'], method)
+        self.assertIs(klass['method'].parent, klass)
+        self.assertIs(klass['other'], other)
+        self.assertEqual(list(klass.instance_attrs), ['changed'])
+        self.assertIn(b'self.changed = 1', module.file_bytes)
+
+    def test_update_locals(self):
+        abuilder = builder.AstroidBuilder()
+        module = abuilder.string_build('a = 1\nb = 2\n')
+        abuilder.update(module, 'a = 1\nc = 3\nfrom os import *\n')
+        self.assertIn('curdir', module.locals)
+        self.assertIn('c', module.locals)
+        self.assertNotIn('b', module.locals)
+        self.assertIsInstance(module['c'], nodes.AssignName)
+        abuilder.update(module, 'def a():\n    global b\n    b = 1\n')
+        self.assertEqual(sorted(module.locals), ['a', 'b'])
+        self.assertEqual(module['b'].lineno, 3)
+
+    def test_update_errors(self):
+        abuilder = builder.AstroidBuilder()
+        module = abuilder.string_build('a = 1\n')
+        with self.assertRaises(exceptions.AstroidSyntaxError):
+            abuilder.update(module, 'a = (\n')
+        self.assertEqual(module.file_bytes, b'a = 1\n')
+        self.assertIn('a', module.locals)
+        module.file_bytes = None
+        with self.assertRaises(exceptions.AstroidBuildingError):
+            abuilder.update(module, 'b = 1\n')
+
+    def test_update_class_body_errors(self):
+        abuilder = builder.AstroidBuilder()
+        source = textwrap.dedent('''
+            class Date(object):
+                def __init__(self, month):
+                    self.month = month
+                year = 2000
+                day = 1
+        ''')
+        module = abuilder.string_build(source)
+        klass = module['Date']
+        # Deleting the header of the method leaves its body indented.
+        unindented = source.replace('    def __init__(self, month):\n', '')
+        # Indenting a class level assignment.
+        indented = source.replace('    day = 1', '        day = 1')
+        for data in (unindented, indented):
+            with self.assertRaises(SyntaxError):
+                compile(data, '<test>', 'exec')
+            with self.assertRaises(exceptions.AstroidSyntaxError):
+                abuilder.update(module, data)
+            self.assertEqual(module.file_bytes, source.encode())
+            self.assertEqual([statement.lineno for statement in klass.body], [3, 5, 6])
+
+    def test_update_class_body_as_built(self):
+        abuilder = builder.AstroidBuilder()
+        source = textwrap.dedent('''
+            class Base(object):
+                def method(self):
+                    return 1
+            class Date(Base):
+                year = 2000
+                def method(self):
+                    return 2
+        ''')
+        data = source.replace('return 2', 'return super().method(), __class__')
+        module = abuilder.update(abuilder.string_build(source), data)
+        expected = abuilder.string_build(data)
+        self.assertEqual(module.repr_tree(), expected.repr_tree())
+        for tree in (module, expected):
+            klass = tree['Date']
+            self.assertIs(klass['method'].locals['__class__'][0], klass)
+            super_call, class_name = klass['method'].body[0].value.elts
+            self.assertEqual(next(super_call.infer()).value, 1)
+            self.assertIs(next(class_name.infer()), klass)
+
     def test_inspect_build0(self):
         """test astroid tree build from a living object"""
         builtin_ast = MANAGER.ast_from_module_name(BUILTINS)
@@ -499,6 +765,86 @@ class BuilderTest(unittest.TestCase):
         # TODO: Check self.v += 1 generate AugAssign(AssAttr(...)),
         # not AugAssign(GetAttr(AssName...))
 
+    def test_instance_attrs_resolved_lazily(self):
+        module = builder.parse("""
+            class A(object):
+                def __init__(self):
+                    self.x = 1
+                def method(self):
+                    self.y = 2
+            """, __name__)
+        klass = module['A']
+        self.assertEqual(len(klass._delayed_assattr), 2)
+        self.assertEqual(sorted(klass.instance_attrs), ['x', 'y'])
+        self.assertEqual(klass._delayed_assattr, [])
+        self.assertEqual(len(klass.instance_attr('x')), 1)
+
+    def test_wildcard_import_names_added_lazily(self):
+        module = builder.parse("""
+            from os.path import *
+            from os import sep
+            """, __name__)
+        self.assertEqual(len(module._wildcard_import_nodes), 1)
+        self.assertIn('join', module.locals)
+        self.assertEqual(module._wildcard_import_nodes, [])
+        self.assertIsInstance(module['join'], nodes.ImportFrom)
+        self.assertIs(module.locals, module.globals)
+
+    def test_lazy_docstrings(self):
+        code = '''
+            # -*- coding: utf-8 -*-
+            u"""Module docstring \xe9"""
+
+            @decorator(lambda: None)
+            class A(Base, metaclass=Meta):
+                """Class
+                docstring"""
+
+                def method(self, arg: {1: 2} = None) -> int: "one" 'liner'
+
+                def nodoc(self):
+                    value = "not a docstring"
+                    return (value
+                            @ value)
+
+                @staticmethod
+                # comment
+                def static():
+                    """Static"""
+            '''
+        manager.AstroidManager().lazy_docstrings = True
+        try:
+            module = builder.parse(code, __name__)
+        finally:
+            manager.AstroidManager().lazy_docstrings = False
+        klass = module['A']
+        method = klass['method']
+        self.assertIs(klass.__dict__['doc'], scoped_nodes.LAZY_DOCSTRING)
+        self.assertEqual(module.doc, u'Module docstring \xe9')
+        self.assertEqual(klass.doc, 'Class\n    docstring')
+        self.assertEqual(method.doc, 'oneliner')
+        self.assertIsNone(klass['nodoc'].doc)
+        self.assertEqual(klass.__dict__['doc'], 'Class\n    docstring')
+        # The source is tokenized once for all the docstrings.
+        spans = module.__dict__['_docstring_spans']
+        self.assertEqual(klass['static'].doc, 'Static')
+        self.assertIs(module.__dict__['_docstring_spans'], spans)
+        self.assertEqual(module.as_string(), builder.parse(code).as_string())
+
+    def test_identifiers_shared(self):
+        module = builder.parse("""
+            name = 1
+            name.attribute = name
+            def func(name):
+                return name.attribute
+            """)
+        names = [node.name for node in module.nodes_of_class((nodes.Name, nodes.AssignName))]
+        attributes = [node.attrname for node in module.nodes_of_class(
+            (nodes.Attribute, nodes.AssignAttr))]
+        self.assertEqual(len(names), 5)
+        self.assertTrue(all(name is names[0] for name in names))
+        self.assertIs(attributes[0], attributes[1])
+
     def test_inferred_dont_pollute(self):
         code = '''
             def func(a=None):
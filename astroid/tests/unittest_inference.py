@@ -23,9 +23,12 @@ from astroid.inference import infer_end as inference_infer_end
 from astroid.bases import Instance, BoundMethod, UnboundMethod,\
                                 BUILTINS
 from astroid import arguments
+from astroid import context as contextmod
 from astroid import decorators as decoratorsmod
 from astroid import exceptions
 from astroid import helpers
+from astroid import inference
+from astroid import manager as astroid_manager
 from astroid import objects
 from astroid import test_utils
 from astroid import util
@@ -56,6 +59,152 @@ class InferenceUtilsTest(unittest.TestCase):
             next(infer_default(1))
         self.assertEqual(next(infer_end(1)), 1)
 
+    def test_inference_wrapper(self):
+        def infer_values(node, context=None, values=()):
+            yield from values
+            return dict(node=node, context=context)
+
+        dedupe = decoratorsmod.inference_wrapper(infer_values, path=True)
+        self.assertEqual(list(dedupe('a', values=[1, 2, 1])), [1, 2])
+        keep = decoratorsmod.inference_wrapper(infer_values, path=True, dedupe=False)
+        self.assertEqual(list(keep('a', values=[1, 2, 1])), [1, 2, 1])
+
+        uninferable = decoratorsmod.inference_wrapper(infer_values,
+                                                      if_nothing='uninferable')
+        self.assertEqual(list(uninferable('a')), [util.Uninferable])
+        with self.assertRaises(InferenceError) as cm:
+            list(decoratorsmod.inference_wrapper(infer_values, if_nothing='raise')('a'))
+        self.assertEqual(cm.exception.node, 'a')
+        failure = exceptions._Failure(exceptions.NameInferenceError, name='a')
+        with self.assertRaises(exceptions.NameInferenceError):
+            list(decoratorsmod.inference_wrapper(infer_values, if_nothing='raise')(
+                'a', values=[failure]))
+
+        fail = decoratorsmod.inference_wrapper(infer_values, path=True,
+                                               if_nothing='fail')
+        skip = decoratorsmod.inference_wrapper(infer_values, path=True,
+                                               if_nothing='fail', skip_visited=True)
+        context = contextmod.InferenceContext()
+        failures = list(fail('a', context))
+        self.assertEqual(len(failures), 1)
+        self.assertIs(failures[0].error().node, 'a')
+        self.assertEqual(len(list(fail('a', context))), 1)
+        self.assertEqual(list(skip('a', context, values=[1])), [])
+
+    def test_context_path_shared_by_clones(self):
+        context = contextmod.InferenceContext()
+        self.assertFalse(context.push('a'))
+        clone = context.clone()
+        self.assertIs(clone.path, context.path)
+        self.assertTrue(clone.push('a'))
+        self.assertFalse(clone.push('b'))
+        self.assertFalse(context.push('c'))
+        self.assertEqual(sorted(key for key, _ in clone.path), ['a', 'b'])
+        self.assertEqual(sorted(key for key, _ in context.path), ['a', 'c'])
+        with context.restore_path():
+            for key in 'defgh':
+                self.assertFalse(context.push(key))
+            self.assertEqual(len(context.path), 7)
+        self.assertEqual(len(context.path), 2)
+        self.assertFalse(context.push('d'))
+
+    def test_failures_raised_at_api_boundaries(self):
+        name, attribute = extract_node('''
+        class A(object):
+            pass
+        undefined #@
+        A().missing #@
+        ''')
+        failures = list(name._infer_or_fail())
+        self.assertEqual(len(failures), 1)
+        self.assertIs(failures[0].error_class, exceptions.NameInferenceError)
+        self.assertEqual(failures[0].error().name, 'undefined')
+        context = contextmod.InferenceContext()
+        for _ in range(2):
+            with self.assertRaises(exceptions.NameInferenceError):
+                list(name.infer(context))
+        with self.assertRaises(InferenceError):
+            list(attribute.infer())
+
+        klass = next(attribute.expr.func.infer())
+        self.assertIsInstance(klass._getattr('missing'), exceptions._Failure)
+        with self.assertRaises(exceptions.AttributeInferenceError):
+            klass.getattr('missing')
+        with self.assertRaises(exceptions.AttributeInferenceError):
+            klass.instantiate_class().getattr('missing')
+
+
+class InferenceBudgetTest(unittest.TestCase):
+
+    CODE = '''
+    a0 = 1
+    a1 = a0 + 1
+    a2 = a1 + 1
+    a3 = a2 + 1
+    a3 #@
+    '''
+
+    def test_max_steps(self):
+        node = extract_node(self.CODE)
+        budget = contextmod.InferenceBudget(max_steps=5)
+        inferred = list(node.infer(contextmod.InferenceContext(budget=budget)))
+        self.assertEqual(inferred, [util.Uninferable])
+        budget = contextmod.InferenceBudget(max_steps=100)
+        inferred = list(node.infer(contextmod.InferenceContext(budget=budget)))
+        self.assertEqual(inferred[0].value, 4)
+        self.assertLess(budget.steps, 100)
+
+    def test_max_results(self):
+        node = extract_node('''
+        def func(arg):
+            if arg:
+                return 1
+            if arg > 1:
+                return 2
+            return 3
+        func(0) #@
+        ''')
+        budget = contextmod.InferenceBudget(max_results=2)
+        inferred = list(node.infer(contextmod.InferenceContext(budget=budget)))
+        self.assertEqual([value.value for value in inferred[:2]], [1, 2])
+        self.assertIs(inferred[2], util.Uninferable)
+        self.assertEqual(len(inferred), 3)
+
+    def test_timeout(self):
+        node = extract_node(self.CODE)
+        budget = contextmod.InferenceBudget(timeout=-1)
+        inferred = list(node.infer(contextmod.InferenceContext(budget=budget)))
+        self.assertEqual(inferred, [util.Uninferable])
+
+    def test_manager_limits(self):
+        node = extract_node(self.CODE)
+        manager = astroid_manager.AstroidManager()
+        self.assertIsNone(manager.inference_budget())
+        manager.max_inference_steps = 5
+        try:
+            self.assertEqual(list(node.infer()), [util.Uninferable])
+        finally:
+            del manager.max_inference_steps
+        self.assertEqual(next(node.infer()).value, 4)
+
+    def test_nested_inferences(self):
+        # The bases of the classes are inferred again to find their metaclass.
+        code = ''.join('class C%d(C%d): pass\n' % (index, index - 1)
+                       for index in range(1, 60))
+        node = extract_node('class C0(object):\n    attr = 1\n'
+                            + code + 'C59.attr #@')
+        budget = contextmod.InferenceBudget(max_steps=20)
+        inferred = list(node.infer(contextmod.InferenceContext(budget=budget)))
+        self.assertEqual(inferred, [util.Uninferable])
+        self.assertEqual(budget.steps, 21)
+        manager = astroid_manager.AstroidManager()
+        manager.max_inference_steps = 20
+        try:
+            self.assertEqual(list(node.infer()), [util.Uninferable])
+        finally:
+            del manager.max_inference_steps
+        self.assertEqual(next(node.infer()).value, 1)
+
 
 def _assertInferElts(node_type, self, node, elts):
     inferred = next(node.infer())
@@ -2666,6 +2815,81 @@ class InferenceTest(resources.SysPathSetup, unittest.TestCase):
         self.assertIsInstance(inferred.elts[0], nodes.Const)
         self.assertIsInstance(inferred.elts[1], nodes.Unknown)
 
+    def test_binop_too_many_combinations(self):
+        ast_nodes = extract_node('''
+        def func(arg):
+            if arg:
+                return 1
+            if arg > 1:
+                return 2
+            if arg > 2:
+                return 3
+            return 4
+        a, b, c, d = func(0), func(1), func(2), func(3)
+        a + b + c #@
+        a + b + c + d #@
+        ''')
+        inferred = list(ast_nodes[1].infer())
+        self.assertEqual(len(inferred), 256)
+        self.assertEqual({value.value for value in inferred}, set(range(4, 17)))
+        manager = astroid_manager.AstroidManager()
+        manager.max_inferred_combinations = 100
+        try:
+            inferred = list(ast_nodes[0].infer())
+            self.assertEqual(len(inferred), 64)
+            self.assertEqual({value.value for value in inferred}, set(range(3, 13)))
+            self.assertEqual(list(ast_nodes[1].infer()), [util.Uninferable])
+        finally:
+            del manager.max_inferred_combinations
+
+    def test_binop_partly_uninferable(self):
+        ast_node = extract_node('''
+        value = 1
+        if unknown:
+            value = unknown()
+        value + 1 #@
+        ''')
+        inferred = list(ast_node.infer())
+        self.assertEqual(len(inferred), 2)
+        self.assertEqual(inferred[0].value, 2)
+        self.assertIs(inferred[1], util.Uninferable)
+
+    def test_unpacking_too_many_combinations(self):
+        code = '''
+        def func(arg):
+            if arg:
+                return ((1, 2), 3)
+            return ((4, 5), 6)
+        (a, b), c = func(0)
+        a #@
+        '''
+        inferred = list(extract_node(code).infer())
+        self.assertEqual(sorted(value.value for value in inferred), [1, 4])
+        manager = astroid_manager.AstroidManager()
+        manager.max_inferred_combinations = 1
+        try:
+            self.assertEqual(list(extract_node(code).infer()), [util.Uninferable])
+        finally:
+            del manager.max_inferred_combinations
+
+    def test_binop_builtin_dispatch_cached(self):
+        ast_nodes = extract_node('''
+        1 + 2 #@
+        3 + 4 #@
+        1 + "a" #@
+        ''')
+        self.assertEqual(next(ast_nodes[0].infer()).value, 3)
+        int_type = ast_nodes[0].left._proxied
+        self.assertIn('__add__', inference._DUNDER_METHODS[int_type])
+        self.assertEqual(inference._TYPE_RELATIONS[int_type][int_type], 'same')
+        self.assertEqual(next(ast_nodes[1].infer()).value, 7)
+        self.assertEqual(next(ast_nodes[2].infer()), util.Uninferable)
+        str_type = ast_nodes[2].right._proxied
+        self.assertIsNone(inference._DUNDER_METHODS[str_type]['__radd__'])
+        errors = ast_nodes[2].type_errors()
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(str(errors[0]), "unsupported operand type(s) for +: 'int' and 'str'")
+
     def test_binop_same_types(self):
         ast_nodes = extract_node('''
         class A(object):
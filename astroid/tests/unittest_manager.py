@@ -5,10 +5,13 @@
 # Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
 # For details: https://github.com/PyCQA/astroid/blob/master/COPYING.LESSER
 
+import gc
 import os
 import platform
+import shutil
 import site
 import sys
+import tempfile
 import unittest
 
 import pkg_resources
@@ -17,6 +20,7 @@ import six
 import astroid
 from astroid import exceptions
 from astroid import manager
+from astroid import serialization
 from astroid.tests import resources
 
 
@@ -214,6 +218,120 @@ class AstroidManagerTest(resources.SysPathSetup,
         self.assertRaises(exceptions.AstroidBuildingError,
                           self.manager.file_from_module_name, 'unhandledModule', None)
 
+    def test_mod_file_cache_persistence(self):
+        self.manager.file_from_module_name('unittest', None)
+        self.assertRaises(exceptions.AstroidBuildingError,
+                          self.manager.file_from_module_name, 'unhandledModule', None)
+        self.assertRaises(exceptions.AstroidBuildingError,
+                          self.manager.file_from_module_name,
+                          'unittest.unhandledModule', None)
+        saved = dict(self.manager._mod_file_cache)
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'mod_file_cache')
+        try:
+            self.manager.dump_mod_file_cache(path)
+            self.manager._mod_file_cache = {}
+            self.assertTrue(self.manager.load_mod_file_cache(path))
+            self.assertEqual(self.manager._mod_file_cache[('unittest', None)],
+                             saved[('unittest', None)])
+            # The content of the packages isn't tracked.
+            self.assertNotIn(('unittest.unhandledModule', None),
+                             self.manager._mod_file_cache)
+            self.assertRaises(exceptions.AstroidBuildingError,
+                              self.manager.file_from_module_name, 'unhandledModule', None)
+
+            # Modifying a directory on the search path invalidates the lookups.
+            self.manager._mod_file_cache = {}
+            sys.path.insert(0, directory)
+            try:
+                self.manager.dump_mod_file_cache(path)
+                with open(os.path.join(directory, 'unhandledModule.py'), 'w'):
+                    pass
+                stat = os.stat(directory)
+                os.utime(directory, (stat.st_atime, stat.st_mtime + 10))
+                self.assertFalse(self.manager.load_mod_file_cache(path))
+            finally:
+                sys.path.remove(directory)
+            self.assertFalse(self.manager.load_mod_file_cache(path))
+            self.assertFalse(self.manager.load_mod_file_cache(path + '.missing'))
+        finally:
+            self.manager._mod_file_cache = saved
+            shutil.rmtree(directory)
+
+    def test_module_store(self):
+        module = self.manager.ast_from_module_name('data.module')
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'store')
+        try:
+            serialization.write_module_store(path, [module])
+            self.manager.use_module_store(path)
+            del self.manager.astroid_cache['data.module']
+            loaded = self.manager.ast_from_module_name('data.module')
+            self.assertIsNot(loaded, module)
+            self.assertEqual(loaded.as_string(), module.as_string())
+            self.assertIs(self.manager.astroid_cache['data.module'], loaded)
+        finally:
+            self.manager.use_module_store(None)
+            shutil.rmtree(directory)
+
+    def test_freeze(self):
+        module = astroid.parse('''
+        from os.path import *
+
+        class A(object):
+            def __init__(self):
+                self.attr = 42
+        ''', 'frozen')
+        klass = module['A']
+        self.assertNotIn('tolineno', klass.__dict__)
+        # The objects moved to the permanent generation stay there.
+        frozen = []
+        if hasattr(gc, 'freeze'):
+            self.addCleanup(setattr, gc, 'freeze', gc.freeze)
+        else:
+            self.addCleanup(delattr, gc, 'freeze')
+        gc.freeze = lambda: frozen.append(True)
+        saved = self.manager.astroid_cache
+        self.manager.astroid_cache = {BUILTINS: self._builtins, 'frozen': module}
+        try:
+            self.manager.freeze()
+        finally:
+            self.manager.astroid_cache = saved
+        self.assertFalse(module._wildcard_import_nodes)
+        self.assertFalse(klass._delayed_assattr)
+        self.assertIn('attr', klass.instance_attrs)
+        self.assertIn('tolineno', klass.__dict__)
+        self.assertIn('fromlineno', klass.body[0].body[0].__dict__)
+        self.assertEqual(frozen, [True])
+
+    def test_evict_module(self):
+        module = astroid.parse('a = 1', 'evicted')
+        self.assertIs(self.manager.astroid_cache['evicted'], module)
+        self.manager.evict_module('evicted')
+        self.assertNotIn('evicted', self.manager.astroid_cache)
+        self.assertEqual(module.__dict__, {})
+        self.manager.evict_module('evicted')
+
+    def test_evict_module_assigning_attributes(self):
+        kept = astroid.parse('''
+        class A(object):
+            attr = 1
+        ''', 'kept')
+        self.addCleanup(self.manager.astroid_cache.pop, 'kept')
+        astroid.parse('''
+        import kept
+        kept.VALUE = 1
+        kept.A.extra = 2
+        ''', 'evicted')
+        self.assertIn('VALUE', kept.locals)
+        self.assertIn('extra', kept['A'].locals)
+        self.manager.evict_module('evicted')
+        self.assertNotIn('VALUE', kept.locals)
+        self.assertNotIn('extra', kept['A'].locals)
+        with self.assertRaises(exceptions.AttributeInferenceError):
+            kept['A'].getattr('extra')
+        self.assertEqual(next(kept['A'].igetattr('attr')).value, 1)
+
     def test_ast_from_module(self):
         ast = self.manager.ast_from_module(unittest)
         self.assertEqual(ast.pure_python, True)
@@ -253,6 +371,44 @@ class AstroidManagerTest(resources.SysPathSetup,
         self.assertRaises(exceptions.AstroidBuildingError,
                           self.manager.ast_from_class, None)
 
+    def test_infer_many(self):
+        module = astroid.parse('''
+        import collections
+        def even(number):
+            return odd(number - 1) if number else True
+        def odd(number):
+            return even(number - 1) if number else False
+        Point = collections.namedtuple('Point', 'x y')
+        point = Point(1, 2)
+        value = even(point.x)
+        other = odd(4)
+        ''')
+        nodes = list(module.nodes_of_class((astroid.Name, astroid.Call,
+                                            astroid.Attribute, astroid.BinOp)))
+        inferred = self.manager.infer_many(nodes + nodes[:3])
+        self.assertEqual(set(inferred), set(nodes))
+        for node in nodes:
+            try:
+                expected = list(node.infer())
+            except exceptions.InferenceError:
+                expected = []
+            self.assertEqual([value.as_string() for value in inferred[node]],
+                             [value.as_string() for value in expected])
+
+    def test_iinfer_many_order(self):
+        module = astroid.parse('''
+        def func():
+            return value
+        print(value)
+        value = missing
+        ''')
+        uses = [module.body[0].body[0].value, module.body[1].value.args[0]]
+        results = list(self.manager.iinfer_many(uses + [module.body[2].value]))
+        self.assertEqual([node for node, _ in results],
+                         [module.body[2].value] + uses[::-1])
+        self.assertEqual([values for _, values in results],
+                         [(), (), (astroid.Uninferable,)])
+
     def testFailedImportHooks(self):
         def hook(modname):
             if modname == 'foo.bar':
@@ -12,7 +12,9 @@ unit tests for module modutils (module manipulation utilities)
 """
 import email
 import os
+import shutil
 import sys
+import tempfile
 import unittest
 from xml import etree
 
@@ -148,6 +150,44 @@ class FileFromModPathTest(resources.SysPathSetup, unittest.TestCase):
         modutils.file_from_modpath(["data", "unicode_package", "core"])
 
 
+class PathIndexTest(resources.SysPathSetup, unittest.TestCase):
+
+    def setUp(self):
+        super(PathIndexTest, self).setUp()
+        spec.use_path_index()
+
+    def tearDown(self):
+        spec.use_path_index(False)
+        super(PathIndexTest, self).tearDown()
+
+    def test_same_specs_as_imp(self):
+        for modpath in (['os'], ['sys'], ['astroid', 'modutils'], ['data'],
+                        ['data', 'module'], ['data', 'unicode_package', 'core']):
+            found_spec = spec.find_spec(modpath)
+            spec.use_path_index(False)
+            self.assertEqual(found_spec, spec.find_spec(modpath))
+            spec.use_path_index()
+
+    def test_unexisting(self):
+        self.assertRaises(ImportError, modutils.file_from_modpath, ['turlututu'])
+
+    def test_directory_change(self):
+        directory = tempfile.mkdtemp()
+        try:
+            self.assertRaises(ImportError, spec.find_spec, ['indexed'], [directory])
+            with open(os.path.join(directory, 'indexed.py'), 'w'):
+                pass
+            # Make sure the modification time changes, whatever the
+            # resolution of the file system is.
+            stat = os.stat(directory)
+            os.utime(directory, (stat.st_atime, stat.st_mtime + 10))
+            found_spec = spec.find_spec(['indexed'], [directory])
+            self.assertEqual(found_spec.location, os.path.join(directory, 'indexed.py'))
+            self.assertEqual(found_spec.type, spec.ModuleType.PY_SOURCE)
+        finally:
+            shutil.rmtree(directory)
+
+
 class GetSourceFileTest(unittest.TestCase):
 
     def test(self):
@@ -216,6 +256,31 @@ class StandardLibModuleTest(resources.SysPathSetup, unittest.TestCase):
         self.assertFalse(modutils.is_standard_module('xml.whatever', etree.__path__))
 
 
+    def test_precomputed_classification(self):
+        cwd = os.getcwd()
+        search_path = tuple(sys.path)
+        for modname in ('sys', 'datetime', 'email', 'astroid', 'builtins'):
+            self.assertEqual(
+                modutils._is_standard_top_level(modname, search_path, cwd),
+                modutils.is_standard_module(modname, modutils.STD_LIB_DIRS))
+        self.assertIsNone(modutils._is_standard_top_level('unknown', search_path, cwd))
+
+    def test_precomputed_classification_changes(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        search_path = (directory,)
+        cwd = os.getcwd()
+        self.assertIsNone(modutils._is_standard_top_level('added', search_path, cwd))
+        open(os.path.join(directory, 'added.py'), 'w').close()
+        # The modification time may not change within its resolution.
+        mtime = os.stat(directory).st_mtime + 10
+        os.utime(directory, (mtime, mtime))
+        # The classification is kept for the same search path.
+        self.assertIsNone(modutils._is_standard_top_level('added', search_path, cwd))
+        search_path += (cwd,)
+        self.assertFalse(modutils._is_standard_top_level('added', search_path, cwd))
+
+
 class IsRelativeTest(unittest.TestCase):
 
     def test_knownValues_is_relative_1(self):
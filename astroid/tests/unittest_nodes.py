@@ -857,6 +857,57 @@ class ContextTest(unittest.TestCase):
         self.assertIs(starred.ctx, astroid.Store)
 
 
+class WeakParentsTest(unittest.TestCase):
+
+    def setUp(self):
+        weak = isinstance(vars(node_classes.NodeNG)['parent'],
+                          node_classes._WeakParent)
+        self.addCleanup(node_classes.use_weak_parents, weak)
+        node_classes.use_weak_parents()
+
+    def test_parents_not_kept_alive(self):
+        module = builder.AstroidBuilder().string_build(
+            'def func(arg):\n    return arg', 'weak_parents')
+        del astroid.MANAGER.astroid_cache['weak_parents']
+        return_node = module['func'].body[0]
+        self.assertIs(return_node.parent.parent, module)
+        self.assertIs(return_node.value.lookup('arg')[0], module['func'])
+        del module
+        self.assertIsNone(return_node.parent)
+
+    def test_disabled(self):
+        module = builder.AstroidBuilder().string_build('a = 1', 'weak_then_strong')
+        node_classes.use_weak_parents(False)
+        self.assertIsNone(vars(node_classes.NodeNG)['parent'])
+        del astroid.MANAGER.astroid_cache['weak_then_strong']
+        assign = module.body[0]
+        del module
+        self.assertIsInstance(assign.parent, nodes.Module)
+        module = builder.AstroidBuilder().string_build('a = 1', 'strong_parents')
+        del astroid.MANAGER.astroid_cache['strong_parents']
+        assign = module.body[0]
+        del module
+        self.assertIsInstance(assign.parent, nodes.Module)
+
+    def test_temporary_modules(self):
+        module = builder.parse('''
+        import collections
+        P = collections.namedtuple('P', 'x y')
+        p = P(1, 2)
+        ''', 'weak_temporary')
+        self.addCleanup(astroid.MANAGER.astroid_cache.pop, 'weak_temporary')
+        point = next(module['p'].infer())
+        self.assertEqual(point.name, 'P')
+        self.assertTrue(point.getattr('x'))
+        value = builder.extract_node('''
+        import enum
+        class Color(enum.Enum):
+            RED = 1
+        Color.RED.value #@
+        ''')
+        self.assertIsInstance(next(value.infer()), nodes.Const)
+
+
 def test_unknown():
     """Test Unknown node"""
     assert isinstance(next(nodes.Unknown().infer()),
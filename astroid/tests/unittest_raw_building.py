@@ -6,6 +6,8 @@
 
 import inspect
 import os
+import shutil
+import tempfile
 import unittest
 
 from six.moves import builtins
@@ -15,9 +17,14 @@ from astroid.raw_building import (
     attach_dummy_node, build_module,
     build_class, build_function, build_from_import
 )
+from astroid import raw_building
 from astroid import test_utils
 from astroid import nodes
 from astroid.bases import BUILTINS
+from astroid.manager import AstroidManager
+
+
+MANAGER = AstroidManager()
 
 
 class RawBuildingTC(unittest.TestCase):
@@ -86,6 +93,58 @@ class RawBuildingTC(unittest.TestCase):
             self.assertIsInstance(inferred, nodes.FunctionDef, name)
             self.assertEqual(inferred.root().name, BUILTINS, name)
 
+    def test_builtins_snapshot_round_trip(self):
+        # Build a pristine tree, the cached one may have been
+        # modified by the inference made by other tests.
+        cached = MANAGER.astroid_cache[BUILTINS]
+        try:
+            builtin = raw_building.Astroid_BUILDER.inspect_build(builtins)
+            generator = raw_building._build_builtin_types(builtin)
+        finally:
+            MANAGER.astroid_cache[BUILTINS] = cached
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'builtins.pickle')
+        try:
+            raw_building._dump_builtins_snapshot(path, builtin, generator)
+            astroid_builtin, generator_type = raw_building._load_builtins_snapshot(path)
+        finally:
+            shutil.rmtree(directory)
+        self.assertIsNot(astroid_builtin, builtin)
+        self.assertEqual(sorted(astroid_builtin.locals), sorted(builtin.locals))
+        self.assertEqual(generator_type.name, 'generator')
+        self.assertEqual(astroid_builtin.getattr('int')[0].doc,
+                         builtin.getattr('int')[0].doc)
+        self.assertIs(astroid_builtin.getattr('Ellipsis')[0].object, Ellipsis)
+
+    def test_builtins_snapshot_opt_in(self):
+        MANAGER.builtins_snapshot_dir = None
+        directory = tempfile.mkdtemp()
+        try:
+            self.assertIsNone(raw_building._snapshot_path())
+            MANAGER.builtins_snapshot_dir = directory
+            path = raw_building._snapshot_path()
+            self.assertEqual(os.path.dirname(path), directory)
+            prefix = raw_building._snapshot_prefix()
+            names = [prefix + 'stale.pickle', 'builtins-other00-stale.pickle']
+            for name in names + [os.path.basename(path)]:
+                open(os.path.join(directory, name), 'wb').close()
+            raw_building._prune_builtins_snapshots(path)
+            self.assertEqual(sorted(os.listdir(directory)),
+                             sorted([os.path.basename(path), names[1]]))
+        finally:
+            del MANAGER.builtins_snapshot_dir
+            shutil.rmtree(directory)
+
+    def test_builtins_snapshot_invalid(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'builtins.pickle')
+        try:
+            with open(path, 'wb') as stream:
+                stream.write(b'garbage')
+            self.assertIsNone(raw_building._load_builtins_snapshot(path))
+        finally:
+            shutil.rmtree(directory)
+
 
 if __name__ == '__main__':
     unittest.main()
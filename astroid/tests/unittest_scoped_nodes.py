@@ -11,10 +11,12 @@
 """tests for specific behaviour of astroid scoped nodes (i.e. module, class and
 function)
 """
+import gc
 import os
 import sys
 from functools import partial
 import unittest
+import weakref
 
 from astroid import builder
 from astroid import nodes
@@ -245,6 +247,85 @@ class ModuleNodeTest(ModuleLoader, unittest.TestCase):
             with open(path, 'rb') as file_io:
                 self.assertEqual(stream.read(), file_io.read())
 
+    def test_dispose(self):
+        module = builder.parse('''
+        import os
+
+        class A(object, metaclass=type):
+            def __init__(self):
+                self.attr = [x for x in range(3)]
+        ''', 'disposed')
+        del builder.MANAGER.astroid_cache['disposed']
+        klass = module['A']
+        self.assertIn('attr', klass.instance_attrs)
+        reference = weakref.ref(module)
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            module.dispose()
+            del module
+            self.assertIsNone(reference())
+        finally:
+            if gc_enabled:
+                gc.enable()
+        self.assertEqual(klass.__dict__, {})
+        self.assertIsNone(klass.parent)
+
+    def test_tabulate_names(self):
+        module = builder.parse('''
+        import os
+        value = 1
+        print(value)
+        value = os.sep
+
+        class A(object):
+            attr = value
+
+        def func():
+            return value, A.attr
+        ''', 'tabulated')
+        first = module.body[2].value.args[0]
+        second, attr = module['func'].body[0].value.elts
+        expected = [next(node.infer()) for node in (first, second, attr)]
+        module.tabulate_names()
+        version, tables = module._name_tables
+        self.assertEqual(set(tables), {module, module['A']})
+        stmts, values = tables[module]['value']
+        self.assertEqual(stmts, [module.body[3].targets[0]])
+        self.assertEqual([value.value for value in values], [os.sep])
+        self.assertIn('attr', tables[module['A']])
+        for node, value in zip((first, second, attr), expected):
+            self.assertEqual(next(node.infer()).value, value.value)
+
+        # The names seeing other statements are inferred on demand.
+        marker = nodes.Const('marker')
+        tables[module]['value'] = (stmts, (marker,))
+        tables[module['A']]['attr'] = (tables[module['A']]['attr'][0], (marker,))
+        self.assertEqual(next(first.infer()).value, 1)
+        self.assertIs(next(second.infer()), marker)
+        self.assertIs(next(attr.infer()), marker)
+        self.assertEqual([value.value for value in module.igetattr('value')], [1, os.sep])
+        tables[module]['os'] = (tables[module]['os'][0], (marker,))
+        self.assertIs(next(module.igetattr('os')), marker)
+
+        builder.parse('', 'evicted')
+        builder.MANAGER.evict_module('evicted')
+        self.assertEqual(next(second.infer()).value, os.sep)
+        self.assertNotEqual(module._name_tables[0], version)
+
+    def test_tabulate_names_dropped(self):
+        source = 'b = 1\na = b\n'
+        module = builder.parse(source, 'tabulated_updated')
+        self.addCleanup(builder.MANAGER.astroid_cache.pop, 'tabulated_updated')
+        module.tabulate_names()
+        self.assertEqual(next(module.igetattr('a')).value, 1)
+        builder.AstroidBuilder().update(module, source.replace('1', '2'))
+        self.assertNotIn('_name_tables', module.__dict__)
+        self.assertEqual(next(module.igetattr('a')).value, 2)
+        module.tabulate_names()
+        module.dispose()
+        self.assertEqual(module.__dict__, {})
+
 
 class FunctionNodeTest(ModuleLoader, unittest.TestCase):
 
@@ -0,0 +1,176 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/PyCQA/astroid/blob/master/COPYING.LESSER
+
+import os
+import shutil
+import tempfile
+import textwrap
+import unittest
+
+import astroid
+from astroid import builder
+from astroid import exceptions
+from astroid import node_classes
+from astroid import nodes
+from astroid import raw_building
+from astroid import serialization
+
+
+CODE = textwrap.dedent('''
+from __future__ import print_function
+import collections
+from os import path as ospath, sep
+
+Point = collections.namedtuple('Point', 'x y')
+
+
+class Meta(type):
+    pass
+
+
+class Base(object, metaclass=Meta):
+    """Base docstring"""
+    attr = [1, 2.5, b'bytes', 'str', None, ...]
+
+    def __init__(self, value=1, *args, key=None, **kwargs):
+        self.value = value
+        self.items = {key: value for key in args}
+
+    @property
+    def prop(self):
+        return self.value + 1 if self.value > 0 else -1
+
+
+def func(a, b: int = 2) -> int:
+    global GLOBAL
+    GLOBAL = lambda x: x
+    return [x for x in range(a) if x not in (b, 3)]
+
+func.attribute = 42
+''')
+
+
+class SerializationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.module = builder.parse(CODE, __name__)
+        self.loaded = astroid.Module.from_bytes(self.module.to_bytes())
+
+    def test_same_source(self):
+        self.assertIsNot(self.loaded, self.module)
+        self.assertIsInstance(self.loaded, nodes.Module)
+        self.assertEqual(self.loaded.as_string(), self.module.as_string())
+        self.assertEqual(self.loaded.name, self.module.name)
+        self.assertEqual(self.loaded.future_imports, {'print_function'})
+
+    def test_positions_and_parents(self):
+        for node, loaded in zip(self.module.nodes_of_class(node_classes.NodeNG),
+                                self.loaded.nodes_of_class(node_classes.NodeNG)):
+            self.assertIs(type(loaded), type(node))
+            self.assertEqual(loaded.lineno, node.lineno)
+            self.assertEqual(loaded.col_offset, node.col_offset)
+            self.assertIs(loaded.root(), self.loaded)
+            for child in loaded.get_children():
+                self.assertIs(child.parent, loaded)
+
+    def test_locals(self):
+        self.assertEqual(sorted(self.loaded.locals), sorted(self.module.locals))
+        klass = self.loaded['Base']
+        self.assertIs(klass.parent, self.loaded)
+        self.assertEqual(sorted(klass.locals), sorted(self.module['Base'].locals))
+        self.assertIn('prop', klass.locals)
+        self.assertEqual(sorted(klass.instance_attrs), ['items', 'value'])
+        self.assertEqual(sorted(self.loaded['func'].instance_attrs), ['attribute'])
+        self.assertEqual(klass.doc, 'Base docstring')
+        self.assertEqual(klass.metaclass().name, 'Meta')
+
+    def test_inference(self):
+        prop = self.loaded['Base'].getattr('prop')[0]
+        inferred = next(prop.body[0].value.body.infer())
+        self.assertIsInstance(inferred, astroid.Instance)
+        self.assertEqual(inferred.name, 'int')
+        point = next(self.loaded['Point'].infer())
+        self.assertEqual(point.name, 'Point')
+        self.assertEqual(sorted(point.instance_attrs), ['x', 'y'])
+
+    def test_inference_tips(self):
+        node = builder.extract_node('''
+        import collections
+        collections.namedtuple('Point', 'x y') #@
+        ''')
+        self.assertIsNotNone(node._explicit_inference)
+        loaded = astroid.Module.from_bytes(node.root().to_bytes())
+        call = next(loaded.nodes_of_class(nodes.Call))
+        self.assertIs(call._explicit_inference, node._explicit_inference)
+
+    def test_inference_tips_set_by_closures(self):
+        node = builder.extract_node('dict(a=1) #@')
+        self.assertIsNotNone(node._explicit_inference)
+        loaded = astroid.Module.from_bytes(node.root().to_bytes())
+        call = next(loaded.nodes_of_class(nodes.Call))
+        self.assertIsNotNone(call._explicit_inference)
+        self.assertIsInstance(next(call.infer()), nodes.Dict)
+
+    def test_strings_interned(self):
+        module = builder.parse('\n'.join('value_%d = 1' % index
+                                         for index in range(100)))
+        data = module.to_bytes()
+        names = builder.parse('\n'.join('value = 1' for index in range(100)))
+        self.assertLess(len(names.to_bytes()), len(data))
+
+    def test_invalid_data(self):
+        with self.assertRaises(exceptions.AstroidBuildingError):
+            astroid.Module.from_bytes(b'garbage')
+        data = self.module.to_bytes()
+        with self.assertRaises(exceptions.AstroidBuildingError):
+            serialization.loads(data[:len(data) // 2])
+        with self.assertRaises(exceptions.AstroidBuildingError):
+            serialization.loads(data.replace(serialization.MAGIC, b'XXXX', 1))
+
+    def test_living_objects(self):
+        module = raw_building.build_module('living')
+        with self.assertRaises(exceptions.AstroidError):
+            module.to_bytes()
+
+
+class ModuleStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.source = os.path.join(self.directory, 'stored.py')
+        with open(self.source, 'w') as stream:
+            stream.write(CODE)
+        self.module = builder.AstroidBuilder().file_build(self.source, 'stored')
+        self.path = os.path.join(self.directory, 'store')
+        serialization.write_module_store(
+            self.path, [self.module, raw_building.build_module('living')])
+        self.store = serialization.ModuleStore(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.directory)
+
+    def test_load(self):
+        self.assertEqual(len(self.store), 1)
+        self.assertIn('stored', self.store)
+        self.assertNotIn('living', self.store)
+        loaded = self.store.load('stored')
+        self.assertEqual(loaded.as_string(), self.module.as_string())
+        self.assertEqual(loaded.file, self.source)
+        self.assertIsNone(self.store.load('stored', filepath=self.source + 'c'))
+        self.assertIsNone(self.store.load('missing'))
+
+    def test_changed_source(self):
+        stat = os.stat(self.source)
+        os.utime(self.source, (stat.st_atime, stat.st_mtime + 10))
+        self.assertIsNone(self.store.load('stored'))
+
+    def test_invalid_store(self):
+        with open(self.path, 'wb') as stream:
+            stream.write(b'garbage' * 10)
+        with self.assertRaises(exceptions.AstroidBuildingError):
+            serialization.ModuleStore(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()